@@ -0,0 +1,4 @@
+"""
+The Mountain Path - Streamlit Design Template
+Example pages for multipage_app.py (imported lazily by multipage.run).
+"""
@@ -0,0 +1,23 @@
+"""
+The Mountain Path - Streamlit Design Template
+Example Page: Overview
+"""
+
+import streamlit as st
+
+from components import section_title, metric_card, display_dataframe
+from data import sample_frame
+
+
+def render():
+    section_title("📊 Analysis Results")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        metric_card("Metric 1", "123.45")
+    with col2:
+        metric_card("Metric 2", "67.89")
+    with col3:
+        metric_card("Metric 3", "42.0")
+
+    display_dataframe(sample_frame(rows=10, seed=42), title="📈 Sample Data")
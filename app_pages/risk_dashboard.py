@@ -0,0 +1,45 @@
+"""
+The Mountain Path - Streamlit Design Template
+Example Page: Risk Dashboard
+"""
+
+import streamlit as st
+
+from components import section_title, three_metric_row
+from prewarm import is_ready, wait_ready
+from reactive import ReactiveGraph
+from risk import metric_rows
+from risk_data import ASSETS, asset_risk_summary
+from speculative import speculative
+
+
+# Neighbouring confidence levels are computed in the background while the
+# user looks at the current one
+@speculative(sliders={'confidence': (0.90, 0.99, 0.01)})
+def asset_risk(confidence: float, method: str) -> dict:
+    return asset_risk_summary(confidence, method)
+
+
+def render():
+    # Right after a restart the default results may still be warming
+    if not is_ready():
+        with st.spinner("Warming caches..."):
+            wait_ready(timeout=30)
+
+    graph = ReactiveGraph("risk_dashboard")
+    graph.input('confidence', st.sidebar.slider("Confidence Level", 0.90, 0.99, 0.95, 0.01))
+    graph.input('method', st.sidebar.selectbox(
+        "VaR Method", ['historical', 'parametric', 'cornish_fisher']))
+
+    @graph.node(inputs=['confidence', 'method'])
+    def summary(confidence, method):
+        return asset_risk(confidence, method)
+
+    @graph.view(inputs=['summary'])
+    def asset_cards(summary):
+        for i, asset in enumerate(ASSETS):
+            section_title(f"⚠️ {asset}")
+            for row in metric_rows(summary, i):
+                three_metric_row(row)
+
+    graph.debug_panel()
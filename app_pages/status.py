@@ -0,0 +1,40 @@
+"""
+The Mountain Path - Streamlit Design Template
+Example Page: Status
+
+Shows whether startup cache warming (prewarm.py) has finished, and how
+long each task took. Use it as a manual health check after a deploy: the
+page reads "Ready" once every task has run.
+"""
+
+import time
+
+import pandas as pd
+
+from components import (section_title, three_metric_row, display_dataframe,
+                        success_box, warning_box, error_box, info_box)
+from prewarm import status
+
+
+def render():
+    info = status()
+    section_title("🩺 Cache Warm-Up")
+
+    if info['status'] == 'idle':
+        info_box("No warm-up was started in this process.")
+    elif not info['ready']:
+        warning_box(f"Warming caches: running for {time.time() - info['started']:.0f}s")
+    elif info['status'] == 'failed':
+        error_box("Warm-up finished with errors - see the task table below")
+    else:
+        success_box("Ready: every warm-up task has finished")
+
+    failed = sum(1 for task in info['tasks'] if task['error'])
+    three_metric_row([
+        ("Status", info['status'].title(), "idle, running, done or failed"),
+        ("Tasks", f"{len(info['tasks'])}", f"{failed} failed"),
+        ("Warm-Up Time", f"{info['seconds']:.2f}s", "Sum of task times"),
+    ])
+    if info['tasks']:
+        tasks = pd.DataFrame(info['tasks']).fillna({'error': 'ok'})
+        display_dataframe(tasks.round({'seconds': 3}), title="⏱️ Tasks")
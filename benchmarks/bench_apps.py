@@ -0,0 +1,230 @@
+"""
+The Mountain Path - Streamlit Design Template
+Benchmark Suite: Rerun Latency of the Template and Stress Apps
+
+Runs each app headlessly with Streamlit's AppTest harness (no server, no
+network) and reports, for cold and warm reruns:
+- p50 / p95 latency (ms)
+- peak Python allocations during a rerun (KiB, via tracemalloc)
+- number of Streamlit elements emitted
+
+Cold runs start a fresh AppTest session with this repo's modules and all
+st.cache_* stores purged; warm runs rerun an existing session.
+
+Usage:
+------
+python benchmarks/bench_apps.py                     # compare with baselines
+python benchmarks/bench_apps.py --update-baseline   # record new baselines
+python benchmarks/bench_apps.py --apps example_app --runs 20 --threshold 0.1
+
+Exits with status 1 when any app's p95 latency or peak allocations regress
+by more than --threshold (fraction) over the stored baseline.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+ROOT = HERE.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+BASELINE_FILE = HERE / 'baselines.json'
+
+APPS = {
+    'example_app': ROOT / 'example_app.py',
+    'template_minimal': ROOT / 'template_minimal.py',
+    'stress_cards': HERE / 'stress_cards.py',
+    'stress_tables': HERE / 'stress_tables.py',
+    'stress_charts': HERE / 'stress_charts.py',
+}
+
+# Metrics compared against the baseline; element counts are informational
+GATED_METRICS = ('p95_ms', 'alloc_peak_kib')
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def percentile(values: list, q: float) -> float:
+    """Linear-interpolated percentile of a list (q in 0-100)."""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    pos = (len(ordered) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+def count_elements(node) -> int:
+    """Count leaf elements below an AppTest tree node."""
+    children = getattr(node, 'children', None)
+    if children is None:
+        return 1
+    return sum(count_elements(child) for child in children.values())
+
+
+def _purge_repo_modules():
+    """Forget this repo's modules and Streamlit caches so the next run is cold."""
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, '__file__', None) or ''
+        if path.startswith(str(ROOT)) and name != '__main__':
+            del sys.modules[name]
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+
+def _run(at: AppTest, traced: bool) -> tuple:
+    """Run one rerun; return (elapsed seconds, peak KiB or None)."""
+    if traced:
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+    start = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - start
+    peak = None
+    if traced:
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak = peak_bytes / 1024
+    if at.exception:
+        raise RuntimeError(f"{at.exception[0].message}")
+    return elapsed, peak
+
+
+def _summary(latencies: list, peak_kib: float, elements: int) -> dict:
+    ms = [t * 1000 for t in latencies]
+    return {
+        'runs': len(ms),
+        'p50_ms': round(percentile(ms, 50), 2),
+        'p95_ms': round(percentile(ms, 95), 2),
+        'alloc_peak_kib': round(peak_kib, 1),
+        'elements': elements,
+    }
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def bench_app(path: Path, runs: int = 10, timeout: float = 60.0) -> dict:
+    """
+    Benchmark cold and warm reruns of one app.
+
+    Parameters:
+    -----------
+    path : Path
+        Streamlit script to run
+    runs : int, optional
+        Timed reruns per mode (default: 10)
+    timeout : float, optional
+        Per-rerun timeout in seconds (default: 60)
+
+    Returns:
+    --------
+    dict : {'cold': {...}, 'warm': {...}} summaries
+    """
+    def fresh():
+        _purge_repo_modules()
+        return AppTest.from_file(str(path), default_timeout=timeout)
+
+    # Latency is measured untraced; allocations in one extra traced run
+    cold = []
+    for _ in range(runs):
+        at = fresh()
+        cold.append(_run(at, traced=False)[0])
+    at = fresh()
+    _, cold_peak = _run(at, traced=True)
+    cold_elements = count_elements(at.main) + count_elements(at.sidebar)
+
+    warm = [_run(at, traced=False)[0] for _ in range(runs)]
+    _, warm_peak = _run(at, traced=True)
+    warm_elements = count_elements(at.main) + count_elements(at.sidebar)
+
+    return {
+        'cold': _summary(cold, cold_peak, cold_elements),
+        'warm': _summary(warm, warm_peak, warm_elements),
+    }
+
+
+def compare(results: dict, baselines: dict, threshold: float) -> list:
+    """
+    Compare results to baselines.
+
+    Returns:
+    --------
+    list of str : One message per regressed metric
+    """
+    regressions = []
+    for app, modes in results.items():
+        for mode, current in modes.items():
+            base = baselines.get(app, {}).get(mode)
+            if not base:
+                continue
+            for metric in GATED_METRICS:
+                if base.get(metric) and current[metric] > base[metric] * (1 + threshold):
+                    regressions.append(
+                        f"{app} [{mode}] {metric}: {current[metric]} "
+                        f"vs baseline {base[metric]} (+{threshold:.0%} allowed)"
+                    )
+    return regressions
+
+
+def print_table(results: dict, baselines: dict):
+    header = f"{'app':<18}{'mode':<6}{'p50 ms':>10}{'p95 ms':>10}{'base p95':>10}{'peak KiB':>11}{'elements':>10}"
+    print(header)
+    print('-' * len(header))
+    for app, modes in results.items():
+        for mode, r in modes.items():
+            base = baselines.get(app, {}).get(mode, {}).get('p95_ms', '-')
+            print(f"{app:<18}{mode:<6}{r['p50_ms']:>10}{r['p95_ms']:>10}{base:>10}"
+                  f"{r['alloc_peak_kib']:>11}{r['elements']:>10}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--apps', nargs='+', choices=sorted(APPS), default=list(APPS))
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Allowed regression as a fraction (default: 0.25)")
+    parser.add_argument('--baseline', type=Path, default=BASELINE_FILE)
+    parser.add_argument('--update-baseline', action='store_true')
+    args = parser.parse_args(argv)
+
+    results = {}
+    for app in args.apps:
+        print(f"Benchmarking {app} ...", flush=True)
+        results[app] = bench_app(APPS[app], runs=args.runs)
+
+    baselines = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    print()
+    print_table(results, baselines)
+
+    if args.update_baseline or not baselines:
+        baselines.update(results)
+        args.baseline.write_text(json.dumps(baselines, indent=2, sort_keys=True) + '\n')
+        print(f"\nBaselines written to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baselines, args.threshold)
+    if regressions:
+        print("\nREGRESSIONS:")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+    print("\nNo regressions.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
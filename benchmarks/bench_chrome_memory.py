@@ -0,0 +1,113 @@
+"""
+The Mountain Path - Streamlit Design Template
+Benchmark: Per-Session Memory of the Static Chrome
+
+Runs N real Streamlit sessions (streamlit.testing AppTest, in-process) of
+a page that shows the chrome - stylesheet, header, sidebar header and
+footer - and keeps them all alive, twice: once through chrome.py's shared
+st.cache_resource strings, once building the HTML per session with the
+uncached render.py builders (the behaviour before chrome.py). Each variant
+runs in its own process and reports the memory each session retains
+(tracemalloc).
+
+Every session's st.markdown copies the HTML into its own protobuf message,
+so both variants hold a copy per session and retain about the same memory
+(~27-29 KB/session for both at 100 sessions with Streamlit 1.66):
+chrome.py saves build time per rerun, not session memory. Use the
+absolute per-session figure when sizing a server.
+
+Usage:
+------
+python benchmarks/bench_chrome_memory.py --sessions 200
+"""
+
+import argparse
+import gc
+import subprocess
+import sys
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit.testing.v1 import AppTest
+
+_PREAMBLE = f"""
+import sys
+sys.path.insert(0, {str(ROOT)!r})
+import streamlit as st
+HEADER = ("Portfolio Optimization Platform", "Modern Portfolio Theory",
+          "Efficient Frontier | Sharpe Ratio")
+SIDEBAR = ("RISK ANALYTICS", "Advanced Financial Models")
+"""
+
+SHARED_APP = _PREAMBLE + """
+from styles import apply_styles
+from components import header_container, sidebar_header, footer
+apply_styles()
+sidebar_header(*SIDEBAR)
+header_container(*HEADER)
+footer()
+"""
+
+COPIES_APP = _PREAMBLE + """
+import render
+st.markdown(render.render_stylesheet(), unsafe_allow_html=True)
+st.sidebar.markdown(render.render_sidebar_header(*SIDEBAR), unsafe_allow_html=True)
+st.markdown(render.render_header(*HEADER), unsafe_allow_html=True)
+st.divider()
+st.markdown(render.render_footer(), unsafe_allow_html=True)
+"""
+
+VARIANTS = {'copies': COPIES_APP, 'shared': SHARED_APP}
+
+
+def _session(script: str) -> AppTest:
+    at = AppTest.from_string(script).run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return at
+
+
+def retained(script: str, sessions: int) -> int:
+    """Bytes still allocated after `sessions` sessions ran the page."""
+    for _ in range(5):  # imports, shared caches and one-off allocations
+        _session(script)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        held = [_session(script) for _ in range(sessions)]
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del held
+    gc.collect()
+    return after - before
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--sessions', type=int, default=200)
+    parser.add_argument('--variant', choices=sorted(VARIANTS), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.variant:
+        print(retained(VARIANTS[args.variant], args.sessions))
+        return 0
+
+    n = args.sessions
+    print(f"sessions: {n:,}")
+    for variant, label in (('copies', "per-session copies"), ('shared', "shared chrome.py")):
+        # A fresh process per variant, so one doesn't warm up the other
+        out = subprocess.run([sys.executable, __file__, '--sessions', str(n), '--variant', variant],
+                             capture_output=True, text=True, check=True).stdout
+        nbytes = int(out.split()[-1])
+        print(f"{label:<20}: {nbytes / n:>10,.0f} B/session  ({nbytes / 2**20:,.1f} MiB total)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
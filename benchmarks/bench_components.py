@@ -0,0 +1,122 @@
+"""
+The Mountain Path - Streamlit Design Template
+Microbenchmarks: HTML Generation and Colour Helpers
+
+Times the pure render_* functions behind each component (render.py, no
+Streamlit involved; the shared chrome uncached) and the config colour
+helpers, and measures their memory cost under tracemalloc:
+- ns/call     best-of-repeats mean wall time per call
+- peak B/call peak traced memory while one call runs (transient allocations)
+- result B    size of the returned HTML string
+
+Usage:
+------
+python benchmarks/bench_components.py
+python benchmarks/bench_components.py --number 20000 --repeat 7 --json out.json
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import render
+from config import rgba_from_hex, get_gradient_background
+
+LONG_TEXT = "Value at Risk measures the potential loss in value of a portfolio. " * 8
+
+
+CASES = [
+    ('header_container', render.render_header,
+     ("Portfolio Optimization Platform",),
+     {'subtitle': "Modern Portfolio Theory", 'description': "Efficient Frontier | Sharpe Ratio"}),
+    ('metric_card_advanced', render.render_metric_card_advanced,
+     ("VaR", "2.34%", -0.12, "vs. yesterday"), {}),
+    ('footer', render.render_footer, (), {}),
+    ('success_box', render.render_success_box, ("Model estimation completed",), {}),
+    ('warning_box', render.render_warning_box, ("Low number of observations",), {}),
+    ('error_box', render.render_error_box, ("Insufficient data",), {}),
+    ('formula_box', render.render_formula_box,
+     ("VaR_α = μ + σ × z_α", LONG_TEXT), {}),
+    ('rgba_from_hex', rgba_from_hex, ('#003366', 0.5), {}),
+    ('get_gradient_background', get_gradient_background, (), {}),
+]
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def time_call(fn, args, kwargs, number: int, repeat: int) -> float:
+    """Best-of-`repeat` mean nanoseconds per call over `number` calls."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            fn(*args, **kwargs)
+        best = min(best, (time.perf_counter_ns() - start) / number)
+    return best
+
+
+def peak_bytes_per_call(fn, args, kwargs, samples: int = 200) -> float:
+    """Mean peak traced memory of a single call, in bytes."""
+    fn(*args, **kwargs)  # warm up caches / interned strings
+    total = 0
+    tracemalloc.start()
+    try:
+        for _ in range(samples):
+            base, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            fn(*args, **kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+            total += peak - base
+    finally:
+        tracemalloc.stop()
+    return total / samples
+
+
+def run(number: int = 10_000, repeat: int = 5) -> dict:
+    """
+    Run every microbenchmark.
+
+    Returns:
+    --------
+    dict : {case name: {'ns_per_call', 'peak_bytes_per_call', 'result_bytes'}}
+    """
+    results = {}
+    for name, fn, args, kwargs in CASES:
+        result = fn(*args, **kwargs)
+        results[name] = {
+            'ns_per_call': round(time_call(fn, args, kwargs, number, repeat), 1),
+            'peak_bytes_per_call': round(peak_bytes_per_call(fn, args, kwargs), 1),
+            'result_bytes': len(result.encode('utf-8')),
+        }
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--number', type=int, default=10_000, help="Calls per repeat")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', type=Path, help="Also write results to this file")
+    args = parser.parse_args(argv)
+
+    results = run(args.number, args.repeat)
+
+    print(f"{'function':<26}{'ns/call':>12}{'peak B/call':>14}{'result B':>11}")
+    print('-' * 63)
+    for name, r in results.items():
+        print(f"{name:<26}{r['ns_per_call']:>12,.1f}{r['peak_bytes_per_call']:>14,.1f}"
+              f"{r['result_bytes']:>11,}")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2) + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
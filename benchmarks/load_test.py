@@ -0,0 +1,286 @@
+"""
+The Mountain Path - Streamlit Design Template
+Load Test: Concurrent Sessions Against a Local Streamlit Server
+
+Starts `streamlit run <app>` on a local port, then for each concurrency
+level opens N simulated browser sessions over the Streamlit websocket.
+Each session runs the script once, discovers its sidebar widgets, and then
+loops: change a slider or selectbox value, request a rerun, wait for the
+script to finish, think, repeat.
+
+Per concurrency level it reports:
+- throughput (completed reruns / second)
+- rerun latency p50 / p95 / p99 / max (ms)
+- server process CPU (% of one core, mean) and RSS (MiB, peak)
+
+Usage:
+------
+python benchmarks/load_test.py
+python benchmarks/load_test.py --app template_minimal.py --concurrency 1 10 50 100
+python benchmarks/load_test.py --widgets "Sample Slider" "Sample Dropdown" --think 0.2
+
+Requires the client library in benchmarks/requirements.txt:
+pip install -r benchmarks/requirements.txt
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+HERE = Path(__file__).resolve().parent
+ROOT = HERE.parent
+sys.path.insert(0, str(HERE))
+
+from bench_apps import percentile
+
+# Widget element types the load generator knows how to interact with
+INTERACTIVE_TYPES = ('slider', 'selectbox')
+
+
+# ============================================================================
+# SERVER PROCESS
+# ============================================================================
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(app: Path, port: int, timeout: float = 60.0) -> subprocess.Popen:
+    """Start a headless Streamlit server and wait until it is healthy."""
+    env = dict(os.environ, MPLBACKEND='Agg', MOUNTAIN_PATH_ENV='production')
+    proc = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', str(app),
+         '--server.headless', 'true',
+         '--server.port', str(port),
+         '--server.address', '127.0.0.1',
+         '--server.fileWatcherType', 'none',
+         '--browser.gatherUsageStats', 'false'],
+        cwd=ROOT, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"Streamlit exited with status {proc.returncode}")
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{port}/_stcore/health', timeout=1) as r:
+                if r.status == 200:
+                    return proc
+        except OSError:
+            time.sleep(0.25)
+    proc.kill()
+    raise TimeoutError("Streamlit server did not become healthy")
+
+
+class ProcessSampler:
+    """Samples CPU time and RSS of a process (psutil if present, else /proc)."""
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        try:
+            import psutil
+            self._proc = psutil.Process(pid)
+        except ImportError:
+            self._proc = None
+        self._clock_ticks = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+        self._page_size = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+    def cpu_seconds(self) -> float:
+        if self._proc is not None:
+            times = self._proc.cpu_times()
+            return times.user + times.system
+        with open(f'/proc/{self.pid}/stat') as f:
+            fields = f.read().rsplit(')', 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / self._clock_ticks
+
+    def rss_bytes(self) -> int:
+        if self._proc is not None:
+            return self._proc.memory_info().rss
+        with open(f'/proc/{self.pid}/statm') as f:
+            return int(f.read().split()[1]) * self._page_size
+
+
+# ============================================================================
+# SIMULATED SESSION
+# ============================================================================
+
+class SimulatedSession:
+    """One browser tab talking the Streamlit websocket protocol."""
+
+    def __init__(self, url: str, rng: random.Random, widget_labels: list = None):
+        self.url = url
+        self.rng = rng
+        self.widget_labels = widget_labels
+        self.widgets = {}   # id -> (type, proto element)
+        self.states = {}    # id -> WidgetState
+        self.ws = None
+
+    async def connect(self) -> float:
+        self.ws = await websockets.connect(self.url, subprotocols=['streamlit'],
+                                           max_size=None)
+        return await self.rerun()
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+    async def rerun(self) -> float:
+        """Request a rerun with the current widget states; return latency in seconds."""
+        msg = BackMsg()
+        msg.rerun_script.query_string = ''
+        msg.rerun_script.widget_states.widgets.extend(self.states.values())
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        while True:
+            try:
+                data = await self.ws.recv()
+            except websockets.ConnectionClosed as exc:
+                raise ConnectionError("websocket closed by server") from exc
+            fmsg = ForwardMsg()
+            fmsg.ParseFromString(data)
+            kind = fmsg.WhichOneof('type')
+            if kind == 'delta':
+                self._discover(fmsg.delta)
+            elif kind == 'script_finished':
+                if fmsg.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    return time.perf_counter() - start
+
+    def _discover(self, delta):
+        if delta.WhichOneof('type') != 'new_element':
+            return
+        element = delta.new_element
+        kind = element.WhichOneof('type')
+        if kind not in INTERACTIVE_TYPES:
+            return
+        widget = getattr(element, kind)
+        if self.widget_labels and widget.label not in self.widget_labels:
+            return
+        self.widgets[widget.id] = (kind, widget)
+
+    def interact(self) -> bool:
+        """Change one discovered widget's value. Returns False if none exist."""
+        if not self.widgets:
+            return False
+        widget_id = self.rng.choice(sorted(self.widgets))
+        kind, widget = self.widgets[widget_id]
+        state = WidgetState(id=widget_id)
+        if kind == 'slider':
+            steps = int(round((widget.max - widget.min) / (widget.step or 1)))
+            state.double_array_value.data.append(
+                widget.min + self.rng.randint(0, max(steps, 0)) * (widget.step or 1)
+            )
+        else:
+            state.int_value = self.rng.randrange(max(len(widget.options), 1))
+        self.states[widget_id] = state
+        return True
+
+
+async def _session_loop(url, rng, labels, stop_at, think, latencies, errors):
+    session = SimulatedSession(url, rng, labels)
+    try:
+        latencies.append(await session.connect())
+        while time.monotonic() < stop_at:
+            if not session.interact():
+                break
+            latencies.append(await session.rerun())
+            await asyncio.sleep(rng.uniform(0.5, 1.5) * think)
+    except Exception:
+        errors.append(1)
+    finally:
+        await session.close()
+
+
+async def _sample(sampler: ProcessSampler, stop_at: float, interval: float, rss: list):
+    while time.monotonic() < stop_at:
+        rss.append(sampler.rss_bytes())
+        await asyncio.sleep(interval)
+
+
+# ============================================================================
+# LOAD TEST
+# ============================================================================
+
+async def run_level(url: str, sampler: ProcessSampler, sessions: int, duration: float,
+                    think: float, labels: list, seed: int) -> dict:
+    """Run one concurrency level and summarise it."""
+    latencies, errors, rss = [], [], []
+    start = time.monotonic()
+    stop_at = start + duration
+    cpu_start = sampler.cpu_seconds()
+
+    tasks = [
+        _session_loop(url, random.Random(seed + i), labels, stop_at, think, latencies, errors)
+        for i in range(sessions)
+    ]
+    await asyncio.gather(_sample(sampler, stop_at, 0.5, rss), *tasks)
+
+    elapsed = time.monotonic() - start
+    cpu = sampler.cpu_seconds() - cpu_start
+    ms = [t * 1000 for t in latencies] or [0.0]
+    return {
+        'sessions': sessions,
+        'reruns': len(latencies),
+        'errors': len(errors),
+        'throughput_rps': round(len(latencies) / elapsed, 2),
+        'p50_ms': round(percentile(ms, 50), 1),
+        'p95_ms': round(percentile(ms, 95), 1),
+        'p99_ms': round(percentile(ms, 99), 1),
+        'max_ms': round(max(ms), 1),
+        'cpu_pct': round(100 * cpu / elapsed, 1),
+        'rss_peak_mib': round(max(rss or [sampler.rss_bytes()]) / 2**20, 1),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--app', type=Path, default=ROOT / 'example_app.py')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 5, 10, 25, 50])
+    parser.add_argument('--duration', type=float, default=20.0, help="Seconds per level")
+    parser.add_argument('--think', type=float, default=0.5, help="Mean think time (s)")
+    parser.add_argument('--widgets', nargs='+', help="Only interact with these widget labels")
+    parser.add_argument('--port', type=int, default=0, help="Server port (default: free port)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', type=Path, help="Also write results to this file")
+    args = parser.parse_args(argv)
+
+    port = args.port or _free_port()
+    url = f'ws://127.0.0.1:{port}/_stcore/stream'
+    proc = start_server(args.app.resolve(), port)
+    sampler = ProcessSampler(proc.pid)
+    results = []
+    try:
+        print(f"{'sessions':>9}{'reruns':>8}{'err':>5}{'rps':>8}{'p50 ms':>9}{'p95 ms':>9}"
+              f"{'p99 ms':>9}{'max ms':>9}{'cpu %':>8}{'rss MiB':>9}")
+        for level in args.concurrency:
+            r = asyncio.run(run_level(url, sampler, level, args.duration,
+                                      args.think, args.widgets, args.seed))
+            results.append(r)
+            print(f"{r['sessions']:>9}{r['reruns']:>8}{r['errors']:>5}{r['throughput_rps']:>8}"
+                  f"{r['p50_ms']:>9}{r['p95_ms']:>9}{r['p99_ms']:>9}{r['max_ms']:>9}"
+                  f"{r['cpu_pct']:>8}{r['rss_peak_mib']:>9}", flush=True)
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2) + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
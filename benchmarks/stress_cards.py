@@ -0,0 +1,50 @@
+"""
+The Mountain Path - Streamlit Design Template
+Benchmark Stress Page: Hundreds of Metric Cards
+
+Synthetic page used by bench_apps.py. Run it directly with
+`streamlit run benchmarks/stress_cards.py` to inspect it in a browser.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import streamlit as st
+
+from config import get_page_config
+from styles import apply_styles
+from components import (
+    header_container, sidebar_header, section_title,
+    metric_card_advanced, three_metric_row, footer
+)
+
+N_ROWS = 100  # 300 cards
+
+st.set_page_config(**get_page_config(title="Stress: Cards"))
+apply_styles()
+
+header_container(
+    title="Stress Test: Metric Cards",
+    subtitle=f"{N_ROWS * 3} cards per rerun",
+)
+sidebar_header("STRESS")
+
+for row in range(N_ROWS):
+    if row % 10 == 0:
+        section_title(f"📊 Block {row // 10 + 1}")
+    if row % 2:
+        three_metric_row([
+            (f"VaR {row}", f"{2 + row / 100:.2f}%", "95% confidence"),
+            (f"ES {row}", f"{3 + row / 100:.2f}%", "Expected Shortfall"),
+            (f"Vol {row}", f"{18 + row / 10:.1f}%", "Annualized"),
+        ])
+    else:
+        cols = st.columns(3)
+        for i, col in enumerate(cols):
+            with col:
+                metric_card_advanced(f"Beta {row}.{i}", f"{1 + i / 10:.2f}",
+                                     (i - 1) * 0.05, "vs. benchmark")
+
+footer()
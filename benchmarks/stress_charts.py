@@ -0,0 +1,47 @@
+"""
+The Mountain Path - Streamlit Design Template
+Benchmark Stress Page: Many Charts
+
+Synthetic page used by bench_apps.py. Run it directly with
+`streamlit run benchmarks/stress_charts.py` to inspect it in a browser.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import streamlit as st
+
+from config import COLORS, get_page_config
+from styles import apply_styles
+from components import header_container, sidebar_header, section_title, footer
+
+N_CHARTS = 24
+N_POINTS = 500
+
+st.set_page_config(**get_page_config(title="Stress: Charts"))
+apply_styles()
+
+header_container(
+    title="Stress Test: Charts",
+    subtitle=f"{N_CHARTS} matplotlib figures per rerun",
+)
+sidebar_header("STRESS")
+
+rng = np.random.default_rng(7)
+x = np.arange(N_POINTS)
+for i in range(N_CHARTS):
+    section_title(f"📈 Chart {i + 1}")
+    fig, ax = plt.subplots(figsize=(10, 3))
+    ax.plot(x, rng.standard_normal(N_POINTS).cumsum(), color=COLORS['accent_gold'], linewidth=1.5)
+    ax.plot(x, rng.standard_normal(N_POINTS).cumsum(), color=COLORS['light_blue'], linewidth=1.5)
+    ax.grid(True, alpha=0.3)
+    st.pyplot(fig)
+    plt.close(fig)
+
+footer()
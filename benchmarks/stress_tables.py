@@ -0,0 +1,43 @@
+"""
+The Mountain Path - Streamlit Design Template
+Benchmark Stress Page: Large Tables
+
+Synthetic page used by bench_apps.py. Run it directly with
+`streamlit run benchmarks/stress_tables.py` to inspect it in a browser.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from config import get_page_config
+from styles import apply_styles
+from components import header_container, sidebar_header, display_dataframe, footer
+
+N_TABLES = 10
+N_ROWS = 5_000
+N_COLS = 12
+
+st.set_page_config(**get_page_config(title="Stress: Tables"))
+apply_styles()
+
+header_container(
+    title="Stress Test: Tables",
+    subtitle=f"{N_TABLES} tables × {N_ROWS:,} rows × {N_COLS} columns",
+)
+sidebar_header("STRESS")
+
+rng = np.random.default_rng(42)
+for i in range(N_TABLES):
+    df = pd.DataFrame(
+        rng.standard_normal((N_ROWS, N_COLS)),
+        columns=[f"Asset {c + 1}" for c in range(N_COLS)],
+    )
+    display_dataframe(df, title=f"📋 Table {i + 1}", caption="Simulated daily returns")
+
+footer()
@@ -0,0 +1,210 @@
+"""
+The Mountain Path - Streamlit Design Template
+Budget Module: Per-Rerun Payload Budget Enforcement
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+Every component sends raw HTML (or a table) to the browser on each rerun.
+This module measures what is sent - bytes and Streamlit elements - per
+component call and per page, and reports anything that crosses the soft or
+hard limits configured in config.PAYLOAD_BUDGET.
+"""
+
+import logging
+
+import streamlit as st
+from config import PAYLOAD_BUDGET
+
+logger = logging.getLogger(__name__)
+
+_STATE_KEY = '_mp_payload_budget'
+
+
+# ============================================================================
+# RERUN STATE
+# ============================================================================
+
+def _new_state() -> dict:
+    return {
+        'page': {'bytes': 0, 'elements': 0},
+        'components': {},
+        'violations': [],
+        'page_flags': set(),
+        'reporting': False,
+    }
+
+
+def _state() -> dict:
+    if _STATE_KEY not in st.session_state:
+        st.session_state[_STATE_KEY] = _new_state()
+    return st.session_state[_STATE_KEY]
+
+
+def begin_rerun():
+    """
+    Start a new budget window for the current rerun.
+
+    Called by styles.apply_styles(), which every page runs first. Pages
+    that skip apply_styles() should call this at the top of the script.
+    """
+    st.session_state[_STATE_KEY] = _new_state()
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def payload_size(obj) -> int:
+    """
+    Estimate the number of bytes an object adds to the page payload.
+
+    Parameters:
+    -----------
+    obj : str, bytes, pd.DataFrame, array-like, or a tuple/list of those
+        HTML string, raw bytes, or tabular data passed to st.dataframe;
+        a tuple or list is the sum of its parts (e.g. a table and its caption)
+
+    Returns:
+    --------
+    int : Estimated size in bytes
+    """
+    if obj is None:
+        return 0
+    if isinstance(obj, str):
+        return len(obj.encode('utf-8'))
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return len(obj)
+    if isinstance(obj, (tuple, list)):
+        return sum(payload_size(part) for part in obj)
+    if hasattr(obj, 'memory_usage'):
+        return int(obj.memory_usage(deep=True).sum())
+    if hasattr(obj, 'nbytes'):
+        return int(obj.nbytes)
+    return len(str(obj).encode('utf-8'))
+
+
+def track(component: str, payload=None, elements: int = 1):
+    """
+    Charge one component call to the current rerun's budget.
+
+    Parameters:
+    -----------
+    component : str
+        Component name (e.g., 'info_box')
+    payload : str, bytes or pd.DataFrame, optional
+        What the call sent to the browser (see payload_size)
+    elements : int, optional
+        Number of Streamlit elements emitted (default: 1)
+
+    Example:
+    --------
+    track('display_dataframe', df)
+    """
+    if not PAYLOAD_BUDGET['enabled']:
+        return
+    state = _state()
+    nbytes = payload_size(payload)
+
+    usage = state['components'].setdefault(
+        component, {'calls': 0, 'bytes': 0, 'elements': 0, 'max_bytes': 0}
+    )
+    usage['calls'] += 1
+    usage['bytes'] += nbytes
+    usage['elements'] += elements
+    usage['max_bytes'] = max(usage['max_bytes'], nbytes)
+    state['page']['bytes'] += nbytes
+    state['page']['elements'] += elements
+
+    # Reports emit components of their own; don't charge them recursively
+    if state['reporting']:
+        return
+    _check_component(state, component, nbytes)
+    _check_page(state)
+
+
+def current_usage() -> dict:
+    """
+    Get the payload usage recorded so far in this rerun.
+
+    Returns:
+    --------
+    dict : {'page': {...}, 'components': {...}, 'violations': [...]}
+    """
+    state = _state()
+    return {
+        'page': dict(state['page']),
+        'components': {name: dict(u) for name, u in state['components'].items()},
+        'violations': list(state['violations']),
+    }
+
+
+# ============================================================================
+# LIMIT CHECKS
+# ============================================================================
+
+def _component_limits(component: str) -> tuple:
+    overrides = PAYLOAD_BUDGET['component_overrides'].get(component, {})
+    soft = overrides.get('soft_bytes', PAYLOAD_BUDGET['component_soft_bytes'])
+    hard = overrides.get('hard_bytes', PAYLOAD_BUDGET['component_hard_bytes'])
+    return soft, hard
+
+
+def _check_component(state: dict, component: str, nbytes: int):
+    soft, hard = _component_limits(component)
+    if nbytes > hard:
+        _violation(state, 'hard', component, 'bytes', nbytes, hard)
+    elif nbytes > soft:
+        _violation(state, 'soft', component, 'bytes', nbytes, soft)
+
+
+def _check_page(state: dict):
+    page = state['page']
+    for metric in ('bytes', 'elements'):
+        for level in ('hard', 'soft'):
+            limit = PAYLOAD_BUDGET[f'page_{level}_{metric}']
+            flag = (level, metric)
+            if page[metric] > limit:
+                # Report each page limit once per rerun, hard before soft
+                if flag not in state['page_flags']:
+                    state['page_flags'].update({flag, ('soft', metric)})
+                    _violation(state, level, 'page', metric, page[metric], limit)
+                break
+
+
+def _violation(state: dict, level: str, scope: str, metric: str,
+               value: int, limit: int):
+    violation = {
+        'level': level,
+        'scope': scope,
+        'metric': metric,
+        'value': value,
+        'limit': limit,
+    }
+    state['violations'].append(violation)
+    message = (f"Payload budget ({level}): {scope} sent {value:,} {metric} "
+               f"(limit {limit:,})")
+
+    if PAYLOAD_BUDGET['mode'] == 'production':
+        log = logger.error if level == 'hard' else logger.warning
+        log(message)
+        return
+
+    # Imported here: components charges its own calls to this module
+    from components import warning_box, error_box
+    state['reporting'] = True
+    try:
+        (error_box if level == 'hard' else warning_box)(message)
+    finally:
+        state['reporting'] = False
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    'begin_rerun',
+    'payload_size',
+    'track',
+    'current_usage',
+]
@@ -0,0 +1,309 @@
+"""
+The Mountain Path - Streamlit Design Template
+Cache Module: Process-Wide In-Memory Caches
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+A small LRU cache with st.cache_data-style semantics - entries are keyed
+by a stable hash of the arguments, expire after a TTL, and callers get a
+copy of mutable results - plus a byte budget so a cache can never grow
+past a configured amount of memory. Every cache registers itself in
+CACHES so its hit/miss/eviction counts can be inspected in one place.
+"""
+
+import functools
+import hashlib
+import inspect
+import pickle
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import tracing
+
+_MISSING = object()
+
+# name -> MemoryCache, for stats and bulk clearing
+CACHES = {}
+
+
+# ============================================================================
+# KEYS AND SIZES
+# ============================================================================
+
+def _feed(h, obj):
+    """Feed a stable representation of obj into hash h."""
+    if hasattr(obj, 'dtype') and hasattr(obj, 'tobytes'):  # np.ndarray
+        h.update(f"nd{obj.dtype.str}{obj.shape}".encode())
+        if obj.dtype.hasobject:
+            # The raw bytes of an object array (e.g. a str column) are
+            # pointers, so hash the values instead
+            _feed_objects(h, obj)
+        else:
+            h.update(obj.tobytes())
+    elif hasattr(obj, 'to_numpy') and hasattr(obj, 'columns'):  # pd.DataFrame
+        h.update(b'df')
+        _feed(h, tuple(map(str, obj.columns)))
+        _feed(h, tuple(map(str, obj.dtypes)))
+        _feed(h, obj.index.to_numpy())
+        for column in obj.columns:
+            _feed(h, obj[column].to_numpy())
+    elif isinstance(obj, (list, tuple)):
+        h.update(f"{type(obj).__name__}{len(obj)}(".encode())
+        for item in obj:
+            _feed(h, item)
+        h.update(b')')
+    elif isinstance(obj, dict):
+        h.update(f"dict{len(obj)}(".encode())
+        for key in sorted(obj, key=repr):
+            _feed(h, key)
+            _feed(h, obj[key])
+        h.update(b')')
+    elif isinstance(obj, (str, int, float, bool, type(None), bytes)):
+        h.update(f"{type(obj).__name__}:{obj!r};".encode())
+    else:
+        try:
+            h.update(pickle.dumps(obj, protocol=4))
+        except Exception:
+            h.update(repr(obj).encode())
+
+
+def _feed_objects(h, array):
+    """Hash an object array by value: pandas' vectorised hash, else per item."""
+    values = array.ravel()
+    try:
+        from pandas.util import hash_array
+        h.update(hash_array(values, categorize=False).tobytes())
+    except (ImportError, TypeError, ValueError):  # e.g. lists or dicts as items
+        for item in values:
+            _feed(h, item)
+
+
+def make_key(*parts) -> str:
+    """
+    Build a stable cache key from arbitrary arguments.
+
+    Arrays and DataFrames are hashed by content, containers recursively.
+
+    Returns:
+    --------
+    str : Hex digest
+    """
+    h = hashlib.blake2b(digest_size=16)
+    _feed(h, parts)
+    return h.hexdigest()
+
+
+def sizeof(obj) -> int:
+    """
+    Estimate the memory held by a cached value, in bytes.
+
+    Parameters:
+    -----------
+    obj : any
+        DataFrame, ndarray, bytes/str, or a container of those
+    """
+    if hasattr(obj, 'memory_usage') and hasattr(obj, 'columns'):
+        return int(obj.memory_usage(deep=True).sum())
+    if hasattr(obj, 'nbytes'):
+        return int(obj.nbytes)
+    if isinstance(obj, (list, tuple, set)):
+        return sys.getsizeof(obj) + sum(sizeof(item) for item in obj)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(sizeof(k) + sizeof(v) for k, v in obj.items())
+    return sys.getsizeof(obj)
+
+
+def _copy(value):
+    """Return a defensive copy of mutable array-like results."""
+    if hasattr(value, 'copy') and (hasattr(value, 'dtype') or hasattr(value, 'columns')):
+        return value.copy()
+    if isinstance(value, tuple):
+        return tuple(_copy(item) for item in value)
+    return value
+
+
+# ============================================================================
+# MEMORY CACHE
+# ============================================================================
+
+class MemoryCache:
+    """
+    Thread-safe LRU cache with optional TTL, byte budget and entry limit.
+
+    Parameters:
+    -----------
+    name : str
+        Registry name (see CACHES)
+    max_bytes : int, optional
+        Evict least-recently-used entries beyond this many bytes
+    ttl : float, optional
+        Seconds before an entry expires (default: never)
+    max_entries : int, optional
+        Evict least-recently-used entries beyond this count
+    register : bool, optional
+        Add the cache to CACHES (default: True; False for short-lived
+        caches such as per-session ones)
+
+    Example:
+    --------
+    results = MemoryCache('models', max_bytes=64 * 2**20, ttl=600)
+    results.set(key, fitted)
+    fitted = results.get(key)
+    """
+
+    def __init__(self, name: str, max_bytes: int = None, ttl: float = None,
+                 max_entries: int = None, register: bool = True):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.nbytes = 0
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0}
+        self._entries = OrderedDict()  # key -> (value, nbytes, expires_at)
+        self._lock = threading.RLock()
+        if register:
+            CACHES[name] = self
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        return self.get(key, _MISSING, count=False) is not _MISSING
+
+    def get(self, key, default=None, count: bool = True):
+        """Return the cached value for key, or default."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] is not None and entry[2] < time.monotonic():
+                self._drop(key)
+                self.stats['expirations'] += 1
+                entry = None
+            if entry is None:
+                if count:
+                    self.stats['misses'] += 1
+                return default
+            self._entries.move_to_end(key)
+            if count:
+                self.stats['hits'] += 1
+            return entry[0]
+
+    def set(self, key, value, nbytes: int = None, ttl: float = None) -> bool:
+        """
+        Store a value. Returns False if it is larger than the whole budget.
+        """
+        nbytes = sizeof(value) if nbytes is None else nbytes
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return False
+        ttl = self.ttl if ttl is None else ttl
+        expires = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (value, nbytes, expires)
+            self.nbytes += nbytes
+            self._evict()
+        return True
+
+    def pop(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                return default
+            return self._drop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def info(self) -> dict:
+        """Current size and counters."""
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self.nbytes, **self.stats}
+
+    def _drop(self, key):
+        value, nbytes, _ = self._entries.pop(key)
+        self.nbytes -= nbytes
+        return value
+
+    def _evict(self):
+        while self._entries and (
+            (self.max_bytes is not None and self.nbytes > self.max_bytes)
+            or (self.max_entries is not None and len(self._entries) > self.max_entries)
+        ):
+            self._drop(next(iter(self._entries)))
+            self.stats['evictions'] += 1
+
+
+# ============================================================================
+# DECORATOR
+# ============================================================================
+
+def memoize(cache: MemoryCache = None, ttl: float = None, max_bytes: int = None,
+            copy: bool = True):
+    """
+    Cache a function's results in a MemoryCache, keyed by its arguments.
+
+    Parameters:
+    -----------
+    cache : MemoryCache, optional
+        Cache to use (default: a new cache named after the function)
+    ttl : float, optional
+        Entry lifetime in seconds, for a new cache
+    max_bytes : int, optional
+        Byte budget, for a new cache
+    copy : bool, optional
+        Return copies of DataFrame/ndarray results so callers can't mutate
+        the cached value (default: True, like st.cache_data)
+
+    Example:
+    --------
+    @memoize(ttl=3600, max_bytes=128 * 2**20)
+    def load_prices(ticker: str, start: str):
+        ...
+    """
+    def decorator(fn):
+        # Compare with None: an empty cache has len() 0 and is falsy
+        store = cache if cache is not None else MemoryCache(
+            f"{fn.__module__}.{fn.__qualname__}", max_bytes=max_bytes, ttl=ttl)
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            # f(10) and f(rows=10) must share an entry
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = make_key(fn.__module__, fn.__qualname__, bound.arguments)
+            value = store.get(key, _MISSING)
+            hit = value is not _MISSING
+            if not hit:
+                value = fn(*args, **kwargs)
+                store.set(key, value)
+            if tracing.active():
+                tracing.annotate(hit=hit, bytes=sizeof(value))
+            return _copy(value) if copy else value
+
+        wrapper.cache = store
+        wrapper.clear = store.clear
+        return tracing.traced(wrapper, category='cache')
+    return decorator
+
+
+def cache_info() -> dict:
+    """Stats of every registered cache, keyed by name."""
+    return {name: c.info() for name, c in CACHES.items()}
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    'CACHES',
+    'MemoryCache',
+    'memoize',
+    'make_key',
+    'sizeof',
+    'cache_info',
+]
@@ -0,0 +1,69 @@
+"""
+The Mountain Path - Streamlit Design Template
+Chrome Module: Process-Wide Cache for Static Page Chrome
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+The stylesheet, page header, sidebar header and footer are identical for
+every user of an app. They are built once per process with
+st.cache_resource, so reruns reuse the same string instead of rebuilding
+it. Each session's st.markdown still sends (and holds) its own copy, so
+this saves build time, not per-session memory - see
+benchmarks/bench_chrome_memory.py. The markup itself comes from render.py.
+"""
+
+import streamlit as st
+from render import render_stylesheet, render_header, render_sidebar_header, render_footer
+
+
+# ============================================================================
+# SHARED CHROME (CACHED ACROSS SESSIONS)
+# ============================================================================
+
+@st.cache_resource(show_spinner=False)
+def stylesheet() -> str:
+    """
+    Get the compiled Mountain Path stylesheet (shared by all sessions).
+
+    Returns:
+    --------
+    str : <style> block injected by styles.apply_styles()
+    """
+    return render_stylesheet()
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def header_html(title: str, subtitle: str = None, description: str = None) -> str:
+    """Get page header HTML (shared by all sessions). See components.header_container."""
+    return render_header(title, subtitle, description)
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def sidebar_header_html(title: str = "ANALYTICS", subtitle: str = None) -> str:
+    """Get sidebar header HTML (shared by all sessions). See components.sidebar_header."""
+    return render_sidebar_header(title, subtitle)
+
+
+@st.cache_resource(show_spinner=False)
+def footer_html(include_social: bool = True) -> str:
+    """Get footer HTML (shared by all sessions). See components.footer."""
+    return render_footer(include_social)
+
+
+def clear():
+    """Drop all cached chrome, e.g. after changing COLORS or BRANDING at runtime."""
+    for cached in (stylesheet, header_html, sidebar_header_html, footer_html):
+        cached.clear()
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    'stylesheet',
+    'header_html',
+    'sidebar_header_html',
+    'footer_html',
+    'clear',
+]
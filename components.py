@@ -4,16 +4,119 @@ Components Module: Reusable UI Components
 
 Prof. V. Ravichandran
 28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+Each component sends HTML built by the matching render_* function in
+render.py; use those directly when no Streamlit script is running.
 """
 
+import inspect
+import io
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import NamedTuple
+
 import streamlit as st
-from config import COLORS, BRANDING, FONTS
+from budget import track
+from cache import make_key
+from render import (
+    render_section_title, render_sidebar_section,
+    render_metric_card, render_metric_card_advanced, render_metric_row,
+    render_info_box, render_formula_box,
+    render_success_box, render_warning_box, render_error_box,
+)
+import chrome
+import metrics as _metrics  # three_metric_row's `metrics` argument shadows the name
+import tracing
+from tracing import traced
+
+logger = logging.getLogger(__name__)
+
+# st.pyplot's savefig settings, so a figure sent as PNG looks the same
+_FIGURE_PNG = {'format': 'png', 'dpi': 200, 'bbox_inches': 'tight'}
+# Full-width images: width='stretch' where 'content' is the default (newer
+# Streamlit), use_column_width=True before that
+_IMAGE_STRETCH = ({'width': 'stretch'}
+                  if inspect.signature(st.image).parameters['width'].default == 'content'
+                  else {'use_column_width': True})
+
+
+# ============================================================================
+# OUTPUT CAPTURE
+# ============================================================================
+# Component output can be captured instead of (or as well as) being sent to
+# Streamlit, e.g. to export a page as static HTML. Each script thread has
+# its own stack of captures.
+
+_local = threading.local()
+
+
+def _captures() -> list:
+    if not hasattr(_local, 'stack'):
+        _local.stack = []
+    return _local.stack
+
+
+@contextmanager
+def capture(passthrough: bool = False):
+    """
+    Record component output as (kind, payload, sidebar) items.
+
+    Kinds: 'html', 'row' (list of card HTML), 'divider', 'caption',
+    'dataframe' (the data object) and 'figure' (PNG bytes).
+
+    Parameters:
+    -----------
+    passthrough : bool, optional
+        Also pass output on to the enclosing capture or to Streamlit
+        (default: False - output is only recorded)
+
+    Example:
+    --------
+    with capture() as items:
+        header_container("Daily Risk Report")
+        three_metric_row(rows[0])
+    """
+    record = []
+    stack = _captures()
+    stack.append((record, passthrough))
+    try:
+        yield record
+    finally:
+        stack.pop()
+
+
+def _record(kind: str, payload, sidebar: bool = False) -> bool:
+    """Offer output to active captures; True if it should reach Streamlit."""
+    for record, passthrough in reversed(_captures()):
+        record.append((kind, payload, sidebar))
+        if not passthrough:
+            return False
+    return True
+
+
+def _emit(component: str, html: str, sidebar: bool = False, container=None,
+          elements: int = 1):
+    """Send component HTML to the page and charge it to the payload budget."""
+    if not _record('html', html, sidebar):
+        return
+    target = container or (st.sidebar if sidebar else st)
+    target.markdown(html, unsafe_allow_html=True)
+    track(component, html, elements=elements)
+    tracing.annotate(bytes=len(html))
+
+
+def _instrumented(fn):
+    """Time a component for metrics.py and trace it for tracing.py (if enabled)."""
+    return _metrics.instrumented(traced(fn, category='component'))
 
 
 # ============================================================================
 # HEADER COMPONENTS
 # ============================================================================
 
+@_instrumented
 def header_container(title: str, subtitle: str = None, description: str = None):
     """
     Display main page header with Mountain Path branding.
@@ -35,31 +138,10 @@ def header_container(title: str, subtitle: str = None, description: str = None):
         description="Efficient Frontier | Sharpe Ratio | Risk-Return Trade-offs"
     )
     """
-    subtitle_html = f"""
-        <p style="font-size:1rem; color:{COLORS['accent_gold']}; font-weight:600; margin:0.5rem 0;">
-            {subtitle}
-        </p>
-    """ if subtitle else ""
-    
-    description_html = f"""
-        <p style="font-size:0.85rem; color:{COLORS['text_primary']}; margin:0.3rem 0;">
-            {description}
-        </p>
-    """ if description else ""
-    
-    st.markdown(f"""
-    <div class="header-container">
-        <h1>{BRANDING['icon']} {title}</h1>
-        {subtitle_html}
-        {description_html}
-        <p>{BRANDING['name']}</p>
-        <p style="font-size:0.8rem; color:{COLORS['text_secondary']};">
-            {BRANDING['instructor']} | {BRANDING['credentials']}
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    _emit('header_container', chrome.header_html(title, subtitle, description))
 
 
+@_instrumented
 def sidebar_header(title: str = "ANALYTICS", subtitle: str = None):
     """
     Display sidebar branding header.
@@ -75,21 +157,10 @@ def sidebar_header(title: str = "ANALYTICS", subtitle: str = None):
     --------
     sidebar_header("RISK ANALYTICS", "Advanced Financial Models")
     """
-    subtitle_html = f"""
-        <p style="color:{COLORS['text_secondary']}; font-size:0.75rem; margin:5px 0 0;">
-            {subtitle}
-        </p>
-    """ if subtitle else ""
-    
-    st.sidebar.markdown(f"""
-    <div style="text-align:center; padding:1.2rem; background:rgba(255,215,0,0.08);
-         border-radius:10px; margin-bottom:1.5rem; border:2px solid {COLORS['accent_gold']};">
-        <h3 style="color:{COLORS['accent_gold']}; margin:0;">{BRANDING['icon']} {title}</h3>
-        {subtitle_html}
-    </div>
-    """, unsafe_allow_html=True)
+    _emit('sidebar_header', chrome.sidebar_header_html(title, subtitle), sidebar=True)
 
 
+@_instrumented
 def section_title(title: str):
     """
     Display section title with gold underline.
@@ -103,9 +174,10 @@ def section_title(title: str):
     --------
     section_title("📊 Data Analysis")
     """
-    st.markdown(f'<div class="section-title">{title}</div>', unsafe_allow_html=True)
+    _emit('section_title', render_section_title(title))
 
 
+@_instrumented
 def sidebar_section(title: str):
     """
     Display sidebar section header.
@@ -119,16 +191,14 @@ def sidebar_section(title: str):
     --------
     sidebar_section("📊 Stock Selection")
     """
-    st.sidebar.markdown(
-        f"<p style='color:{COLORS['accent_gold']}; font-weight:700;'>{title}</p>",
-        unsafe_allow_html=True
-    )
+    _emit('sidebar_section', render_sidebar_section(title), sidebar=True)
 
 
 # ============================================================================
 # METRIC COMPONENTS
 # ============================================================================
 
+@_instrumented
 def metric_card(label: str, value: str, help_text: str = None):
     """
     Display a metric card with label and value.
@@ -146,16 +216,10 @@ def metric_card(label: str, value: str, help_text: str = None):
     --------
     metric_card("Portfolio VaR", "2.34%", "95% confidence level")
     """
-    help_html = f' title="{help_text}"' if help_text else ''
-    
-    st.markdown(f"""
-    <div class="metric-card"{help_html}>
-        <div class="label">{label}</div>
-        <div class="value">{value}</div>
-    </div>
-    """, unsafe_allow_html=True)
+    _emit('metric_card', render_metric_card(label, value, help_text))
 
 
+@_instrumented
 def metric_card_advanced(label: str, value: str, change: float = None, 
                         change_label: str = None):
     """
@@ -176,32 +240,15 @@ def metric_card_advanced(label: str, value: str, change: float = None,
     --------
     metric_card_advanced("VaR", "2.34%", -0.12, "vs. yesterday")
     """
-    change_html = ""
-    if change is not None:
-        color = COLORS['success'] if change < 0 else COLORS['danger']
-        arrow = "↓" if change < 0 else "↑"
-        change_text = f"{arrow} {abs(change):.2f}%"
-        change_label_text = f" {change_label}" if change_label else ""
-        
-        change_html = f"""
-        <div style="color:{color}; font-size:0.9rem; margin-top:0.3rem;">
-            {change_text}{change_label_text}
-        </div>
-        """
-    
-    st.markdown(f"""
-    <div class="metric-card">
-        <div class="label">{label}</div>
-        <div class="value">{value}</div>
-        {change_html}
-    </div>
-    """, unsafe_allow_html=True)
+    _emit('metric_card_advanced',
+          render_metric_card_advanced(label, value, change, change_label))
 
 
 # ============================================================================
 # INFO COMPONENTS
 # ============================================================================
 
+@_instrumented
 def info_box(content: str, title: str = None):
     """
     Display information box with optional title.
@@ -223,16 +270,10 @@ def info_box(content: str, title: str = None):
         </ul>
     ''', title="Important Information")
     """
-    title_html = f"<h4 style='color:{COLORS['accent_gold']}; margin-top:0;'>{title}</h4>" if title else ""
-    
-    st.markdown(f"""
-    <div class="info-box">
-        {title_html}
-        {content}
-    </div>
-    """, unsafe_allow_html=True)
+    _emit('info_box', render_info_box(content, title))
 
 
+@_instrumented
 def formula_box(formula: str, description: str = None):
     """
     Display mathematical formula in a styled box.
@@ -251,47 +292,32 @@ def formula_box(formula: str, description: str = None):
         "where μ = mean, σ = std dev, z_α = z-score"
     )
     """
-    desc_html = f"<p style='margin-top:0.5rem; font-size:0.85rem;'>{description}</p>" if description else ""
-    
-    st.markdown(f"""
-    <div class="formula-box">
-        <pre style="margin:0;">{formula}</pre>
-        {desc_html}
-    </div>
-    """, unsafe_allow_html=True)
+    _emit('formula_box', render_formula_box(formula, description))
 
 
+@_instrumented
 def success_box(message: str):
     """Display success message in styled box."""
-    st.markdown(f"""
-    <div class="info-box" style="border-color:{COLORS['success']};">
-        <span style="color:{COLORS['success']};">✓</span> {message}
-    </div>
-    """, unsafe_allow_html=True)
+    _emit('success_box', render_success_box(message))
 
 
+@_instrumented
 def warning_box(message: str):
     """Display warning message in styled box."""
-    st.markdown(f"""
-    <div class="info-box" style="border-color:{COLORS['warning']};">
-        <span style="color:{COLORS['warning']};">⚠</span> {message}
-    </div>
-    """, unsafe_allow_html=True)
+    _emit('warning_box', render_warning_box(message))
 
 
+@_instrumented
 def error_box(message: str):
     """Display error message in styled box."""
-    st.markdown(f"""
-    <div class="info-box" style="border-color:{COLORS['danger']};">
-        <span style="color:{COLORS['danger']};">✕</span> {message}
-    </div>
-    """, unsafe_allow_html=True)
+    _emit('error_box', render_error_box(message))
 
 
 # ============================================================================
 # FOOTER COMPONENT
 # ============================================================================
 
+@_instrumented
 def footer(include_social: bool = True):
     """
     Display standard Mountain Path footer.
@@ -306,50 +332,28 @@ def footer(include_social: bool = True):
     footer()  # Standard footer with links
     footer(include_social=False)  # Minimal footer
     """
-    social_html = ""
-    if include_social:
-        social_html = f"""
-        <div style="margin-top:1rem; padding-top:1rem; border-top:1px solid rgba(255,215,0,0.3);">
-            <p style="color:{COLORS['text_primary']}; font-size:0.9rem; margin:0.5rem 0;">
-                <a href="{BRANDING['linkedin']}" target="_blank" 
-                   style="color:{COLORS['accent_gold']}; text-decoration:none; margin:0 1rem;">
-                    🔗 LinkedIn Profile
-                </a>
-                <a href="{BRANDING['github']}" target="_blank" 
-                   style="color:{COLORS['accent_gold']}; text-decoration:none; margin:0 1rem;">
-                    💻 GitHub
-                </a>
-            </p>
-        </div>
-        """
-    
-    st.divider()
-    st.markdown(f"""
-    <div style="text-align:center; padding:1.5rem;">
-        <p style="color:{COLORS['accent_gold']}; font-family:{FONTS['display']}; 
-                  font-weight:700; font-size:1.1rem; margin-bottom:0.5rem;">
-            {BRANDING['icon']} {BRANDING['name']}
-        </p>
-        <p style="color:{COLORS['text_secondary']}; font-size:0.85rem; margin:0.3rem 0;">
-            {BRANDING['instructor']} | {BRANDING['credentials']}
-        </p>
-        {social_html}
-    </div>
-    """, unsafe_allow_html=True)
+    # Divider and footer HTML are charged as one call
+    elements = 1
+    if _record('divider', None):
+        st.divider()
+        elements = 2
+    _emit('footer', chrome.footer_html(include_social), elements=elements)
 
 
 # ============================================================================
 # UTILITY COMPONENTS
 # ============================================================================
 
+@_instrumented
 def display_dataframe(df, title: str = None, caption: str = None):
     """
     Display DataFrame with optional title and caption.
     
     Parameters:
     -----------
-    df : pd.DataFrame
-        DataFrame to display
+    df : pd.DataFrame or pyarrow.Table
+        Data to display (Arrow tables from loader.load_table are passed
+        through without conversion)
     title : str, optional
         Title above the table
     caption : str, optional
@@ -357,9 +361,51 @@ def display_dataframe(df, title: str = None, caption: str = None):
     """
     if title:
         section_title(title)
-    if caption:
+    if caption and _record('caption', caption):
+        st.caption(caption)
+    if _record('dataframe', df):
+        st.dataframe(df, use_container_width=True)
+        track('display_dataframe', (df, caption), elements=2 if caption else 1)
+        tracing.annotate(rows=len(df))
+
+
+@_instrumented
+def display_figure(fig, title: str = None, caption: str = None):
+    """
+    Display a matplotlib figure and close it.
+    
+    Parameters:
+    -----------
+    fig : matplotlib.figure.Figure
+        Figure to display (closed afterwards)
+    title : str, optional
+        Title above the chart
+    caption : str, optional
+        Caption below the chart
+    
+    Example:
+    --------
+    fig, ax = plt.subplots()
+    ax.plot(x, y, color=COLORS['accent_gold'], linewidth=2)
+    display_figure(fig, title="📈 Cumulative Returns")
+    """
+    import matplotlib.pyplot as plt
+
+    if title:
+        section_title(title)
+    # Encode once, as st.pyplot would: the PNG is what the budget charges,
+    # what capture() stores for HTML export, and what the browser gets
+    buffer = io.BytesIO()
+    fig.savefig(buffer, **_FIGURE_PNG)
+    plt.close(fig)
+    png = buffer.getvalue()
+    send = _record('figure', png)
+    if send:
+        st.image(png, output_format='PNG', **_IMAGE_STRETCH)
+    if caption and _record('caption', caption):
         st.caption(caption)
-    st.dataframe(df, use_container_width=True)
+    if send:
+        track('display_figure', (png, caption), elements=2 if caption else 1)
 
 
 def two_column_layout(left_content, right_content, ratio=[1, 1]):
@@ -392,6 +438,7 @@ def two_column_layout(left_content, right_content, ratio=[1, 1]):
         right_content()
 
 
+@_instrumented
 def three_metric_row(metrics: list):
     """
     Display three metrics in a row.
@@ -409,14 +456,335 @@ def three_metric_row(metrics: list):
         ("Vol", "18.5%", "Annualized")
     ])
     """
+    _send_row('three_metric_row', render_metric_row(metrics))
+
+
+def _send_row(component: str, html: list):
+    if not _record('row', html):
+        return
     cols = st.columns(3)
-    for i, metric_data in enumerate(metrics[:3]):
+    for i, card_html in enumerate(html):
         with cols[i]:
-            if len(metric_data) == 2:
-                metric_card(metric_data[0], metric_data[1])
-            else:
-                metric_card(metric_data[0], metric_data[1], metric_data[2])
+            st.markdown(card_html, unsafe_allow_html=True)
+    track(component, html, elements=len(html))
+
+
+# ============================================================================
+# PARAMETER PANEL
+# ============================================================================
 
+class ParameterUpdate(NamedTuple):
+    """Values returned by sidebar_parameter_panel() for this rerun."""
+    values: dict            # applied parameter values
+    changed: frozenset      # names whose applied value changed this rerun
+    pending: bool           # edits waiting for submit / the debounce delay
+
+
+def _parameter_widget(target, name: str, spec: dict, key: str):
+    kind = spec.get('type', 'slider')
+    label = spec.get('label', name)
+    help_text = spec.get('help')
+    if kind == 'slider':
+        return target.slider(label, spec['min'], spec['max'], spec.get('default', spec['min']),
+                             spec.get('step'), key=key, help=help_text)
+    if kind == 'number':
+        return target.number_input(label, spec.get('min'), spec.get('max'),
+                                   spec.get('default', spec.get('min', 0)),
+                                   spec.get('step'), key=key, help=help_text)
+    if kind == 'select':
+        options = spec['options']
+        index = options.index(spec['default']) if 'default' in spec else 0
+        return target.selectbox(label, options, index=index, key=key, help=help_text)
+    if kind == 'multiselect':
+        return target.multiselect(label, spec['options'], spec.get('default', []),
+                                  key=key, help=help_text)
+    if kind == 'checkbox':
+        return target.checkbox(label, spec.get('default', False), key=key, help=help_text)
+    if kind == 'text':
+        return target.text_input(label, spec.get('default', ""), key=key, help=help_text)
+    raise ValueError(f"Unknown parameter type {kind!r} for {name!r}")
+
+
+def _schedule_rerun(delay: float):
+    """Rerun the app once `delay` seconds from now (needs st.fragment)."""
+    fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+    if fragment is None:
+        return  # applied on the next rerun after the delay, or via the button
+    due = time.monotonic() + delay
+
+    @fragment(run_every=delay)
+    def debounce_timer():
+        if time.monotonic() >= due:
+            st.rerun()
+
+    with st.sidebar:
+        debounce_timer()
+
+
+@_instrumented
+def sidebar_parameter_panel(schema: dict, key: str = "parameters",
+                            title: str = None, subtitle: str = None,
+                            section: str = "⚙️ Parameters", debounce: float = None,
+                            submit_label: str = "Apply") -> ParameterUpdate:
+    """
+    Sidebar controls declared from a schema, applied in batches.
+    
+    By default the widgets sit in a form: dragging a slider does not rerun
+    the script, and all edits are applied together on submit. With
+    `debounce` the widgets are live instead, but new values are only
+    applied once no parameter has been edited for `debounce` seconds;
+    until then the previous values are returned, so cached downstream
+    models are not recomputed for every intermediate position.
+    
+    Parameters:
+    -----------
+    schema : dict
+        Parameter name -> spec dict with 'type' ('slider', 'number', 'select',
+        'multiselect', 'checkbox', 'text'), 'label', 'default' and, by type,
+        'min', 'max', 'step', 'options'; optional 'help' and 'section'
+    key : str, optional
+        Unique panel key (default: "parameters")
+    title, subtitle : str, optional
+        Render sidebar_header(title, subtitle) above the panel
+    section : str, optional
+        Section for parameters without their own 'section'
+    debounce : float, optional
+        Seconds of inactivity before live edits are applied (default: None,
+        use a submit button)
+    submit_label : str, optional
+        Submit button label (default: "Apply")
+    
+    Returns:
+    --------
+    ParameterUpdate : values, changed, pending
+    
+    Example:
+    --------
+    params = sidebar_parameter_panel({
+        'confidence': {'type': 'slider', 'label': "Confidence", 'min': 0.90,
+                       'max': 0.99, 'default': 0.95, 'step': 0.01},
+        'method': {'type': 'select', 'label': "Method",
+                   'options': ["historical", "parametric"]},
+    }, key="var_inputs")
+    if 'confidence' in params.changed:
+        ...
+    """
+    if title:
+        sidebar_header(title, subtitle)
+    state_key = f"_mp_panel_{key}"
+    state = st.session_state.setdefault(state_key, {'applied': None, 'draft': None,
+                                                    'edited_at': 0.0})
+    groups = {}
+    for name, spec in schema.items():
+        groups.setdefault(spec.get('section', section), []).append(name)
+
+    container = st.sidebar.form(f"{state_key}_form") if debounce is None else st.sidebar
+    current = {}
+    with container:
+        for group, names in groups.items():
+            if group:
+                _emit('sidebar_section', render_sidebar_section(group), sidebar=True,
+                      container=container)
+            for name in names:
+                current[name] = _parameter_widget(container, name, schema[name],
+                                                  f"{state_key}_{name}")
+        if debounce is None:
+            container.form_submit_button(submit_label, use_container_width=True)
+        else:
+            apply_now = container.button(submit_label, key=f"{state_key}_apply",
+                                         use_container_width=True)
+
+    previous = state['applied']
+    pending = False
+    if debounce is None or previous is None:
+        state['applied'] = dict(current)
+    else:
+        now = time.monotonic()
+        if current != state['draft']:
+            state['draft'] = dict(current)
+            state['edited_at'] = now
+        waited = now - state['edited_at']
+        if current != previous and (apply_now or waited >= debounce):
+            state['applied'] = dict(current)
+        elif current != previous:
+            pending = True
+            _schedule_rerun(max(debounce - waited, 0.1))
+
+    applied = state['applied']
+    changed = frozenset(name for name in applied
+                        if previous is None or previous.get(name) != applied[name])
+    return ParameterUpdate(dict(applied), changed, pending)
+
+# ============================================================================
+# LAZY COMPONENTS
+# ============================================================================
+# Only the visible part of a lazy component runs. With cache=True the
+# component output of a part is kept in session state and replayed when the
+# part is shown again with the same deps. Raw st.* output can't be captured:
+# a part that emits any is detected, logged and re-run every time instead.
+
+_LAZY_STATE = '_mp_lazy'
+_uncacheable = set()        # slots already reported as emitting raw st.* output
+
+
+def replay(items: list):
+    """
+    Send captured items (see capture) to the page again.
+
+    Parameters:
+    -----------
+    items : list
+        (kind, payload, sidebar) items recorded by capture()
+    """
+    for kind, payload, sidebar in items:
+        if kind == 'html':
+            _emit('replay', payload, sidebar)
+        elif kind == 'row':
+            _send_row('replay', payload)
+        elif _record(kind, payload, sidebar):
+            if kind == 'divider':
+                st.divider()
+            elif kind == 'caption':
+                st.caption(payload)
+            elif kind == 'dataframe':
+                st.dataframe(payload, use_container_width=True)
+            elif kind == 'figure':
+                st.image(payload, output_format='PNG', **_IMAGE_STRETCH)
+            track('replay', payload)
+
+
+def _raw_output(box, items: list) -> int:
+    """
+    Elements drawn in box with st.* directly, which replay() can't restore.
+
+    Every captured main-area item is one element in the box; anything more
+    was not sent through a component. 0 if the count is not available.
+    """
+    emitted = getattr(getattr(box, '_cursor', None), 'index', None)
+    if emitted is None:
+        return 0
+    return emitted - sum(1 for _, _, sidebar in items if not sidebar)
+
+
+def _render_lazy(slot: str, render_fn, cache: bool, deps):
+    """Run render_fn, or replay its cached output if deps are unchanged."""
+    if not cache:
+        render_fn()
+        return
+    stored = st.session_state.setdefault(_LAZY_STATE, {})
+    deps_key = make_key(deps)
+    cached = stored.get(slot)
+    box = st.container()
+    if cached is not None and cached[0] == deps_key:
+        with box:
+            replay(cached[1])
+        return
+    with box, capture(passthrough=True) as items:
+        render_fn()
+
+    # Raw st.* output would be lost on replay
+    raw = _raw_output(box, items)
+    if raw:
+        if slot not in _uncacheable:
+            _uncacheable.add(slot)
+            logger.warning("Lazy part %r drew %d element(s) with st.* directly; "
+                           "it is re-run on every rerun instead of cached. Build "
+                           "cached parts from components only.", slot, raw)
+        stored.pop(slot, None)
+        return
+    stored[slot] = (deps_key, items)
+
+
+@_instrumented
+def lazy_tabs(tabs: dict, key: str, cache: bool = False, deps=None) -> str:
+    """
+    Tabs that execute only the selected tab's body.
+    
+    Native st.tabs runs every tab on every rerun and hides the inactive
+    ones in the browser; here the active tab is kept in session state and
+    only its render function is called.
+    
+    Parameters:
+    -----------
+    tabs : dict
+        Tab label -> render function (no arguments)
+    key : str
+        Unique key for this set of tabs
+    cache : bool, optional
+        Replay a tab's component output instead of re-running it while
+        deps are unchanged (default: False). Only output sent through
+        this module's components is replayed: a tab that also draws with
+        st.* directly (st.write, st.line_chart, widgets, ...) is detected,
+        logged and re-run on every rerun instead
+    deps : any, optional
+        Values the tab bodies depend on, e.g. sidebar inputs (hashed)
+    
+    Returns:
+    --------
+    str : Label of the active tab
+    
+    Example:
+    --------
+    lazy_tabs({
+        "📊 Components": render_components,
+        "📈 Metrics & Cards": render_metrics,
+    }, key="demo_tabs", cache=True, deps=(show_charts,))
+    """
+    labels = list(tabs)
+    active = st.radio(
+        "Tabs",
+        labels,
+        key=f"_mp_tabs_{key}",
+        horizontal=True,
+        label_visibility='collapsed',
+    )
+    _render_lazy(f"tabs:{key}:{active}", tabs[active], cache, deps)
+    return active
+
+
+
+@_instrumented
+def lazy_expander(title: str, render_fn, key: str = None, expanded: bool = False,
+                  cache: bool = False, deps=None) -> bool:
+    """
+    Collapsible section whose body runs only while it is open.
+    
+    st.expander always executes its body, even when collapsed. Here the
+    open state is a toggle kept in session state, and render_fn is called
+    only when it is on.
+    
+    Parameters:
+    -----------
+    title : str
+        Toggle label
+    render_fn : callable
+        Function (no arguments) that renders the body
+    key : str, optional
+        Unique key (default: the title)
+    expanded : bool, optional
+        Initial state for a new session (default: False)
+    cache : bool, optional
+        Replay the body's component output instead of re-running it while
+        deps are unchanged (default: False); as for lazy_tabs, a body that
+        draws with st.* directly is re-run instead
+    deps : any, optional
+        Values the body depends on (hashed)
+    
+    Returns:
+    --------
+    bool : True if the section is open
+    
+    Example:
+    --------
+    lazy_expander("📈 Show Sample Data",
+                  lambda: display_dataframe(sample_frame(rows=10)), cache=True)
+    """
+    key = key or title
+    is_open = st.toggle(title, value=expanded, key=f"_mp_expander_{key}")
+    if is_open:
+        with st.container():
+            _render_lazy(f"expander:{key}", render_fn, cache, deps)
+    return is_open
 
 # ============================================================================
 # EXPORT ALL
@@ -444,6 +812,19 @@ __all__ = [
     
     # Utilities
     'display_dataframe',
+    'display_figure',
     'two_column_layout',
     'three_metric_row',
+    
+    # Parameters
+    'sidebar_parameter_panel',
+    'ParameterUpdate',
+    
+    # Lazy
+    'lazy_tabs',
+    'lazy_expander',
+    
+    # Capture
+    'capture',
+    'replay',
 ]
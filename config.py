@@ -6,6 +6,8 @@ Prof. V. Ravichandran
 28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
 """
 
+import os
+
 # ============================================================================
 # COLOR SCHEME
 # ============================================================================
@@ -79,6 +81,87 @@ SPACING = {
     'border_radius_small': '8px',
 }
 
+# ============================================================================
+# PAYLOAD BUDGET
+# ============================================================================
+# Limits on what a single rerun may send to the browser. Component limits
+# apply to each call; page limits apply to the running total of a rerun.
+# In 'development' mode violations are shown on the page, in 'production'
+# mode they are logged. Set MOUNTAIN_PATH_ENV=production on deployed apps.
+PAYLOAD_BUDGET = {
+    'enabled': True,
+    'mode': os.environ.get('MOUNTAIN_PATH_ENV', 'development'),
+    'component_soft_bytes': 20_000,
+    'component_hard_bytes': 100_000,
+    'page_soft_bytes': 250_000,
+    'page_hard_bytes': 1_000_000,
+    'page_soft_elements': 300,
+    'page_hard_elements': 1_000,
+    # Per-component overrides, e.g. {'display_dataframe': {'soft_bytes': 500_000}}.
+    # Figures are charged their PNG (40-150 KB for a typical chart at 200 dpi);
+    # replay() re-sends captured figures
+    'component_overrides': {
+        'display_figure': {'soft_bytes': 200_000, 'hard_bytes': 600_000},
+        'replay': {'soft_bytes': 200_000, 'hard_bytes': 600_000},
+    },
+}
+
+# ============================================================================
+# CACHING
+# ============================================================================
+# Process-wide in-memory caches (see cache.py / data.py) and the on-disk
+# tier behind them. Sizes in bytes, TTLs in seconds (None = never expire).
+CACHE = {
+    'data_ttl': 3600,
+    'data_max_bytes': 256 * 2**20,
+    'table_max_bytes': 512 * 2**20,
+    # Persistent tier (persistent_cache.py), shared by all server processes
+    'disk_path': os.environ.get('MOUNTAIN_PATH_CACHE', '.cache/mountain_path.sqlite'),
+    'disk_max_bytes': 2 * 2**30,
+    'disk_ttl': None,
+    # Speculative precomputation of neighbouring slider values (speculative.py)
+    'session_max_bytes': 64 * 2**20,
+    'speculative_workers': 2,
+    'speculative_delay': 0.5,   # idle seconds after a call before speculating
+    # Host-wide shared memory tier (shm_cache.py); None = /dev/shm or temp dir
+    'shm_dir': os.environ.get('MOUNTAIN_PATH_SHM'),
+    'shm_max_bytes': 2**30,
+}
+
+# ============================================================================
+# METRICS
+# ============================================================================
+# Prometheus-format metrics (see metrics.py). Off unless MOUNTAIN_PATH_METRICS
+# is set; when off, no instrumentation is installed at all.
+METRICS = {
+    'enabled': os.environ.get('MOUNTAIN_PATH_METRICS', '') not in ('', '0'),
+    # Serve /metrics on this local port (0 = no HTTP endpoint)
+    'port': int(os.environ.get('MOUNTAIN_PATH_METRICS_PORT', 9464)),
+    'address': '127.0.0.1',
+    # Also write the text format to this file, e.g. for a textfile collector
+    'file': os.environ.get('MOUNTAIN_PATH_METRICS_FILE'),
+    'file_interval': 15,
+    # Sessions without a rerun for this many seconds count as inactive
+    'session_timeout': 300,
+    'rerun_buckets': (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+    'component_buckets': (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0),
+}
+
+# ============================================================================
+# TRACING
+# ============================================================================
+# Span traces of reruns (see tracing.py), written as Chrome trace JSON. Off
+# unless MOUNTAIN_PATH_TRACE is set.
+TRACING = {
+    'enabled': os.environ.get('MOUNTAIN_PATH_TRACE', '') not in ('', '0'),
+    # Fraction of reruns traced; a page opened with ?trace=1 is always traced
+    'sample_rate': float(os.environ.get('MOUNTAIN_PATH_TRACE_SAMPLE', 1.0)),
+    # One file per process: <stem>-<pid>.json, rotated at max_bytes
+    'path': os.environ.get('MOUNTAIN_PATH_TRACE_FILE', '.traces/reruns.json'),
+    'max_bytes': 20 * 2**20,
+    'backups': 5,
+}
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
@@ -169,6 +252,10 @@ __all__ = [
     'FONTS',
     'PAGE_CONFIG',
     'SPACING',
+    'PAYLOAD_BUDGET',
+    'CACHE',
+    'METRICS',
+    'TRACING',
     'COMPONENT_CLASSES',
     'get_page_config',
     'rgba_from_hex',
@@ -0,0 +1,130 @@
+"""
+The Mountain Path - Streamlit Design Template
+Data Module: Cached, Seeded Sample-Data Providers
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+Datasets are generated once per process for each combination of
+parameters and seed, then served from a shared cache (TTL and memory cap
+from config.CACHE). The numbers stay the same across reruns and users, and
+reruns no longer pay to regenerate them. Copy this pattern for real data:
+decorate the loader with @dataset and pass everything that identifies the
+data as arguments.
+"""
+
+import numpy as np
+import pandas as pd
+
+from cache import MemoryCache, memoize
+from config import CACHE
+
+# One cache shared by every provider so the memory cap applies to all data
+DATA_CACHE = MemoryCache('data', max_bytes=CACHE['data_max_bytes'], ttl=CACHE['data_ttl'])
+
+
+def dataset(fn):
+    """Cache a data provider in DATA_CACHE (results are returned as copies)."""
+    return memoize(cache=DATA_CACHE)(fn)
+
+
+# ============================================================================
+# SAMPLE DATA PROVIDERS
+# ============================================================================
+
+@dataset
+def sample_frame(rows: int = 10, columns: tuple = ('Column 1', 'Column 2', 'Column 3'),
+                 seed: int = 42) -> pd.DataFrame:
+    """
+    Get a DataFrame of standard-normal samples.
+
+    Parameters:
+    -----------
+    rows : int, optional
+        Number of rows (default: 10)
+    columns : tuple, optional
+        Column names
+    seed : int, optional
+        Random seed (default: 42)
+
+    Returns:
+    --------
+    pd.DataFrame : rows × len(columns) standard-normal values
+
+    Example:
+    --------
+    df = sample_frame(rows=250, columns=('AAPL', 'MSFT'), seed=7)
+    """
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(rng.standard_normal((rows, len(columns))), columns=list(columns))
+
+
+@dataset
+def sample_returns(rows: int = 252, assets: tuple = ('Asset 1', 'Asset 2', 'Asset 3'),
+                   mean: float = 0.0004, vol: float = 0.01, seed: int = 42) -> pd.DataFrame:
+    """
+    Get simulated daily returns for a set of assets.
+
+    Parameters:
+    -----------
+    rows : int, optional
+        Number of trading days (default: 252)
+    assets : tuple, optional
+        Asset names
+    mean : float, optional
+        Daily mean return (default: 0.04%)
+    vol : float, optional
+        Daily volatility (default: 1%)
+    seed : int, optional
+        Random seed (default: 42)
+
+    Returns:
+    --------
+    pd.DataFrame : Daily returns indexed by business day
+    """
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range('2024-01-01', periods=rows, name='Date')
+    values = rng.normal(mean, vol, size=(rows, len(assets)))
+    return pd.DataFrame(values, index=index, columns=list(assets))
+
+
+@dataset
+def wave_series(n: int = 100, start: float = 0.0, stop: float = 10.0) -> tuple:
+    """
+    Get x, sin(x) and cos(x) arrays for chart examples.
+
+    Returns:
+    --------
+    tuple : (x, sin(x), cos(x)) as np.ndarray
+    """
+    x = np.linspace(start, stop, n)
+    return x, np.sin(x), np.cos(x)
+
+
+@dataset
+def risk_metrics_table() -> pd.DataFrame:
+    """
+    Get the sample risk-metrics table used in the component showcase.
+
+    Returns:
+    --------
+    pd.DataFrame : Metric / Value / Status columns
+    """
+    return pd.DataFrame({
+        'Metric': ['VaR', 'Expected Shortfall', 'Volatility', 'Sharpe Ratio'],
+        'Value': [2.34, 3.12, 18.5, 1.42],
+        'Status': ['✓', '✓', '⚠', '✓']
+    })
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    'DATA_CACHE',
+    'dataset',
+    'sample_frame',
+    'sample_returns',
+    'wave_series',
+    'risk_metrics_table',
+]
@@ -10,17 +10,17 @@ Use this as a reference when building your own applications.
 """
 
 import streamlit as st
-import pandas as pd
-import numpy as np
 import matplotlib.pyplot as plt
 
-from config import COLORS, BRANDING, get_page_config
+from config import COLORS, BRANDING, FONTS, get_page_config
 from styles import apply_styles
 from components import (
     header_container, sidebar_header, section_title, sidebar_section,
     metric_card, metric_card_advanced, info_box, formula_box,
-    success_box, warning_box, error_box, footer, three_metric_row
+    success_box, warning_box, error_box, footer, three_metric_row,
+    display_dataframe, display_figure, lazy_tabs, sidebar_parameter_panel
 )
+from data import risk_metrics_table, sample_returns, wave_series
 
 # ============================================================================
 # PAGE CONFIGURATION
@@ -45,12 +45,15 @@ header_container(
 # ============================================================================
 sidebar_header("DEMO CONTROLS", "Explore components")
 
-sidebar_section("📊 Sample Parameters")
-sample_slider = st.sidebar.slider("Sample Slider", 0.0, 100.0, 50.0, 1.0)
-sample_select = st.sidebar.selectbox(
-    "Sample Dropdown",
-    ["Option 1", "Option 2", "Option 3"]
-)
+# Live controls, applied once they have been left alone for a second
+params = sidebar_parameter_panel({
+    'sample_slider': {'type': 'slider', 'label': "Sample Slider",
+                      'min': 0.0, 'max': 100.0, 'default': 50.0, 'step': 1.0},
+    'sample_select': {'type': 'select', 'label': "Sample Dropdown",
+                      'options': ["Option 1", "Option 2", "Option 3"]},
+}, key="sample", section="📊 Sample Parameters", debounce=1.0)
+sample_slider = params.values['sample_slider']
+sample_select = params.values['sample_select']
 
 sidebar_section("🎨 Display Options")
 show_charts = st.sidebar.checkbox("Show Charts", value=True)
@@ -59,15 +62,10 @@ show_tables = st.sidebar.checkbox("Show Tables", value=True)
 # ============================================================================
 # MAIN CONTENT - TABS
 # ============================================================================
-tab1, tab2, tab3, tab4 = st.tabs([
-    "📊 Components",
-    "📈 Metrics & Cards",
-    "📚 Info Boxes",
-    "🎨 Styling Examples"
-])
+# Each tab is a function; lazy_tabs() below runs only the selected one
 
 # ========== TAB 1: COMPONENTS ==========
-with tab1:
+def components_tab():
     section_title("🎯 Header Components")
     
     st.write("**Standard Header** (already shown at top)")
@@ -88,21 +86,15 @@ header_container(
     section_title("📊 Data Display Components")
     
     st.write("**DataFrame with Styling**")
-    sample_df = pd.DataFrame({
-        'Metric': ['VaR', 'Expected Shortfall', 'Volatility', 'Sharpe Ratio'],
-        'Value': [2.34, 3.12, 18.5, 1.42],
-        'Status': ['✓', '✓', '⚠', '✓']
-    })
+    sample_df = risk_metrics_table()
     st.dataframe(sample_df, use_container_width=True, hide_index=True)
     
     # ---------------
     section_title("📈 Charts & Visualizations")
     
     if show_charts:
-        # Generate sample data
-        x = np.linspace(0, 10, 100)
-        y1 = np.sin(x)
-        y2 = np.cos(x)
+        # Sample data is cached (data.py), not regenerated on every rerun
+        x, y1, y2 = wave_series(n=100, start=0.0, stop=10.0)
         
         fig, ax = plt.subplots(figsize=(10, 4))
         ax.plot(x, y1, label='Sin(x)', color=COLORS['accent_gold'], linewidth=2)
@@ -125,8 +117,9 @@ st.pyplot(fig)
 plt.close()
         ''')
 
+
 # ========== TAB 2: METRICS & CARDS ==========
-with tab2:
+def metrics_tab():
     section_title("💳 Metric Cards")
     
     st.write("**Basic Metric Cards**")
@@ -183,8 +176,9 @@ three_metric_row([
 ])
     ''')
 
+
 # ========== TAB 3: INFO BOXES ==========
-with tab3:
+def info_boxes_tab():
     section_title("ℹ️ Information Boxes")
     
     st.write("**Standard Info Box**")
@@ -243,8 +237,9 @@ warning_box("Warning message")
 error_box("Error message")
     ''')
 
+
 # ========== TAB 4: STYLING EXAMPLES ==========
-with tab4:
+def styling_tab():
     section_title("🎨 Color Palette")
     
     st.write("**Mountain Path Colors**")
@@ -311,6 +306,54 @@ with tab4:
     st.warning("This is a warning message")
     st.error("This is an error message")
 
+
+lazy_tabs({
+    "📊 Components": components_tab,
+    "📈 Metrics & Cards": metrics_tab,
+    "📚 Info Boxes": info_boxes_tab,
+    "🎨 Styling Examples": styling_tab,
+}, key="showcase")
+
+# ============================================================================
+# CACHED RESULT TABS
+# ============================================================================
+# These tabs are built only from components, so with cache=True a tab seen
+# before is replayed instead of re-run until the sample parameters change
+
+section_title("⚡ Sample Results (Cached Tabs)")
+
+
+def sample_results():
+    seed = ["Option 1", "Option 2", "Option 3"].index(sample_select)
+    return sample_returns(rows=max(int(sample_slider), 2) * 5, seed=seed)
+
+
+def summary_tab():
+    returns = sample_results()
+    annual_vol = returns.std() * 252 ** 0.5
+    three_metric_row([(asset, f"{vol:.1%}", "Annualized volatility")
+                      for asset, vol in annual_vol.items()])
+
+
+def table_tab():
+    display_dataframe(sample_results().describe().round(4), title="📋 Return Statistics",
+                      caption=f"{sample_slider:.0f} × 5 simulated days, {sample_select}")
+
+
+def chart_tab():
+    fig, ax = plt.subplots(figsize=(10, 4))
+    (1 + sample_results()).cumprod().plot(ax=ax, linewidth=2)
+    ax.set_ylabel('Growth of 1')
+    ax.grid(True, alpha=0.3)
+    display_figure(fig, title="📈 Cumulative Growth")
+
+
+lazy_tabs({
+    "📊 Summary": summary_tab,
+    "📋 Table": table_tab,
+    "📈 Chart": chart_tab,
+}, key="results", cache=True, deps=(sample_slider, sample_select))
+
 # ============================================================================
 # ADDITIONAL EXAMPLES
 # ============================================================================
@@ -0,0 +1,280 @@
+"""
+The Mountain Path - Streamlit Design Template
+Export Module: Static HTML Snapshots of Read-Only Pages
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+Renders a page built from these components to one self-contained HTML
+file: the compiled stylesheet is inlined, charts added with
+display_figure() are embedded as PNG data URIs and tables added with
+display_dataframe() become HTML tables. Regenerate the file on a schedule
+and serve it from disk - read-only viewers then cost no Python reruns.
+
+A page to export is a function that calls components only (no raw st.*
+calls, whose output cannot be captured) - snapshots.daily_report is a
+complete example:
+
+    def daily_report():
+        header_container("Daily Risk Report", subtitle="As of close")
+        three_metric_row(rows[0])
+        display_figure(fig, title="📈 Cumulative Returns")
+        footer()
+
+Serving: any static web server works. To serve from the Streamlit server
+itself, write into ./static/ and set `server.enableStaticServing = true`;
+the file is then available at /app/static/<name>.html.
+
+Usage:
+------
+python export.py snapshots:daily_report static/daily.html
+python export.py snapshots:daily_report static/daily.html --every 86400
+"""
+
+import argparse
+import base64
+import html as html_lib
+import importlib
+import logging
+import os
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from render import render_stylesheet
+from config import BRANDING
+
+logger = logging.getLogger(__name__)
+
+# Layout rules standing in for the Streamlit page structure
+EXPORT_CSS = """
+    body { margin: 0; min-height: 100vh; }
+    .mp-layout { display: flex; min-height: 100vh; }
+    section[data-testid="stSidebar"] { width: 18rem; flex-shrink: 0; padding: 1.5rem 1rem; }
+    main.main { flex: 1; max-width: 1100px; margin: 0 auto; padding: 2rem 1.5rem; }
+    .mp-row { display: flex; gap: 1rem; }
+    .mp-row > div { flex: 1; min-width: 0; }
+    .mp-figure { max-width: 100%; height: auto; border-radius: 8px; }
+    .mp-caption { font-size: 0.85rem; opacity: 0.8; }
+    .mp-table-wrap { overflow-x: auto; margin: 0.5rem 0 1rem; }
+    .mp-table { border-collapse: collapse; width: 100%; font-size: 0.85rem; }
+    .mp-table th, .mp-table td { padding: 0.35rem 0.6rem; border-bottom: 1px solid rgba(255,215,0,0.15); text-align: right; }
+    .mp-table th { text-align: center; }
+    .mp-generated { font-size: 0.75rem; opacity: 0.6; text-align: center; }
+"""
+
+
+# ============================================================================
+# RENDERING
+# ============================================================================
+
+def render_page(build_fn, *args, **kwargs) -> list:
+    """
+    Run a page function and capture its component output.
+
+    Returns:
+    --------
+    list : (kind, payload, sidebar) items, see components.capture
+    """
+    # Imported here so to_html() stays usable without Streamlit
+    from components import capture
+
+    with capture() as items:
+        build_fn(*args, **kwargs)
+    return items
+
+
+def _table_html(data) -> str:
+    if hasattr(data, 'to_pandas'):  # pyarrow.Table
+        data = data.to_pandas()
+    if not hasattr(data, 'to_html'):
+        import pandas as pd
+        data = pd.DataFrame(data)
+    return f'<div class="mp-table-wrap">{data.to_html(classes="mp-table", border=0)}</div>'
+
+
+def item_html(kind: str, payload) -> str:
+    """Static HTML for one captured item."""
+    if kind == 'html':
+        return payload
+    if kind == 'row':
+        cells = ''.join(f'<div>{cell}</div>' for cell in payload)
+        return f'<div class="mp-row">{cells}</div>'
+    if kind == 'divider':
+        return '<hr>'
+    if kind == 'caption':
+        return f'<p class="mp-caption">{html_lib.escape(payload)}</p>'
+    if kind == 'dataframe':
+        return _table_html(payload)
+    if kind == 'figure':
+        data = base64.b64encode(payload).decode('ascii')
+        return f'<img class="mp-figure" alt="chart" src="data:image/png;base64,{data}">'
+    raise ValueError(f"Unknown captured item kind: {kind!r}")
+
+
+def to_html(items: list, title: str = None, extra_css: str = "",
+            generated_at: datetime = None, stylesheet: str = None) -> str:
+    """
+    Assemble captured items into a self-contained HTML document.
+
+    Parameters:
+    -----------
+    items : list
+        Output of render_page()
+    title : str, optional
+        Document title (default: branding name)
+    extra_css : str, optional
+        Additional CSS appended after the stylesheet
+    generated_at : datetime, optional
+        Timestamp shown in the page (default: now)
+    stylesheet : str, optional
+        Precompiled <style> block (default: render_stylesheet())
+    """
+    main = [item_html(kind, payload) for kind, payload, sidebar in items if not sidebar]
+    side = [item_html(kind, payload) for kind, payload, sidebar in items if sidebar]
+    aside = f'<section data-testid="stSidebar">{"".join(side)}</section>' if side else ''
+    stamp = (generated_at or datetime.now()).strftime('%Y-%m-%d %H:%M')
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html_lib.escape(title or BRANDING['name'])}</title>
+{stylesheet or render_stylesheet()}
+<style>{EXPORT_CSS}{extra_css}</style>
+</head>
+<body class="stApp">
+<div class="mp-layout">
+{aside}
+<main class="main">
+{''.join(main)}
+<p class="mp-generated">Snapshot generated {stamp}</p>
+</main>
+</div>
+</body>
+</html>
+"""
+
+
+def write_atomic(path, text: str):
+    """
+    Write text so readers never see a partially written file.
+
+    The file gets the usual permissions for a new file (0666 minus the
+    umask, applied by the kernel), not mkstemp's private 0600, so a web
+    server or collector running as another user can read it.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f'.{path.name}.{uuid.uuid4().hex}.tmp')
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def export_page(build_fn, path, title: str = None, *args, **kwargs) -> Path:
+    """
+    Render a page function to a static HTML file.
+
+    Parameters:
+    -----------
+    build_fn : callable
+        Function that builds the page from components
+    path : str or Path
+        Output file
+    title : str, optional
+        Document title
+
+    Returns:
+    --------
+    Path : The written file
+
+    Example:
+    --------
+    export_page(daily_report, "static/daily.html", title="Daily Risk Report")
+    """
+    items = render_page(build_fn, *args, **kwargs)
+    write_atomic(path, to_html(items, title))
+    return Path(path)
+
+
+# ============================================================================
+# SCHEDULING
+# ============================================================================
+
+def schedule_export(build_fn, path, interval: float, title: str = None) -> threading.Event:
+    """
+    Regenerate a snapshot every `interval` seconds in a daemon thread.
+
+    Returns:
+    --------
+    threading.Event : set() it to stop the schedule
+    """
+    stop = threading.Event()
+
+    def loop():
+        while not stop.is_set():
+            start = time.perf_counter()
+            try:
+                export_page(build_fn, path, title)
+                logger.info("Exported %s in %.2fs", path, time.perf_counter() - start)
+            except Exception:
+                logger.exception("Snapshot export to %s failed", path)
+            stop.wait(interval)
+
+    threading.Thread(target=loop, name=f"export:{path}", daemon=True).start()
+    return stop
+
+
+def _resolve(target: str):
+    module_name, _, attr = target.partition(':')
+    if not attr:
+        raise SystemExit("target must look like module:function")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Export a component page to static HTML")
+    parser.add_argument('target', help="module:function that builds the page")
+    parser.add_argument('output', type=Path)
+    parser.add_argument('--title')
+    parser.add_argument('--every', type=float, help="Regenerate every N seconds")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, os.getcwd())
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+    build_fn = _resolve(args.target)
+    if args.every:
+        schedule_export(build_fn, args.output, args.every, args.title)
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            return 0
+    export_page(build_fn, args.output, args.title)
+    print(f"Wrote {args.output}")
+    return 0
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    'render_page',
+    'item_html',
+    'to_html',
+    'export_page',
+    'schedule_export',
+]
+
+
+if __name__ == '__main__':
+    sys.exit(main())
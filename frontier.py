@@ -0,0 +1,277 @@
+"""
+The Mountain Path - Streamlit Design Template
+Frontier Module: Batched Mean-Variance Optimization
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+Computes whole efficient frontiers at once instead of one point per solve:
+- unconstrained_frontier: closed-form (Merton) frontier for any number of
+  target returns in a single matrix product, plus the minimum-variance and
+  tangency portfolios
+- constrained_frontier: long-only (optionally capped) portfolios for a
+  batch of risk-aversion values, solved together by accelerated projected
+  gradient and warm-started from the previous solution
+
+The covariance factorization (Cholesky, Σ⁻¹μ, Σ⁻¹1, largest eigenvalue)
+is cached by the content of μ and Σ, so a rerun that only moves the
+risk-aversion slider reuses it instead of refactorizing.
+
+mean and cov may be in any consistent units (daily, annual); results are
+reported in the same units.
+"""
+
+import numpy as np
+
+from cache import MemoryCache, make_key, memoize
+
+FACTOR_CACHE = MemoryCache('frontier_factors', max_entries=32)
+# Last constrained solutions per factorization, for warm starts
+WARM_STARTS = MemoryCache('frontier_warm_starts', max_entries=32)
+
+
+# ============================================================================
+# FACTORIZATION (CACHED ACROSS RERUNS)
+# ============================================================================
+
+@memoize(cache=FACTOR_CACHE, copy=False)
+def factorize(mean, cov) -> dict:
+    """
+    Factorize the covariance matrix and precompute frontier constants.
+
+    Parameters:
+    -----------
+    mean : array-like
+        Expected returns (n_assets,)
+    cov : array-like
+        Covariance matrix (n_assets, n_assets), positive definite
+
+    Returns:
+    --------
+    dict : chol, inv_mu (Σ⁻¹μ), inv_one (Σ⁻¹1), A, B, C, D, max_eig, key
+    """
+    mu = np.asarray(mean, dtype=float)
+    sigma = np.asarray(cov, dtype=float)
+    chol = np.linalg.cholesky(sigma)
+
+    def solve(b):
+        # Σx = b via the Cholesky factor: L y = b, Lᵀ x = y
+        return np.linalg.solve(chol.T, np.linalg.solve(chol, b))
+
+    inv_mu = solve(mu)
+    inv_one = solve(np.ones_like(mu))
+    A = inv_one @ mu
+    B = inv_mu @ mu
+    C = inv_one.sum()
+    return {
+        'mean': mu,
+        'cov': sigma,
+        'chol': chol,
+        'inv_mu': inv_mu,
+        'inv_one': inv_one,
+        'A': A, 'B': B, 'C': C, 'D': B * C - A ** 2,
+        'max_eig': float(np.linalg.eigvalsh(sigma)[-1]),
+        'key': make_key(mu, sigma),
+    }
+
+
+# ============================================================================
+# CLOSED-FORM (UNCONSTRAINED) FRONTIER
+# ============================================================================
+
+def unconstrained_frontier(mean, cov, targets=None, points: int = 50,
+                           risk_free: float = 0.0) -> dict:
+    """
+    Closed-form efficient frontier (short sales allowed, weights sum to 1).
+
+    Parameters:
+    -----------
+    mean, cov : array-like
+        Expected returns and covariance
+    targets : array-like, optional
+        Target portfolio returns (default: `points` values from the
+        minimum-variance return to the highest asset return)
+    points : int, optional
+        Number of frontier points when targets is omitted (default: 50)
+    risk_free : float, optional
+        Risk-free rate for Sharpe ratios and the tangency portfolio
+
+    Returns:
+    --------
+    dict : weights (points × n), returns, volatility, sharpe,
+           min_variance {weights, return, volatility},
+           tangency {weights, return, volatility, sharpe}
+    """
+    f = factorize(mean, cov)
+    A, B, C, D = f['A'], f['B'], f['C'], f['D']
+    mu_mv = A / C
+    if targets is None:
+        targets = np.linspace(mu_mv, max(f['mean'].max(), mu_mv), points)
+    m = np.asarray(targets, dtype=float)
+
+    # w(m) = Σ⁻¹(λμ + γ1) for every target at once
+    lam = (C * m - A) / D
+    gam = (B - A * m) / D
+    weights = np.outer(lam, f['inv_mu']) + np.outer(gam, f['inv_one'])
+    vol = np.sqrt(np.maximum((C * m ** 2 - 2 * A * m + B) / D, 0.0))
+
+    excess = f['inv_mu'] - risk_free * f['inv_one']
+    w_tan = excess / excess.sum()
+    tan_ret = float(w_tan @ f['mean'])
+    tan_vol = float(np.sqrt(w_tan @ f['cov'] @ w_tan))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sharpe = (m - risk_free) / vol
+    return {
+        'weights': weights,
+        'returns': m,
+        'volatility': vol,
+        'sharpe': sharpe,
+        'min_variance': {
+            'weights': f['inv_one'] / C,
+            'return': mu_mv,
+            'volatility': float(np.sqrt(1 / C)),
+        },
+        'tangency': {
+            'weights': w_tan,
+            'return': tan_ret,
+            'volatility': tan_vol,
+            'sharpe': (tan_ret - risk_free) / tan_vol,
+        },
+    }
+
+
+# ============================================================================
+# CONSTRAINED (LONG-ONLY) FRONTIER
+# ============================================================================
+
+def _project(V: np.ndarray, upper: float) -> np.ndarray:
+    """
+    Project each column of V onto {w : sum(w) = 1, 0 <= w <= upper}.
+
+    Bisection on the shift τ with sum(clip(v - τ, 0, upper)) = 1, done for
+    all columns at once.
+    """
+    lo = V.min(axis=0) - 1.0
+    hi = V.max(axis=0)
+    for _ in range(60):
+        tau = (lo + hi) / 2
+        total = np.clip(V - tau, 0.0, upper).sum(axis=0)
+        too_big = total > 1.0
+        lo = np.where(too_big, tau, lo)
+        hi = np.where(too_big, hi, tau)
+    return np.clip(V - (lo + hi) / 2, 0.0, upper)
+
+
+def _warm_start(f: dict, risk_aversion: np.ndarray, n: int, max_weight: float):
+    """Initial weights from the nearest previously solved risk aversion."""
+    previous = WARM_STARTS.get((f['key'], max_weight))
+    if previous is None:
+        return np.full((n, len(risk_aversion)), 1.0 / n)
+    lams, W = previous
+    nearest = np.abs(np.log(lams)[:, np.newaxis] - np.log(risk_aversion)).argmin(axis=0)
+    return W[:, nearest]
+
+
+def constrained_frontier(mean, cov, risk_aversion, max_weight: float = 1.0,
+                         w0=None, warm_start: bool = True, tol: float = 1e-9,
+                         max_iter: int = 10_000, risk_free: float = 0.0) -> dict:
+    """
+    Long-only mean-variance portfolios for a batch of risk-aversion values.
+
+    Solves  max  μᵀw - (λ/2) wᵀΣw  s.t.  Σw = 1, 0 <= w <= max_weight
+    for every λ simultaneously with accelerated projected gradient.
+
+    Parameters:
+    -----------
+    mean, cov : array-like
+        Expected returns and covariance
+    risk_aversion : float or array-like
+        One or more λ > 0 (e.g. the sidebar slider value, or a grid)
+    max_weight : float, optional
+        Upper bound per asset (default: 1.0, i.e. long-only)
+    w0 : array-like, optional
+        Starting weights (n,) or (n, len(risk_aversion))
+    warm_start : bool, optional
+        Start from the nearest cached solution for the same μ/Σ (default: True)
+    tol : float, optional
+        Stop when no weight moves more than this (default: 1e-9)
+    max_iter : int, optional
+        Iteration cap (default: 10,000)
+    risk_free : float, optional
+        Risk-free rate for Sharpe ratios
+
+    Returns:
+    --------
+    dict : weights (k × n), returns, volatility, sharpe, risk_aversion, iterations
+
+    Example:
+    --------
+    lam = st.sidebar.slider("Risk aversion", 0.5, 20.0, 4.0)
+    best = constrained_frontier(mu, cov, lam, max_weight=0.4)
+    """
+    f = factorize(mean, cov)
+    mu, sigma = f['mean'], f['cov']
+    n = len(mu)
+    lam = np.atleast_1d(np.asarray(risk_aversion, dtype=float))
+    if np.any(lam <= 0):
+        raise ValueError("risk_aversion must be positive")
+    if max_weight * n < 1:
+        raise ValueError("max_weight too small for weights to sum to 1")
+
+    if w0 is not None:
+        W = np.asarray(w0, dtype=float).reshape(n, -1) * np.ones((1, len(lam)))
+    elif warm_start:
+        W = _warm_start(f, lam, n, max_weight)
+    else:
+        W = np.full((n, len(lam)), 1.0 / n)
+    W = _project(W, max_weight)
+
+    step = 1.0 / (lam * f['max_eig'])           # 1 / Lipschitz constant per column
+    Y, W_prev, t = W.copy(), W, 1.0
+    iterations = max_iter
+    for it in range(1, max_iter + 1):
+        grad = mu[:, np.newaxis] - (sigma @ Y) * lam   # ascent direction
+        W_new = _project(Y + step * grad, max_weight)
+        if np.max(np.abs(W_new - W_prev)) < tol:
+            W_prev = W_new
+            iterations = it
+            break
+        t_next = (1 + np.sqrt(1 + 4 * t * t)) / 2
+        Y = W_new + ((t - 1) / t_next) * (W_new - W_prev)
+        W_prev, t = W_new, t_next
+    W = W_prev
+
+    WARM_STARTS.set((f['key'], max_weight), (lam.copy(), W.copy()))
+    rets = mu @ W
+    vols = np.sqrt(np.einsum('ik,ij,jk->k', W, sigma, W))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sharpe = (rets - risk_free) / vols
+    return {
+        'weights': W.T,
+        'returns': rets,
+        'volatility': vols,
+        'sharpe': sharpe,
+        'risk_aversion': lam,
+        'iterations': iterations,
+    }
+
+
+def estimate_inputs(returns, periods: int = 252) -> tuple:
+    """
+    Annualized mean vector and covariance from a periods × assets returns
+    table (pd.DataFrame or ndarray).
+    """
+    r = returns.to_numpy() if hasattr(returns, 'to_numpy') else np.asarray(returns)
+    return r.mean(axis=0) * periods, np.cov(r, rowvar=False) * periods
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    'factorize',
+    'unconstrained_frontier',
+    'constrained_frontier',
+    'estimate_inputs',
+]
@@ -0,0 +1,234 @@
+"""
+The Mountain Path - Streamlit Design Template
+Loader Module: Columnar Local Data Loading
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+Loads CSV, Parquet and Arrow IPC (Feather v2) files with column and
+row-range projection. Arrow and Parquet files are memory-mapped, so only
+the pages actually touched are read from disk. Results are cached per
+process, keyed by the file's path, mtime and size - editing or replacing
+a file invalidates its entries automatically.
+
+Tables are returned as pyarrow.Table, which st.dataframe (and therefore
+display_dataframe) accepts directly without converting to pandas. Use
+column_array() to hand a column to matplotlib without copying.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+from cache import MemoryCache, make_key, sizeof
+from config import CACHE
+from tracing import active, annotate, traced
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow ships with Streamlit
+    pa = None
+
+TABLE_CACHE = MemoryCache('tables', max_bytes=CACHE['table_max_bytes'])
+
+FORMATS = {
+    '.csv': 'csv',
+    '.txt': 'csv',
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow',
+    '.ipc': 'arrow',
+}
+
+
+# ============================================================================
+# PUBLIC API
+# ============================================================================
+
+@traced(category='load')
+def load_table(path, columns: list = None, rows: tuple = None,
+               as_pandas: bool = False, file_format: str = None):
+    """
+    Load a local CSV, Parquet or Arrow IPC file with projection and caching.
+
+    Parameters:
+    -----------
+    path : str or Path
+        File to load
+    columns : list, optional
+        Columns to keep (default: all)
+    rows : tuple, optional
+        (start, stop) row range, slice semantics (negative bounds count
+        from the end); stop may be None
+    as_pandas : bool, optional
+        Return a pd.DataFrame instead of a pyarrow.Table (default: False)
+    file_format : str, optional
+        'csv', 'parquet' or 'arrow' (default: from the file extension)
+
+    Returns:
+    --------
+    pyarrow.Table or pd.DataFrame
+
+    Example:
+    --------
+    prices = load_table("data/prices.parquet", columns=["Date", "Close"],
+                        rows=(0, 5_000))
+    display_dataframe(prices, title="📋 Prices")
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    file_format = file_format or FORMATS.get(path.suffix.lower())
+    if file_format not in ('csv', 'parquet', 'arrow'):
+        raise ValueError(f"Unsupported file type: {path.suffix!r}")
+    if pa is None and (file_format != 'csv' or not as_pandas):
+        raise ImportError("pyarrow is required to load Parquet/Arrow files "
+                          "or return Arrow tables: pip install pyarrow")
+
+    columns = list(columns) if columns is not None else None
+    key = make_key(str(path), stat.st_mtime_ns, stat.st_size,
+                   columns, rows, as_pandas, file_format)
+    table = TABLE_CACHE.get(key)
+    hit = table is not None
+    if not hit:
+        reader = {'csv': _read_csv, 'parquet': _read_parquet, 'arrow': _read_arrow}
+        table = reader[file_format](path, columns, rows)
+        if as_pandas:
+            table = to_pandas(table)
+        TABLE_CACHE.set(key, table)
+    if active():
+        annotate(path=path.name, hit=hit, rows=len(table), bytes=sizeof(table))
+
+    # Arrow tables are immutable; DataFrames are copied like st.cache_data
+    return table.copy() if as_pandas else table
+
+
+def to_pandas(table) -> pd.DataFrame:
+    """
+    Convert an Arrow table to pandas with as few copies as possible.
+
+    Numeric columns without nulls are not consolidated into 2-D blocks, so
+    pandas can wrap the Arrow buffers instead of copying them.
+    """
+    if isinstance(table, pd.DataFrame):
+        return table
+    return table.to_pandas(split_blocks=True)
+
+
+def column_array(table, name: str):
+    """
+    Get one column as a NumPy array, zero-copy where Arrow allows it.
+
+    Parameters:
+    -----------
+    table : pyarrow.Table or pd.DataFrame
+        Loaded table
+    name : str
+        Column name
+
+    Returns:
+    --------
+    np.ndarray : Read-only view when zero-copy was possible, else a copy
+
+    Example:
+    --------
+    ax.plot(column_array(prices, "Close"), color=COLORS['accent_gold'])
+    """
+    if isinstance(table, pd.DataFrame):
+        return table[name].to_numpy()
+    column = table.column(name)
+    if column.num_chunks == 1:
+        try:
+            return column.chunk(0).to_numpy(zero_copy_only=True)
+        except (pa.ArrowInvalid, NotImplementedError):
+            pass
+    return column.to_numpy()
+
+
+def clear_cache():
+    """Drop all cached tables."""
+    TABLE_CACHE.clear()
+
+
+# ============================================================================
+# READERS
+# ============================================================================
+
+def _row_bounds(rows: tuple, total: int) -> tuple:
+    if rows is None:
+        return 0, total
+    start, stop = slice(*rows).indices(total)[:2]
+    return start, max(start, stop)
+
+
+def _read_arrow(path: Path, columns: list, rows: tuple):
+    # Buffers point into the memory map: nothing is copied until touched
+    source = pa.memory_map(str(path), 'r')
+    try:
+        table = pa_ipc.open_file(source).read_all()
+    except pa.ArrowInvalid:
+        source.seek(0)
+        table = pa_ipc.open_stream(source).read_all()
+    if columns is not None:
+        table = table.select(columns)
+    start, stop = _row_bounds(rows, table.num_rows)
+    return table.slice(start, stop - start)
+
+
+def _read_parquet(path: Path, columns: list, rows: tuple):
+    parquet = pq.ParquetFile(str(path), memory_map=True)
+    meta = parquet.metadata
+    start, stop = _row_bounds(rows, meta.num_rows)
+    if rows is None:
+        return parquet.read(columns=columns)
+
+    # Read only the row groups that overlap [start, stop)
+    groups, offset, first_row = [], 0, None
+    for i in range(meta.num_row_groups):
+        n = meta.row_group(i).num_rows
+        if offset + n > start and offset < stop:
+            groups.append(i)
+            first_row = offset if first_row is None else first_row
+        offset += n
+    if not groups:
+        return parquet.schema_arrow.empty_table().select(columns or parquet.schema_arrow.names)
+    table = parquet.read_row_groups(groups, columns=columns)
+    return table.slice(start - first_row, stop - start)
+
+
+def _read_csv(path: Path, columns: list, rows: tuple):
+    # CSV has to be parsed, but pandas can skip unneeded columns and rows
+    skip, nrows, tail = None, None, None
+    if rows is not None:
+        start, stop = rows
+        if (start or 0) < 0 or (stop or 0) < 0:
+            # Bounds from the end need the row count: parse, then slice
+            tail = rows
+        else:
+            if start:
+                skip = range(1, start + 1)
+            if stop is not None:
+                nrows = max(stop - (start or 0), 0)
+    df = pd.read_csv(path, usecols=columns, skiprows=skip, nrows=nrows)
+    if tail is not None:
+        start, stop = _row_bounds(tail, len(df))
+        df = df.iloc[start:stop].reset_index(drop=True)
+    if columns is not None:
+        df = df[columns]
+    if pa is None:
+        return df
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    'TABLE_CACHE',
+    'load_table',
+    'to_pandas',
+    'column_array',
+    'clear_cache',
+]
@@ -0,0 +1,370 @@
+"""
+The Mountain Path - Streamlit Design Template
+Metrics Module: Prometheus Metrics for Reruns, Components and Caches
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+Counts and times what the server spends its time on, in the Prometheus
+text exposition format:
+- mp_reruns_total / mp_rerun_seconds{page}: script reruns and their
+  latency, timed from apply_styles() to the end of the script run
+  (hooked into Streamlit's script runner, so st.stop, exceptions and
+  interrupted reruns are timed too)
+- mp_active_sessions: sessions with a rerun in the last
+  config.METRICS['session_timeout'] seconds
+- mp_component_seconds{component}: render time of each component call
+  (inclusive - lazy_tabs includes the tab it renders)
+- mp_cache_*{cache}: hits, misses, evictions, entries and bytes of every
+  cache in cache.CACHES, read when scraped
+- process_resident_memory_bytes
+
+Set MOUNTAIN_PATH_METRICS=1 to enable. Metrics are then served on
+http://127.0.0.1:9464/metrics (config.METRICS['port']) and/or written to
+config.METRICS['file'] for a node-exporter textfile collector. When
+disabled, @instrumented returns the function itself and the rerun hook
+is never called, so instrumentation costs nothing.
+
+Usage:
+------
+MOUNTAIN_PATH_METRICS=1 streamlit run app.py
+curl -s localhost:9464/metrics
+"""
+
+import bisect
+import functools
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from config import METRICS
+from export import write_atomic
+from runtime import on_script_finished, page_name, rss_bytes, session_id
+
+logger = logging.getLogger(__name__)
+
+ENABLED = METRICS['enabled']
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Keys of a cache's info() exported as counters and as gauges
+_CACHE_COUNTERS = ('hits', 'misses', 'evictions')
+_CACHE_GAUGES = ('entries', 'bytes')
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(names: tuple, values: tuple, extra: str = '') -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _number(value) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+# ============================================================================
+# METRIC TYPES
+# ============================================================================
+
+class _Metric:
+    """A named metric family; one value per combination of label values."""
+
+    kind = 'untyped'
+
+    def __init__(self, name: str, help: str, labels: tuple = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+        REGISTRY[name] = self
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(labels.get(n, '') for n in self.labelnames)
+
+    def samples(self):
+        """(suffix, label string, value) tuples for the text format."""
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield '', _labels(self.labelnames, key), value
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    kind = 'gauge'
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative buckets, with sum and count."""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, help: str, labels: tuple = (), buckets: tuple = ()):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def samples(self):
+        with self._lock:
+            items = [(key, (list(s[0]), s[1], s[2])) for key, s in self._values.items()]
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets, counts):
+                cumulative += n
+                yield '_bucket', _labels(self.labelnames, key, f'le="{_number(bound)}"'), cumulative
+            labels = _labels(self.labelnames, key)
+            yield '_sum', labels, total
+            yield '_count', labels, count
+
+
+REGISTRY = {}
+
+RERUNS = Counter('mp_reruns_total', "Script reruns.", ('page',))
+RERUN_SECONDS = Histogram('mp_rerun_seconds', "Rerun latency, apply_styles() to end of run.",
+                          ('page',), METRICS['rerun_buckets'])
+COMPONENT_SECONDS = Histogram('mp_component_seconds', "Component render time.",
+                              ('component',), METRICS['component_buckets'])
+ACTIVE_SESSIONS = Gauge('mp_active_sessions', "Sessions with a recent rerun.")
+
+
+# ============================================================================
+# INSTRUMENTATION
+# ============================================================================
+
+_RERUN_STATE = '_mp_metrics_rerun'
+_sessions = {}              # session id -> time of its last rerun
+_sessions_lock = threading.Lock()
+
+
+_unhooked_warned = False
+
+
+def rerun_started():
+    """
+    Count a rerun and time it until the script run ends (called by
+    styles.apply_styles; further calls in the same run are ignored).
+    """
+    import streamlit as st
+
+    global _unhooked_warned
+    run = st.session_state.get(_RERUN_STATE)
+    if run is not None and run['open']:
+        return
+    start_exporter()
+    run = {'page': page_name(), 'start': time.perf_counter(), 'open': True}
+    RERUNS.inc(page=run['page'])
+    with _sessions_lock:
+        _sessions[session_id()] = time.time()
+    if on_script_finished(lambda: _rerun_finished(run)):
+        st.session_state[_RERUN_STATE] = run
+    elif not _unhooked_warned:
+        _unhooked_warned = True
+        logger.warning("No Streamlit script runner to hook: mp_rerun_seconds "
+                       "is not recorded")
+
+
+def _rerun_finished(run: dict):
+    run['open'] = False
+    RERUN_SECONDS.observe(time.perf_counter() - run['start'], page=run['page'])
+
+
+def instrumented(fn=None, *, name: str = None):
+    """
+    Time every call of a component in mp_component_seconds.
+
+    Returns the function unchanged when metrics are disabled.
+
+    Parameters:
+    -----------
+    name : str, optional
+        Component label (default: the function name)
+
+    Example:
+    --------
+    @instrumented
+    def risk_gauge(value: float):
+        ...
+    """
+    if fn is None:
+        return functools.partial(instrumented, name=name)
+    if not ENABLED:
+        return fn
+    label = name or fn.__name__
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            COMPONENT_SECONDS.observe(time.perf_counter() - start, component=label)
+
+    return wrapper
+
+
+def _collect():
+    """Refresh the metrics that are read rather than counted."""
+    horizon = time.time() - METRICS['session_timeout']
+    with _sessions_lock:
+        for sid in [s for s, seen in _sessions.items() if seen < horizon]:
+            del _sessions[sid]
+        ACTIVE_SESSIONS.set(len(_sessions))
+
+
+def _cache_samples():
+    """mp_cache_* families from cache.CACHES, read at scrape time."""
+    from cache import CACHES
+
+    infos = []
+    for name, c in list(CACHES.items()):
+        try:
+            infos.append((name, c.info()))
+        except Exception:  # e.g. a disk cache whose file was removed
+            logger.debug("Skipping cache %s in metrics", name, exc_info=True)
+    families = [(f'mp_cache_{key}_total', 'counter', key) for key in _CACHE_COUNTERS]
+    families += [(f'mp_cache_{key}', 'gauge', key) for key in _CACHE_GAUGES]
+    for metric, kind, key in families:
+        yield metric, kind, f"Cache {key} per registered cache.", [
+            ('', _labels(('cache',), (name,)), info.get(key, 0)) for name, info in infos]
+
+
+# ============================================================================
+# EXPOSITION
+# ============================================================================
+
+def render_text() -> str:
+    """All metrics in the Prometheus text exposition format."""
+    _collect()
+    families = [(m.name, m.kind, m.help, list(m.samples())) for m in REGISTRY.values()]
+    families += list(_cache_samples())
+    families.append(('process_resident_memory_bytes', 'gauge',
+                     "Resident memory size in bytes.", [('', '', rss_bytes())]))
+    lines = []
+    for name, kind, help, samples in families:
+        lines.append(f"# HELP {name} {help}")
+        lines.append(f"# TYPE {name} {kind}")
+        for suffix, labels, value in samples:
+            lines.append(f"{name}{suffix}{labels} {_number(value)}")
+    return '\n'.join(lines) + '\n'
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+        body = render_text().encode()
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("metrics: " + format, *args)
+
+
+def start_http_server(port: int = None, address: str = None) -> ThreadingHTTPServer:
+    """Serve /metrics from a daemon thread (defaults from config.METRICS)."""
+    server = ThreadingHTTPServer((address or METRICS['address'],
+                                  METRICS['port'] if port is None else port), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='metrics-http', daemon=True).start()
+    logger.info("Serving metrics on http://%s:%d/metrics", *server.server_address[:2])
+    return server
+
+
+def write_file(path) -> None:
+    """Write the text format to path atomically (textfile collector)."""
+    write_atomic(path, render_text())
+
+
+def _write_periodically(path, interval: float):
+    while True:
+        try:
+            write_file(path)
+        except OSError:
+            logger.exception("Could not write metrics to %s", path)
+        time.sleep(interval)
+
+
+_exporter_lock = threading.Lock()
+_exporter_started = False
+
+
+def start_exporter() -> bool:
+    """
+    Start the configured endpoint and file writer, once per process.
+
+    Called by the first rerun; safe to call again. Returns True if this
+    call started them.
+    """
+    global _exporter_started
+    with _exporter_lock:
+        if _exporter_started:
+            return False
+        _exporter_started = True
+    if METRICS['port']:
+        try:
+            start_http_server()
+        except OSError as exc:
+            # Another server process on the host already owns the port
+            logger.warning("Metrics endpoint not started: %s", exc)
+    if METRICS['file']:
+        threading.Thread(target=_write_periodically, name='metrics-file', daemon=True,
+                         args=(METRICS['file'], METRICS['file_interval'])).start()
+    return True
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    'ENABLED',
+    'REGISTRY',
+    'Counter',
+    'Gauge',
+    'Histogram',
+    'instrumented',
+    'rerun_started',
+    'render_text',
+    'start_http_server',
+    'write_file',
+    'start_exporter',
+]
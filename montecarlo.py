@@ -0,0 +1,362 @@
+"""
+The Mountain Path - Streamlit Design Template
+Monte Carlo Module: Chunked, Multi-Process Simulated VaR
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+Simulates portfolio P&L in fixed-size chunks spread over a process pool.
+- Memory is bounded: each chunk is reduced in its worker to a fixed-size
+  loss histogram (counts and sums per bin), so the parent never holds the
+  simulated paths, whatever the path count.
+- Results are reproducible: chunk i always uses the seed
+  SeedSequence(seed, spawn_key=(i,)), independent of worker count and of
+  the order in which chunks finish.
+- Estimates stream back: simulate_var() yields a provisional VaR / ES
+  after every completed chunk, so a progress bar and a provisional
+  metric_card can update while the simulation runs.
+
+VaR/ES resolution is one histogram bin: (range / bins), with the range
+set from the analytical portfolio volatility (see _loss_edges) or given
+as loss_range. A quantile outside the range raises ValueError rather than
+returning a wrong number - widen loss_range (e.g. for non-linear payoffs).
+
+Worker processes are started once per process and reused by later calls,
+so a Streamlit rerun doesn't pay the pool start-up cost.
+"""
+
+import math
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from statistics import NormalDist
+from typing import NamedTuple
+
+import numpy as np
+
+
+class MonteCarloEstimate(NamedTuple):
+    """Provisional (or final) result after some chunks have completed."""
+    paths_done: int
+    paths_total: int
+    var: float
+    es: float
+
+    @property
+    def fraction(self) -> float:
+        return self.paths_done / self.paths_total
+
+
+# ============================================================================
+# WORKER
+# ============================================================================
+
+def linear_payoff(asset_returns: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Portfolio return of a linear position: asset returns @ weights."""
+    return asset_returns @ weights
+
+
+def _simulate_chunk(task: tuple) -> tuple:
+    """
+    Simulate one chunk and reduce it to histogram sums (runs in a worker).
+
+    Must stay a module-level function so it can be pickled.
+    """
+    (index, n, seed, mean, chol, weights, value, distribution, dof,
+     edges, payoff) = task
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(index,)))
+
+    z = rng.standard_normal((n, len(mean)))
+    if distribution == 't':
+        # Multivariate Student-t scaled to unit variance
+        scale = np.sqrt(rng.chisquare(dof, n) / (dof - 2))
+        z /= scale[:, np.newaxis]
+    asset_returns = mean + z @ chol.T
+    losses = -value * payoff(asset_returns, weights)
+
+    bins = np.clip(np.searchsorted(edges, losses, side='right') - 1, -1, len(edges) - 1)
+    inside = (bins >= 0) & (bins < len(edges) - 1)
+    counts = np.bincount(bins[inside], minlength=len(edges) - 1)
+    sums = np.bincount(bins[inside], weights=losses[inside], minlength=len(edges) - 1)
+    over = losses[bins == len(edges) - 1]
+    under = losses[bins == -1]
+    return (counts, sums,
+            len(under),
+            len(over), float(over.sum()), float(over.max()) if len(over) else -math.inf)
+
+
+# ============================================================================
+# HISTOGRAM REDUCTION
+# ============================================================================
+
+def _loss_edges(mean, cov, weights, value, distribution, bins, loss_range=None) -> np.ndarray:
+    """Histogram edges covering the loss distribution with room in the tails."""
+    if loss_range is not None:
+        low, high = loss_range
+        if not low < high:
+            raise ValueError("loss_range must be (low, high) with low < high")
+        return np.linspace(low, high, bins + 1)
+    mu = float(mean @ weights) * value
+    sigma = math.sqrt(float(weights @ cov @ weights)) * value
+    width = 12.0 if distribution == 'normal' else 30.0  # fatter tails for t
+    return np.linspace(-mu - width * sigma, -mu + width * sigma, bins + 1)
+
+
+class _LossHistogram:
+    """Running merge of per-chunk histograms; O(bins) memory."""
+
+    def __init__(self, edges: np.ndarray):
+        self.edges = edges
+        self.counts = np.zeros(len(edges) - 1)
+        self.sums = np.zeros(len(edges) - 1)
+        self.under = 0
+        self.over_count = 0
+        self.over_sum = 0.0
+        self.over_max = -math.inf
+        self.n = 0
+
+    def merge(self, part: tuple, n: int):
+        counts, sums, under, over_count, over_sum, over_max = part
+        self.counts += counts
+        self.sums += sums
+        self.under += under
+        self.over_count += over_count
+        self.over_sum += over_sum
+        self.over_max = max(self.over_max, over_max)
+        self.n += n
+
+    def var_es(self, confidence: float) -> tuple:
+        """Loss quantile and mean loss beyond it, interpolated within bins."""
+        target = confidence * self.n
+        cum = self.under + np.cumsum(self.counts)
+        i = int(np.searchsorted(cum, target))
+        if i >= len(self.counts) or self.under >= target:
+            # Only counts are kept outside the range, so no quantile there
+            side = 'above' if i >= len(self.counts) else 'below'
+            raise ValueError(
+                f"The {confidence:.2%} loss quantile lies {side} the histogram range "
+                f"[{self.edges[0]:,.4g}, {self.edges[-1]:,.4g}] ({self.over_count:,} "
+                f"losses above, {self.under:,} below, worst {self.over_max:,.4g}); "
+                "pass a wider loss_range")
+
+        before = cum[i] - self.counts[i]
+        frac = (target - before) / self.counts[i] if self.counts[i] else 0.0
+        lo, hi = self.edges[i], self.edges[i + 1]
+        var = lo + frac * (hi - lo)
+
+        tail_count = (1 - frac) * self.counts[i] + self.counts[i + 1:].sum() + self.over_count
+        tail_sum = (1 - frac) * self.sums[i] + self.sums[i + 1:].sum() + self.over_sum
+        es = tail_sum / tail_count if tail_count else var
+        return float(var), float(es)
+
+
+# ============================================================================
+# SIMULATION
+# ============================================================================
+
+_pools = {}                 # worker count -> ProcessPoolExecutor, reused across calls
+_pools_lock = threading.Lock()
+
+
+def _executor(workers: int) -> ProcessPoolExecutor:
+    """This process's pool of `workers` processes (started on first use)."""
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = _pools[workers] = ProcessPoolExecutor(max_workers=workers)
+        return pool
+
+
+def _discard_executor(workers: int, pool: ProcessPoolExecutor):
+    with _pools_lock:
+        if _pools.get(workers) is pool:
+            del _pools[workers]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def simulate_var(weights, mean, cov, value: float = 1.0, horizon: int = 1,
+                 confidence: float = 0.99, paths: int = 1_000_000,
+                 chunk_size: int = 100_000, seed: int = 42, workers: int = None,
+                 distribution: str = 'normal', dof: float = 5.0,
+                 bins: int = 20_000, loss_range: tuple = None, payoff=linear_payoff):
+    """
+    Stream Monte Carlo VaR / ES estimates as chunks complete.
+
+    Parameters:
+    -----------
+    weights : array-like
+        Portfolio weights (n_assets,)
+    mean : array-like
+        Per-period mean asset returns (n_assets,)
+    cov : array-like
+        Per-period covariance of asset returns (n_assets, n_assets)
+    value : float, optional
+        Portfolio value; VaR/ES are reported in the same units (default: 1)
+    horizon : int, optional
+        Horizon in periods, square-root-of-time scaling (default: 1)
+    confidence : float, optional
+        Confidence level (default: 0.99)
+    paths : int, optional
+        Total simulated paths (default: 1,000,000)
+    chunk_size : int, optional
+        Paths per chunk; bounds worker memory (default: 100,000)
+    seed : int, optional
+        Base seed; chunk i uses SeedSequence(seed, spawn_key=(i,))
+    workers : int, optional
+        Worker processes (default: CPU count; 0 = run in this process)
+    distribution : str, optional
+        'normal' or 't' (multivariate Student-t, unit variance)
+    dof : float, optional
+        Degrees of freedom for 't' (default: 5, must be > 2)
+    bins : int, optional
+        Loss-histogram resolution (default: 20,000)
+    loss_range : tuple, optional
+        (low, high) losses the histogram covers, in units of value
+        (default: +/-12 sigma around the mean loss, 30 for 't')
+    payoff : callable, optional
+        Module-level function (asset_returns, weights) -> portfolio returns
+
+    Yields:
+    -------
+    MonteCarloEstimate : after every completed chunk; the last one is final
+
+    Raises:
+    -------
+    ValueError : if the VaR quantile falls outside loss_range
+
+    Example:
+    --------
+    for est in simulate_var(w, mu, cov, value=1e6, paths=5_000_000):
+        progress.progress(est.fraction)
+    """
+    if distribution == 't' and dof <= 2:
+        raise ValueError("dof must be > 2 for a finite variance")
+    weights = np.asarray(weights, dtype=float)
+    mean = np.asarray(mean, dtype=float) * horizon
+    cov = np.asarray(cov, dtype=float) * horizon
+    chol = np.linalg.cholesky(cov)
+    edges = _loss_edges(mean, cov, weights, value, distribution, bins, loss_range)
+    hist = _LossHistogram(edges)
+
+    sizes = [min(chunk_size, paths - start) for start in range(0, paths, chunk_size)]
+    tasks = ((i, n, seed, mean, chol, weights, value, distribution, dof, edges, payoff)
+             for i, n in enumerate(sizes))
+
+    def estimate():
+        var, es = hist.var_es(confidence)
+        return MonteCarloEstimate(hist.n, paths, var, es)
+
+    workers = os.cpu_count() if workers is None else workers
+    if workers == 0:
+        for task in tasks:
+            hist.merge(_simulate_chunk(task), task[1])
+            yield estimate()
+        return
+
+    pool = _executor(workers)
+    # Keep at most two chunks per worker in flight to bound memory
+    pending = {}
+    try:
+        for task in tasks:
+            pending[pool.submit(_simulate_chunk, task)] = task[1]
+            if len(pending) >= 2 * workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    hist.merge(future.result(), pending.pop(future))
+                    yield estimate()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                hist.merge(future.result(), pending.pop(future))
+                yield estimate()
+    except BrokenProcessPool:
+        # A worker died (e.g. killed for memory): start a fresh pool next time
+        _discard_executor(workers, pool)
+        raise
+    finally:
+        # Abandoned early (e.g. a newer rerun): free the shared workers
+        for future in pending:
+            future.cancel()
+
+
+def run_var(*args, **kwargs) -> MonteCarloEstimate:
+    """Run simulate_var() to completion and return the final estimate."""
+    estimate = None
+    for estimate in simulate_var(*args, **kwargs):
+        pass
+    return estimate
+
+
+def parametric_check(weights, mean, cov, value: float = 1.0, horizon: int = 1,
+                     confidence: float = 0.99) -> tuple:
+    """Closed-form normal VaR / ES, to sanity-check a 'normal' simulation."""
+    weights = np.asarray(weights, dtype=float)
+    mu = float(np.asarray(mean) @ weights) * horizon
+    sigma = math.sqrt(float(weights @ np.asarray(cov) @ weights) * horizon)
+    normal = NormalDist()
+    z = normal.inv_cdf(confidence)
+    var = value * (sigma * z - mu)
+    es = value * (sigma * normal.pdf(z) / (1 - confidence) - mu)
+    return var, es
+
+
+# ============================================================================
+# STREAMLIT DISPLAY
+# ============================================================================
+
+def monte_carlo_var_panel(weights, mean, cov, label: str = "Monte Carlo VaR",
+                          value_format: str = "{:,.0f}", **kwargs) -> MonteCarloEstimate:
+    """
+    Run a simulation with a live progress bar and provisional metric cards.
+
+    Parameters:
+    -----------
+    weights, mean, cov :
+        As for simulate_var()
+    label : str, optional
+        Metric card label (default: "Monte Carlo VaR")
+    value_format : str, optional
+        Format for VaR/ES values (default: thousands separators)
+    **kwargs :
+        Passed to simulate_var()
+
+    Returns:
+    --------
+    MonteCarloEstimate : Final estimate
+    """
+    # Imported here so worker processes never import Streamlit
+    import streamlit as st
+    from components import metric_card
+
+    confidence = kwargs.get('confidence', 0.99)
+    progress = st.progress(0.0, text="Simulating...")
+    col1, col2 = st.columns(2)
+    var_slot, es_slot = col1.empty(), col2.empty()
+
+    estimate = None
+    for estimate in simulate_var(weights, mean, cov, **kwargs):
+        status = "provisional" if estimate.fraction < 1 else "final"
+        progress.progress(estimate.fraction,
+                          text=f"{estimate.paths_done:,} / {estimate.paths_total:,} paths")
+        with var_slot.container():
+            metric_card(f"{label} ({confidence:.0%})", value_format.format(estimate.var),
+                        f"{status}, {estimate.paths_done:,} paths")
+        with es_slot.container():
+            metric_card(f"Expected Shortfall ({confidence:.0%})", value_format.format(estimate.es),
+                        f"{status}, {estimate.paths_done:,} paths")
+    progress.empty()
+    return estimate
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    'MonteCarloEstimate',
+    'linear_payoff',
+    'simulate_var',
+    'run_var',
+    'parametric_check',
+    'monte_carlo_var_panel',
+]
@@ -0,0 +1,170 @@
+"""
+The Mountain Path - Streamlit Design Template
+Multipage Module: Lazy Multipage App Runner
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+Runs many apps as pages of one Streamlit process instead of one process
+per app. Pages are registered declaratively; the runner does
+set_page_config/apply_styles and renders the shared header, sidebar
+navigation and footer once per rerun, and imports a page's module only the
+first time somebody visits it.
+
+Because every page lives in the same process, the process-wide caches
+(chrome.py, data.py, loader.py, cache.MemoryCache) are shared by all
+pages - a dataset loaded on one page is already warm on the next.
+
+A page module exposes a render() function and must not call
+st.set_page_config() or apply_styles() itself.
+
+Usage:
+------
+from multipage import register_page, run
+
+register_page('overview', "Overview", 'app_pages.overview', icon="📊")
+register_page('risk', "Risk Dashboard", 'app_pages.risk_dashboard', icon="⚠️")
+run("Mountain Path Analytics")
+"""
+
+import importlib
+import time
+
+import streamlit as st
+
+from config import get_page_config
+from styles import apply_styles
+from components import header_container, sidebar_header, sidebar_section, footer
+
+# key -> page definition, in registration order
+PAGES = {}
+
+# module name -> seconds its first import took (pages visited so far)
+LOADED = {}
+
+_NAV_KEY = '_mp_page'
+
+
+# ============================================================================
+# REGISTRATION
+# ============================================================================
+
+def register_page(key: str, title: str, module: str, icon: str = "📄",
+                  subtitle: str = None, description: str = None,
+                  render: str = 'render'):
+    """
+    Register a page without importing it.
+
+    Parameters:
+    -----------
+    key : str
+        Unique page key
+    title : str
+        Navigation label and header title
+    module : str
+        Dotted module path containing the page (imported on first visit)
+    icon : str, optional
+        Emoji shown in the navigation (default: "📄")
+    subtitle : str, optional
+        Header subtitle for this page
+    description : str, optional
+        Header description for this page
+    render : str, optional
+        Name of the page function in the module (default: 'render')
+
+    Example:
+    --------
+    register_page('frontier', "Efficient Frontier", 'app_pages.frontier',
+                  icon="📈", subtitle="Mean-Variance Optimization")
+    """
+    page = {
+        'key': key,
+        'title': title,
+        'module': module,
+        'icon': icon,
+        'subtitle': subtitle,
+        'description': description,
+        'render': render,
+    }
+    # The entry script re-registers its pages on every rerun
+    if key in PAGES and PAGES[key] != page:
+        raise ValueError(f"Page {key!r} is already registered differently")
+    PAGES[key] = page
+
+
+def _load(page: dict):
+    """Import the page module on first use and return its render function."""
+    name = page['module']
+    if name not in LOADED:
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        LOADED[name] = time.perf_counter() - start
+    else:
+        module = importlib.import_module(name)  # already in sys.modules
+    return getattr(module, page['render'])
+
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+def current_page() -> str:
+    """Key of the page selected in this session."""
+    return st.session_state.get(_NAV_KEY) or next(iter(PAGES))
+
+
+def run(app_title: str, app_icon: str = "🏔️", sidebar_title: str = "NAVIGATION",
+        sidebar_subtitle: str = None, include_social: bool = True):
+    """
+    Render the shared chrome and the selected page.
+
+    Parameters:
+    -----------
+    app_title : str
+        Browser tab title and sidebar context
+    app_icon : str, optional
+        Page icon (default: "🏔️")
+    sidebar_title : str, optional
+        Sidebar header title (default: "NAVIGATION")
+    sidebar_subtitle : str, optional
+        Sidebar header subtitle
+    include_social : bool, optional
+        Include social links in the footer (default: True)
+    """
+    if not PAGES:
+        raise RuntimeError("No pages registered; call register_page() first")
+
+    st.set_page_config(**get_page_config(title=app_title, icon=app_icon))
+    apply_styles()
+
+    sidebar_header(sidebar_title, sidebar_subtitle)
+    sidebar_section("🧭 Pages")
+    keys = list(PAGES)
+    key = st.sidebar.radio(
+        "Page",
+        keys,
+        format_func=lambda k: f"{PAGES[k]['icon']} {PAGES[k]['title']}",
+        key=_NAV_KEY,
+        label_visibility='collapsed',
+    )
+    page = PAGES[key]
+
+    header_container(
+        title=page['title'],
+        subtitle=page['subtitle'],
+        description=page['description'],
+    )
+    _load(page)()
+    footer(include_social=include_social)
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    'PAGES',
+    'LOADED',
+    'register_page',
+    'current_page',
+    'run',
+]
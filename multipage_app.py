@@ -0,0 +1,31 @@
+"""
+The Mountain Path - Streamlit Design Template
+Multipage Example Application
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+Serves several pages from one process with shared chrome and caches.
+Page modules in app_pages/ are imported only when first visited.
+
+Run with: streamlit run multipage_app.py
+"""
+
+import prewarm_tasks  # noqa: F401 - declares the startup tasks
+from multipage import register_page, run
+from prewarm import start_prewarm
+
+# Populate the shared caches with each page's default data in the
+# background, so the first visitor after a restart doesn't wait for it
+start_prewarm()
+
+register_page('overview', "Overview", 'app_pages.overview', icon="📊",
+              subtitle="Brief Description of Your App",
+              description="Key Features | Capabilities | Methods")
+register_page('risk', "Risk Dashboard", 'app_pages.risk_dashboard', icon="⚠️",
+              subtitle="VaR, Expected Shortfall and Market Sensitivity",
+              description="Historical | Parametric | Cornish-Fisher")
+register_page('status', "Status", 'app_pages.status', icon="🩺",
+              subtitle="Cache Warm-Up and Readiness")
+
+run("Mountain Path Analytics", sidebar_title="ANALYTICS", sidebar_subtitle="Choose a page")
@@ -0,0 +1,294 @@
+"""
+The Mountain Path - Streamlit Design Template
+Persistent Cache Module: On-Disk Result Cache Shared by All Processes
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+A second cache tier below cache.MemoryCache that survives deploys and
+restarts. Results are pickled into one SQLite file (WAL mode), so several
+server processes on the same host can read and write it concurrently.
+- Keys cover the function, its arguments and its code version: editing a
+  cached function's source invalidates its old entries automatically.
+- The file is kept under a byte budget by evicting least-recently-used
+  entries; optional TTL per cache.
+- @persistent looks in memory first, then on disk (promoting hits into the
+  memory tier), and only then computes.
+
+Location and size come from config.CACHE ('disk_path', 'disk_max_bytes',
+'disk_ttl'); the path can be set with the MOUNTAIN_PATH_CACHE variable.
+
+Usage:
+------
+from persistent_cache import persistent
+
+@persistent()
+def fit_garch(returns_key: str, p: int = 1, q: int = 1):
+    ...
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import tracing
+from cache import CACHES, MemoryCache, make_key, sizeof, _copy
+from config import CACHE
+
+_MISSING = object()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key      TEXT PRIMARY KEY,
+    value    BLOB NOT NULL,
+    nbytes   INTEGER NOT NULL,
+    accessed REAL NOT NULL,
+    expires  REAL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+"""
+
+# Touch an entry's access time at most this often (seconds), so hot reads
+# do not turn into a write each
+_TOUCH_INTERVAL = 60.0
+
+
+class DiskCache:
+    """
+    LRU result cache in a SQLite file, safe across threads and processes.
+
+    Parameters:
+    -----------
+    path : str or Path
+        SQLite file (created with its directory if missing)
+    max_bytes : int, optional
+        Evict least-recently-used entries beyond this many bytes of values
+    ttl : float, optional
+        Seconds before an entry expires (default: never)
+    name : str, optional
+        Registry name in cache.CACHES (default: 'disk:<file name>')
+
+    Example:
+    --------
+    models = DiskCache('.cache/models.sqlite', max_bytes=2**30)
+    models.set(key, fitted)
+    fitted = models.get(key)
+    """
+
+    def __init__(self, path, max_bytes: int = None, ttl: float = None, name: str = None):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.name = name or f"disk:{self.path.name}"
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0}
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+        CACHES[self.name] = self
+
+    def _connect(self) -> sqlite3.Connection:
+        """One connection per thread and process (connections don't survive fork)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def get(self, key: str, default=None):
+        """Return the cached value for key, or default."""
+        conn = self._connect()
+        row = conn.execute("SELECT value, accessed, expires FROM entries WHERE key = ?",
+                           (key,)).fetchone()
+        now = time.time()
+        if row is not None and row[2] is not None and row[2] < now:
+            conn.execute("DELETE FROM entries WHERE key = ? AND expires < ?", (key, now))
+            self.stats['expirations'] += 1
+            row = None
+        if row is None:
+            self.stats['misses'] += 1
+            return default
+        try:
+            value = pickle.loads(row[0])
+        except Exception:
+            # Unreadable (e.g. class moved since it was stored): drop it
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self.stats['misses'] += 1
+            return default
+        if now - row[1] > _TOUCH_INTERVAL:
+            conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        self.stats['hits'] += 1
+        return value
+
+    def set(self, key: str, value, ttl: float = None) -> bool:
+        """
+        Store a value. Returns False if it can't be pickled or is larger
+        than the whole budget.
+        """
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return False
+        if self.max_bytes is not None and len(blob) > self.max_bytes:
+            return False
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                         (key, blob, len(blob), now, now + ttl if ttl is not None else None))
+            self._evict(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return True
+
+    def pop(self, key: str, default=None):
+        value = self.get(key, _MISSING)
+        self._connect().execute("DELETE FROM entries WHERE key = ?", (key,))
+        return default if value is _MISSING else value
+
+    def clear(self):
+        self._connect().execute("DELETE FROM entries")
+
+    def info(self) -> dict:
+        """Current size and this process's counters."""
+        entries, nbytes = self._connect().execute(
+            "SELECT COUNT(*), COALESCE(SUM(nbytes), 0) FROM entries").fetchone()
+        return {'entries': entries, 'bytes': nbytes, **self.stats}
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Inside the write transaction: drop expired, then LRU over budget."""
+        removed = conn.execute("DELETE FROM entries WHERE expires < ?", (time.time(),)).rowcount
+        self.stats['expirations'] += max(removed, 0)
+        if self.max_bytes is None:
+            return
+        total = conn.execute("SELECT COALESCE(SUM(nbytes), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        victims = []
+        for key, nbytes in conn.execute("SELECT key, nbytes FROM entries ORDER BY accessed"):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= nbytes
+        conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+        self.stats['evictions'] += len(victims)
+
+
+# ============================================================================
+# DEFAULT CACHE
+# ============================================================================
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_cache() -> DiskCache:
+    """The shared DiskCache configured in config.CACHE (opened on first use)."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = DiskCache(CACHE['disk_path'], max_bytes=CACHE['disk_max_bytes'],
+                                 ttl=CACHE['disk_ttl'], name='disk')
+        return _default
+
+
+def code_version(fn) -> str:
+    """Hash of a function's source (bytecode if the source is unavailable)."""
+    try:
+        source = inspect.getsource(fn).encode()
+    except (OSError, TypeError):
+        code = fn.__code__
+        source = code.co_code + repr(code.co_consts).encode()
+    return hashlib.blake2b(source, digest_size=8).hexdigest()
+
+
+# ============================================================================
+# DECORATOR
+# ============================================================================
+
+def persistent(disk: DiskCache = None, memory: MemoryCache = None, version: str = None,
+               ttl: float = None, copy: bool = True):
+    """
+    Cache a function's results in memory and on disk.
+
+    Parameters:
+    -----------
+    disk : DiskCache, optional
+        Disk tier (default: default_cache())
+    memory : MemoryCache, optional
+        Memory tier (default: a new cache named after the function, with
+        the data budget from config.CACHE)
+    version : str, optional
+        Code version in the key (default: hash of the function's source);
+        bump it when behaviour changes outside the function body
+    ttl : float, optional
+        Disk entry lifetime in seconds (default: the disk cache's TTL)
+    copy : bool, optional
+        Return copies of DataFrame/ndarray results (default: True)
+
+    Example:
+    --------
+    @persistent(version="2024-06")
+    def efficient_frontier(tickers: tuple, start: str, points: int = 50):
+        ...
+    """
+    def decorator(fn):
+        # Compare with None: an empty cache has len() 0 and is falsy
+        store = memory if memory is not None else MemoryCache(
+            f"{fn.__module__}.{fn.__qualname__}",
+            max_bytes=CACHE['data_max_bytes'], ttl=CACHE['data_ttl'])
+        signature = inspect.signature(fn)
+        fn_version = version or code_version(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = make_key(fn.__module__, fn.__qualname__, fn_version, bound.arguments)
+            value = store.get(key, _MISSING)
+            source = 'memory'
+            if value is _MISSING:
+                tier = disk if disk is not None else default_cache()
+                value = tier.get(key, _MISSING)
+                source = 'disk'
+                if value is _MISSING:
+                    value = fn(*args, **kwargs)
+                    tier.set(key, value, ttl=ttl)
+                    source = 'computed'
+                store.set(key, value)  # promote
+            if tracing.active():
+                tracing.annotate(hit=source != 'computed', tier=source, bytes=sizeof(value))
+            return _copy(value) if copy else value
+
+        wrapper.cache = store
+        wrapper.version = fn_version
+        wrapper.clear = store.clear
+        wrapper.durable = True  # results outlive the process (see prewarm.py)
+        return tracing.traced(wrapper, category='cache')
+    return decorator
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    'DiskCache',
+    'default_cache',
+    'code_version',
+    'persistent',
+]
@@ -0,0 +1,255 @@
+"""
+The Mountain Path - Streamlit Design Template
+Prewarm Module: Populate Caches at Server Start
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+Apps declare which cached calls to make before the first user arrives -
+the stylesheet and chrome, datasets, default models with the default
+sidebar parameters - and start_prewarm() runs them once per process in a
+background thread. Each task is timed; a failing task is logged and does
+not stop the others. wait_ready() lets a page (or a health check) wait
+until warming has finished.
+
+Streamlit has no server-start hook, so call start_prewarm() at the top of
+the app script: the first run starts the thread and later runs return
+immediately. Declare the tasks in a module of their own that does not run
+a page (see prewarm_tasks.py), so the deploy-time CLI can import it:
+
+    python prewarm.py prewarm_tasks
+
+The CLI runs only tasks whose results outlive the process - @persistent
+(disk tier) and @shared (shared memory) functions - and fails if there
+are none; in-memory caches are warmed by the server itself.
+
+Pages can wait for warming with wait_ready(); status() reports progress
+(see app_pages/status.py).
+
+Usage:
+------
+from prewarm import prewarm, start_prewarm
+
+prewarm('sample_returns', sample_returns, rows=750, assets=ASSETS, seed=42)
+prewarm('frontier', constrained_frontier, mu, cov, 4.0, max_weight=0.4)
+start_prewarm()
+"""
+
+import argparse
+import importlib
+import logging
+import os
+import sys
+import threading
+import time
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+
+class TaskTiming(NamedTuple):
+    """Outcome of one prewarm task."""
+    name: str
+    seconds: float
+    error: str = None
+
+
+# name -> (fn, args, kwargs), in declaration order
+TASKS = {}
+
+_lock = threading.Lock()
+_done = threading.Event()
+_state = {'status': 'idle', 'started': None, 'finished': None, 'timings': []}
+
+
+# ============================================================================
+# DECLARATION
+# ============================================================================
+
+def prewarm(name: str, fn, *args, **kwargs):
+    """
+    Declare a call to make at startup (re-declaring a name replaces it).
+
+    Parameters:
+    -----------
+    name : str
+        Task name, used in timings
+    fn : callable
+        Cached function to call, e.g. a @dataset provider or @persistent model
+    *args, **kwargs :
+        Arguments for the call - use the app's default sidebar values
+
+    Example:
+    --------
+    prewarm('risk_table', risk_metrics_table)
+    """
+    TASKS[name] = (fn, args, kwargs)
+
+
+def is_durable(fn) -> bool:
+    """True if fn caches results beyond this process (@persistent, @shared)."""
+    return getattr(fn, 'durable', False)
+
+
+def prewarm_chrome():
+    """Declare the shared stylesheet and page chrome (chrome.py) as tasks."""
+    import chrome
+
+    prewarm('stylesheet', chrome.stylesheet)
+    prewarm('footer', chrome.footer_html, True)
+    prewarm('footer_minimal', chrome.footer_html, False)
+
+
+# ============================================================================
+# RUNNING
+# ============================================================================
+
+def run_tasks(durable_only: bool = False) -> list:
+    """
+    Run the declared tasks in this thread.
+
+    Parameters:
+    -----------
+    durable_only : bool, optional
+        Only run tasks whose results outlive the process (default: False)
+
+    Returns:
+    --------
+    list of TaskTiming
+    """
+    timings = []
+    for name, (fn, args, kwargs) in list(TASKS.items()):
+        if durable_only and not is_durable(fn):
+            continue
+        start = time.perf_counter()
+        error = None
+        try:
+            fn(*args, **kwargs)
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            logger.exception("Prewarm task %s failed", name)
+        timing = TaskTiming(name, time.perf_counter() - start, error)
+        timings.append(timing)
+        logger.info("Prewarmed %s in %.3fs%s", name, timing.seconds,
+                    " (failed)" if error else "")
+    return timings
+
+
+def _run_background():
+    try:
+        _state['timings'] = run_tasks()
+        failed = any(t.error for t in _state['timings'])
+        _state['status'] = 'failed' if failed else 'done'
+    except BaseException:
+        _state['status'] = 'failed'
+        raise
+    finally:
+        _state['finished'] = time.time()
+        _done.set()
+        total = sum(t.seconds for t in _state['timings'])
+        logger.info("Prewarm %s: %d tasks in %.2fs", _state['status'],
+                    len(_state['timings']), total)
+
+
+def start_prewarm(include_chrome: bool = True) -> bool:
+    """
+    Start warming in a background thread, once per process.
+
+    Parameters:
+    -----------
+    include_chrome : bool, optional
+        Also warm the stylesheet and footer (default: True)
+
+    Returns:
+    --------
+    bool : True if this call started the thread
+    """
+    with _lock:
+        if _state['status'] != 'idle':
+            return False
+        if include_chrome:
+            prewarm_chrome()
+        _state['status'] = 'running'
+        _state['started'] = time.time()
+    thread = threading.Thread(target=_run_background, name='prewarm', daemon=True)
+    thread.start()
+    return True
+
+
+# ============================================================================
+# READINESS
+# ============================================================================
+
+def is_ready() -> bool:
+    """True once warming has finished (successfully or not)."""
+    return _done.is_set()
+
+
+def wait_ready(timeout: float = None) -> bool:
+    """
+    Block until warming has finished; False if the timeout ran out first.
+
+    Returns True immediately when no warming was started.
+    """
+    if _state['status'] == 'idle':
+        return True
+    return _done.wait(timeout)
+
+
+def status() -> dict:
+    """Readiness and per-task timings, e.g. for a health-check page or log."""
+    return {
+        'status': _state['status'],
+        'ready': is_ready(),
+        'started': _state['started'],
+        'finished': _state['finished'],
+        'seconds': sum(t.seconds for t in _state['timings']),
+        'tasks': [t._asdict() for t in _state['timings']],
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Fill the persistent caches with the tasks a module declares")
+    parser.add_argument('module', help="Module that declares its tasks with prewarm() "
+                                       "(not an app script: importing it must not run a page)")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, os.getcwd())
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+    importlib.import_module(args.module)
+    skipped = [name for name, (fn, _, _) in TASKS.items() if not is_durable(fn)]
+    if len(skipped) == len(TASKS):
+        print(f"{args.module} declares no @persistent or @shared tasks; "
+              "nothing would outlive this process", file=sys.stderr)
+        return 2
+    for name in skipped:
+        print(f"{name:<30}{'':>10}  skipped (in-memory cache)")
+    timings = run_tasks(durable_only=True)
+    for t in timings:
+        print(f"{t.name:<30}{t.seconds:>9.3f}s  {t.error or 'ok'}")
+    return 1 if any(t.error for t in timings) else 0
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    'TASKS',
+    'TaskTiming',
+    'prewarm',
+    'is_durable',
+    'prewarm_chrome',
+    'run_tasks',
+    'start_prewarm',
+    'is_ready',
+    'wait_ready',
+    'status',
+]
+
+
+if __name__ == '__main__':
+    # Task modules register with the importable 'prewarm' module, not
+    # __main__, so run the CLI from that module
+    import prewarm as _prewarm
+    sys.exit(_prewarm.main())
@@ -0,0 +1,25 @@
+"""
+The Mountain Path - Streamlit Design Template
+Prewarm Tasks for the Multipage Example
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+Declares the cached calls multipage_app.py warms at startup, using each
+page's default sidebar values. Kept apart from the app script, and free of
+page imports (pages load lazily), so it can be imported without running a
+page:
+
+    python prewarm.py prewarm_tasks     # at deploy time: fill the disk tier
+"""
+
+from data import sample_frame
+from prewarm import prewarm
+from risk_data import asset_returns, asset_risk_summary
+
+# In-memory datasets (warmed by the server process only)
+prewarm('overview_data', sample_frame, rows=10, seed=42)
+prewarm('risk_returns', asset_returns)
+
+# Persistent results (also filled by the deploy-time CLI)
+prewarm('risk_summary', asset_risk_summary, 0.95, 'historical')
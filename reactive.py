@@ -0,0 +1,210 @@
+"""
+The Mountain Path - Streamlit Design Template
+Reactive Module: Dependency Graph for Selective Recomputation
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+Streamlit reruns the whole script on every widget change. A ReactiveGraph
+lets a page declare its computations as nodes with explicit inputs (widget
+values or other nodes); on each rerun only nodes whose inputs changed are
+recomputed, and the others return the result kept from the previous rerun.
+View nodes render components; a clean view replays its captured component
+HTML instead of running again.
+
+Results are kept per session in st.session_state. Raw st.* output inside
+a view (st.write, st.line_chart, widgets, ...) can't be replayed: such a
+view is detected on its first run, logged, and from then on runs on every
+rerun - build views from components to get the savings.
+
+Usage:
+------
+graph = ReactiveGraph("risk")
+graph.input('confidence', confidence)
+graph.input('show_tables', show_tables)
+
+@graph.node(inputs=['confidence'])
+def summary(confidence):
+    return risk_summary(returns, confidence=confidence)
+
+@graph.view(inputs=['summary'])
+def cards(summary):
+    three_metric_row(metric_rows(summary)[0])
+
+graph.debug_panel()
+"""
+
+import logging
+import time
+from typing import NamedTuple
+
+import streamlit as st
+
+from cache import make_key
+from components import capture, replay, lazy_expander, display_dataframe, _raw_output
+
+logger = logging.getLogger(__name__)
+
+
+class NodeRun(NamedTuple):
+    """What happened to one node during this rerun."""
+    name: str
+    kind: str               # 'node' or 'view'
+    ran: bool
+    reason: str
+    seconds: float
+
+
+class ReactiveGraph:
+    """
+    Per-session dependency graph of inputs, computations and views.
+
+    Parameters:
+    -----------
+    key : str
+        Unique graph key (one graph per page)
+
+    Example:
+    --------
+    graph = ReactiveGraph("dashboard")
+    graph.input('show_charts', show_charts)
+
+    @graph.view(inputs=['show_charts'])
+    def charts(show_charts):
+        if show_charts:
+            display_figure(make_chart())
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+        self._state = st.session_state.setdefault(f"_mp_graph_{key}", {})
+        self._tokens = {}        # name -> token for this rerun
+        self._nodes = {}         # name -> (fn, inputs)
+        self.runs = []
+
+    # ------------------------------------------------------------------
+    # Declaration
+    # ------------------------------------------------------------------
+    def input(self, name: str, value):
+        """Declare a source value, e.g. a sidebar widget's current value."""
+        token = make_key(value)
+        self._tokens[name] = token
+        self._state.setdefault(name, {})['value'] = value
+        return value
+
+    def node(self, inputs=(), name: str = None):
+        """
+        Decorator declaring a computation; it runs on first access.
+
+        The function receives its inputs as keyword arguments named after
+        them. Access the result with graph[name].
+        """
+        def register(fn):
+            self._nodes[name or fn.__name__] = (fn, tuple(inputs))
+            return fn
+        return register
+
+    def view(self, inputs=(), name: str = None):
+        """
+        Decorator declaring a view and rendering it in place.
+
+        The view runs when one of its inputs changed; otherwise its
+        captured component output is replayed. A view that draws with st.*
+        directly runs on every rerun.
+        """
+        def register(fn):
+            self._render(name or fn.__name__, fn, tuple(inputs))
+            return fn
+        return register
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+    def __getitem__(self, name: str):
+        self._token(name)
+        return self._state[name]['value']
+
+    def _token(self, name: str) -> str:
+        if name not in self._tokens:
+            if name not in self._nodes:
+                raise KeyError(f"{name!r} is not an input or node of graph {self.key!r}")
+            fn, inputs = self._nodes[name]
+            self._evaluate(name, 'node', fn, inputs)
+        return self._tokens[name]
+
+    def _dirty(self, name: str, inputs: tuple) -> tuple:
+        """(input tokens, reason to run or None if clean)."""
+        tokens = {inp: self._token(inp) for inp in inputs}
+        stored = self._state.get(name)
+        if stored is None or 'inputs' not in stored:
+            return tokens, "first run"
+        changed = [inp for inp in inputs if stored['inputs'].get(inp) != tokens[inp]]
+        if changed:
+            return tokens, "changed: " + ", ".join(changed)
+        return tokens, None
+
+    def _evaluate(self, name: str, kind: str, fn, inputs: tuple):
+        tokens, reason = self._dirty(name, inputs)
+        start = time.perf_counter()
+        if reason is not None:
+            value = fn(**{inp: self[inp] for inp in inputs})
+            self._state[name] = {'inputs': tokens, 'value': value}
+        self._finish(name, kind, reason, start)
+        # Downstream nodes see a new token only when this node recomputed
+        self._tokens[name] = make_key(name, tokens)
+
+    def _render(self, name: str, fn, inputs: tuple):
+        tokens, reason = self._dirty(name, inputs)
+        if self._state.get(name, {}).get('raw'):
+            reason = "draws with st.*"
+        start = time.perf_counter()
+        box = st.container()
+        if reason is None:
+            with box:
+                replay(self._state[name]['items'])
+        else:
+            with box, capture(passthrough=True) as items:
+                fn(**{inp: self[inp] for inp in inputs})
+            raw = _raw_output(box, items)
+            if raw and not self._state.get(name, {}).get('raw'):
+                logger.warning("graph %s: view %r drew %d element(s) with st.* "
+                               "directly; it runs on every rerun instead of being "
+                               "replayed. Build views from components only.",
+                               self.key, name, raw)
+            self._state[name] = {'inputs': tokens, 'items': items, 'raw': bool(raw)}
+        self._finish(name, 'view', reason, start)
+
+    def _finish(self, name: str, kind: str, reason, start: float):
+        run = NodeRun(name, kind, reason is not None, reason or "clean",
+                      time.perf_counter() - start)
+        self.runs.append(run)
+        logger.debug("graph %s: %s %s (%s, %.1f ms)", self.key, kind, name,
+                     run.reason, run.seconds * 1000)
+
+    # ------------------------------------------------------------------
+    # Instrumentation
+    # ------------------------------------------------------------------
+    def report(self) -> list:
+        """This rerun's node runs as dicts (for tables or logging)."""
+        return [{'node': r.name, 'kind': r.kind, 'ran': r.ran, 'reason': r.reason,
+                 'ms': round(r.seconds * 1000, 2)} for r in self.runs]
+
+    def debug_panel(self, title: str = "🔍 Reactive graph"):
+        """Collapsible table of which nodes ran this rerun and why."""
+        runs = self.report()
+        ran = sum(r['ran'] for r in runs)
+        lazy_expander(f"{title} ({ran}/{len(runs)} ran)",
+                      lambda: display_dataframe(runs), key=f"_mp_graph_{self.key}")
+
+    def clear(self):
+        """Forget all stored results so every node runs again."""
+        self._state.clear()
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    'ReactiveGraph',
+    'NodeRun',
+]
@@ -0,0 +1,572 @@
+"""
+The Mountain Path - Streamlit Design Template
+Render Module: Component HTML as Plain Strings
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+Every HTML component has a pure render_* function here that returns its
+markup; the functions in components.py only send that markup to Streamlit.
+This module does not import streamlit, so the HTML can be built, cached,
+compared in tests or written to files by headless workers.
+
+Usage:
+------
+from render import render_metric_card, render_info_box
+
+html = render_metric_card("Portfolio VaR", "2.34%", "95% confidence level")
+"""
+
+from config import COLORS, BRANDING, FONTS, SPACING
+
+
+# ============================================================================
+# PAGE CHROME
+# ============================================================================
+
+def render_header(title: str, subtitle: str = None, description: str = None) -> str:
+    """Page header HTML. See components.header_container."""
+    subtitle_html = f"""
+        <p style="font-size:1rem; color:{COLORS['accent_gold']}; font-weight:600; margin:0.5rem 0;">
+            {subtitle}
+        </p>
+    """ if subtitle else ""
+    
+    description_html = f"""
+        <p style="font-size:0.85rem; color:{COLORS['text_primary']}; margin:0.3rem 0;">
+            {description}
+        </p>
+    """ if description else ""
+    
+    return f"""
+    <div class="header-container">
+        <h1>{BRANDING['icon']} {title}</h1>
+        {subtitle_html}
+        {description_html}
+        <p>{BRANDING['name']}</p>
+        <p style="font-size:0.8rem; color:{COLORS['text_secondary']};">
+            {BRANDING['instructor']} | {BRANDING['credentials']}
+        </p>
+    </div>
+    """
+
+
+def render_sidebar_header(title: str = "ANALYTICS", subtitle: str = None) -> str:
+    """Sidebar branding header HTML. See components.sidebar_header."""
+    subtitle_html = f"""
+        <p style="color:{COLORS['text_secondary']}; font-size:0.75rem; margin:5px 0 0;">
+            {subtitle}
+        </p>
+    """ if subtitle else ""
+    
+    return f"""
+    <div style="text-align:center; padding:1.2rem; background:rgba(255,215,0,0.08);
+         border-radius:10px; margin-bottom:1.5rem; border:2px solid {COLORS['accent_gold']};">
+        <h3 style="color:{COLORS['accent_gold']}; margin:0;">{BRANDING['icon']} {title}</h3>
+        {subtitle_html}
+    </div>
+    """
+
+
+def render_footer(include_social: bool = True) -> str:
+    """Footer HTML. See components.footer."""
+    social_html = ""
+    if include_social:
+        social_html = f"""
+        <div style="margin-top:1rem; padding-top:1rem; border-top:1px solid rgba(255,215,0,0.3);">
+            <p style="color:{COLORS['text_primary']}; font-size:0.9rem; margin:0.5rem 0;">
+                <a href="{BRANDING['linkedin']}" target="_blank" 
+                   style="color:{COLORS['accent_gold']}; text-decoration:none; margin:0 1rem;">
+                    🔗 LinkedIn Profile
+                </a>
+                <a href="{BRANDING['github']}" target="_blank" 
+                   style="color:{COLORS['accent_gold']}; text-decoration:none; margin:0 1rem;">
+                    💻 GitHub
+                </a>
+            </p>
+        </div>
+        """
+    
+    return f"""
+    <div style="text-align:center; padding:1.5rem;">
+        <p style="color:{COLORS['accent_gold']}; font-family:{FONTS['display']}; 
+                  font-weight:700; font-size:1.1rem; margin-bottom:0.5rem;">
+            {BRANDING['icon']} {BRANDING['name']}
+        </p>
+        <p style="color:{COLORS['text_secondary']}; font-size:0.85rem; margin:0.3rem 0;">
+            {BRANDING['instructor']} | {BRANDING['credentials']}
+        </p>
+        {social_html}
+    </div>
+    """
+
+
+# ============================================================================
+# HEADER COMPONENTS
+# ============================================================================
+
+def render_section_title(title: str) -> str:
+    """Section title HTML. See components.section_title."""
+    return f'<div class="section-title">{title}</div>'
+
+
+def render_sidebar_section(title: str) -> str:
+    """Sidebar section header HTML. See components.sidebar_section."""
+    return f"<p style='color:{COLORS['accent_gold']}; font-weight:700;'>{title}</p>"
+
+
+# ============================================================================
+# METRIC COMPONENTS
+# ============================================================================
+
+def render_metric_card(label: str, value: str, help_text: str = None) -> str:
+    """Metric card HTML. See components.metric_card."""
+    help_html = f' title="{help_text}"' if help_text else ''
+    
+    return f"""
+    <div class="metric-card"{help_html}>
+        <div class="label">{label}</div>
+        <div class="value">{value}</div>
+    </div>
+    """
+
+
+def render_metric_card_advanced(label: str, value: str, change: float = None,
+                                change_label: str = None) -> str:
+    """Metric card HTML with a change indicator. See components.metric_card_advanced."""
+    change_html = ""
+    if change is not None:
+        color = COLORS['success'] if change < 0 else COLORS['danger']
+        arrow = "↓" if change < 0 else "↑"
+        change_text = f"{arrow} {abs(change):.2f}%"
+        change_label_text = f" {change_label}" if change_label else ""
+        
+        change_html = f"""
+        <div style="color:{color}; font-size:0.9rem; margin-top:0.3rem;">
+            {change_text}{change_label_text}
+        </div>
+        """
+    
+    return f"""
+    <div class="metric-card">
+        <div class="label">{label}</div>
+        <div class="value">{value}</div>
+        {change_html}
+    </div>
+    """
+
+
+def render_metric_row(metrics: list) -> list:
+    """
+    Card HTML for up to three metrics. See components.three_metric_row.
+
+    Returns:
+    --------
+    list : One metric card string per column
+    """
+    return [render_metric_card(*metric_data[:3]) for metric_data in metrics[:3]]
+
+
+# ============================================================================
+# INFO COMPONENTS
+# ============================================================================
+
+def render_info_box(content: str, title: str = None) -> str:
+    """Information box HTML. See components.info_box."""
+    title_html = f"<h4 style='color:{COLORS['accent_gold']}; margin-top:0;'>{title}</h4>" if title else ""
+    
+    return f"""
+    <div class="info-box">
+        {title_html}
+        {content}
+    </div>
+    """
+
+
+def render_formula_box(formula: str, description: str = None) -> str:
+    """Formula box HTML. See components.formula_box."""
+    desc_html = f"<p style='margin-top:0.5rem; font-size:0.85rem;'>{description}</p>" if description else ""
+    
+    return f"""
+    <div class="formula-box">
+        <pre style="margin:0;">{formula}</pre>
+        {desc_html}
+    </div>
+    """
+
+
+def _status_box(color: str, symbol: str, message: str) -> str:
+    return f"""
+    <div class="info-box" style="border-color:{color};">
+        <span style="color:{color};">{symbol}</span> {message}
+    </div>
+    """
+
+
+def render_success_box(message: str) -> str:
+    """Success message HTML. See components.success_box."""
+    return _status_box(COLORS['success'], "✓", message)
+
+
+def render_warning_box(message: str) -> str:
+    """Warning message HTML. See components.warning_box."""
+    return _status_box(COLORS['warning'], "⚠", message)
+
+
+def render_error_box(message: str) -> str:
+    """Error message HTML. See components.error_box."""
+    return _status_box(COLORS['danger'], "✕", message)
+
+
+# ============================================================================
+# STYLESHEET
+# ============================================================================
+
+def render_stylesheet() -> str:
+    """The Mountain Path <style> block. See styles.apply_styles."""
+    return f"""
+    <style>
+        /* ============================================================
+           GOOGLE FONTS IMPORT
+           ============================================================ */
+        @import url('https://fonts.googleapis.com/css2?family=Playfair+Display:wght@600;700&family=Source+Sans+Pro:wght@300;400;600;700&display=swap');
+
+        /* ============================================================
+           MAIN APP BACKGROUND
+           ============================================================ */
+        .stApp {{
+            background: linear-gradient(135deg, {COLORS['gradient_start']} 0%, {COLORS['gradient_mid']} 50%, {COLORS['gradient_end']} 100%);
+        }}
+        
+        /* ============================================================
+           TEXT COLOR ENFORCEMENT - CRITICAL FOR READABILITY
+           ============================================================ */
+        /* Force ALL text in main area to be light */
+        .main {{
+            color: {COLORS['text_primary']} !important;
+        }}
+        
+        .main * {{
+            color: {COLORS['text_primary']} !important;
+        }}
+        
+        .main p, .main span, .main div, .main li, .main label {{
+            color: {COLORS['text_primary']} !important;
+        }}
+        
+        /* Headings in gold */
+        .main h1, .main h2, .main h3, .main h4, .main h5, .main h6 {{
+            color: {COLORS['accent_gold']} !important;
+            font-family: {FONTS['display']};
+        }}
+        
+        /* Markdown elements */
+        .stMarkdown, .stMarkdown p, .stMarkdown span, .stMarkdown div {{
+            color: {COLORS['text_primary']} !important;
+        }}
+        
+        /* Text elements */
+        [data-testid="stText"], [data-testid="stMarkdownContainer"] {{
+            color: {COLORS['text_primary']} !important;
+        }}
+
+        /* ============================================================
+           SIDEBAR STYLING
+           ============================================================ */
+        section[data-testid="stSidebar"] {{
+            background: linear-gradient(180deg, {COLORS['bg_dark']} 0%, {COLORS['dark_blue']} 100%);
+            border-right: 1px solid rgba(255,215,0,0.2);
+        }}
+
+        /* All sidebar text light colored */
+        section[data-testid="stSidebar"] label,
+        section[data-testid="stSidebar"] .stSlider label,
+        section[data-testid="stSidebar"] .stNumberInput label,
+        section[data-testid="stSidebar"] .stSelectbox label,
+        section[data-testid="stSidebar"] p,
+        section[data-testid="stSidebar"] span,
+        section[data-testid="stSidebar"] .stMarkdown p,
+        section[data-testid="stSidebar"] [data-testid="stWidgetLabel"] p,
+        section[data-testid="stSidebar"] [data-testid="stWidgetLabel"] label {{
+            color: {COLORS['text_primary']} !important;
+        }}
+
+        /* Sidebar input fields - keep dark text on white background */
+        section[data-testid="stSidebar"] input {{
+            color: {COLORS['text_dark']} !important;
+            background-color: #ffffff !important;
+        }}
+
+        /* ============================================================
+           HEADER CONTAINER
+           ============================================================ */
+        .header-container {{
+            background: linear-gradient(135deg, {COLORS['dark_blue']}, {COLORS['medium_blue']});
+            border: 2px solid {COLORS['accent_gold']};
+            border-radius: {SPACING['border_radius']};
+            padding: {SPACING['header_padding']};
+            margin-bottom: {SPACING['section_margin']};
+            text-align: center;
+        }}
+        
+        .header-container h1 {{
+            font-family: {FONTS['display']};
+            color: {COLORS['accent_gold']};
+            margin: 0;
+            font-size: 2rem;
+        }}
+        
+        .header-container p {{
+            color: {COLORS['text_primary']};
+            font-family: {FONTS['body']};
+            margin: 0.3rem 0 0;
+            font-size: 0.9rem;
+        }}
+
+        /* ============================================================
+           METRIC CARDS
+           ============================================================ */
+        .metric-card {{
+            background: {COLORS['card_bg']};
+            border: 1px solid rgba(255,215,0,0.3);
+            border-radius: {SPACING['border_radius']};
+            padding: {SPACING['card_padding']};
+            text-align: center;
+            margin-bottom: 0.8rem;
+        }}
+        
+        .metric-card .label {{
+            color: {COLORS['text_secondary']};
+            font-size: 0.8rem;
+            text-transform: uppercase;
+            letter-spacing: 1px;
+            font-family: {FONTS['body']};
+        }}
+        
+        .metric-card .value {{
+            color: {COLORS['accent_gold']};
+            font-size: 1.6rem;
+            font-weight: 700;
+            font-family: {FONTS['display']};
+            margin-top: 0.3rem;
+        }}
+
+        /* ============================================================
+           INFO BOX
+           ============================================================ */
+        .info-box {{
+            background: rgba(0,51,102,0.5);
+            border: 1px solid {COLORS['accent_gold']};
+            border-radius: {SPACING['border_radius_small']};
+            padding: 1rem 1.5rem;
+            font-family: {FONTS['body']};
+            color: {COLORS['text_primary']};
+            margin: 0.8rem 0;
+        }}
+        
+        .info-box h3, .info-box h4 {{
+            color: {COLORS['accent_gold']} !important;
+            margin-top: 0;
+        }}
+        
+        .info-box ul {{
+            margin: 0.5rem 0;
+            padding-left: 1.5rem;
+        }}
+        
+        .info-box li {{
+            margin: 0.3rem 0;
+        }}
+
+        /* ============================================================
+           SECTION TITLE
+           ============================================================ */
+        .section-title {{
+            font-family: {FONTS['display']};
+            color: {COLORS['accent_gold']};
+            font-size: 1.3rem;
+            border-bottom: 2px solid rgba(255,215,0,0.3);
+            padding-bottom: 0.5rem;
+            margin: {SPACING['section_margin']} 0 1rem;
+        }}
+
+        /* ============================================================
+           FORMULA BOX
+           ============================================================ */
+        .formula-box {{
+            background: rgba(0,51,102,0.5);
+            border: 1px solid {COLORS['accent_gold']};
+            border-radius: {SPACING['border_radius_small']};
+            padding: 1rem 1.5rem;
+            font-family: {FONTS['code']};
+            color: {COLORS['text_primary']};
+            margin: 0.8rem 0;
+        }}
+
+        /* ============================================================
+           TABS STYLING
+           ============================================================ */
+        .stTabs [data-baseweb="tab-list"] {{
+            gap: 8px;
+        }}
+        
+        .stTabs [data-baseweb="tab"] {{
+            background: {COLORS['card_bg']};
+            border: 1px solid rgba(255,215,0,0.3);
+            border-radius: {SPACING['border_radius_small']};
+            color: {COLORS['text_primary']};
+            font-family: {FONTS['body']};
+            padding: 0.5rem 1rem;
+        }}
+        
+        .stTabs [aria-selected="true"] {{
+            background: {COLORS['dark_blue']};
+            border: 2px solid {COLORS['accent_gold']};
+            color: {COLORS['accent_gold']};
+        }}
+
+        /* ============================================================
+           DATA TABLES
+           ============================================================ */
+        div[data-testid="stDataFrame"] {{
+            border: 1px solid rgba(255,215,0,0.2);
+            border-radius: {SPACING['border_radius_small']};
+        }}
+        
+        /* ============================================================
+           ALERT BOXES - Keep dark text for readability
+           ============================================================ */
+        .stAlert {{
+            background-color: rgba(255, 255, 255, 0.95) !important;
+        }}
+        
+        .stAlert p, .stAlert span, .stAlert div {{
+            color: {COLORS['text_dark']} !important;
+        }}
+        
+        /* ============================================================
+           CODE BLOCKS
+           ============================================================ */
+        .stCodeBlock {{
+            background: rgba(20, 30, 48, 0.8) !important;
+            border: 1px solid rgba(255,215,0,0.2);
+        }}
+        
+        .stCodeBlock code {{
+            color: {COLORS['text_primary']} !important;
+            background: transparent !important;
+        }}
+        
+        pre {{
+            background: rgba(20, 30, 48, 0.8) !important;
+            color: {COLORS['text_primary']} !important;
+        }}
+
+        /* ============================================================
+           BUTTONS
+           ============================================================ */
+        .stButton > button {{
+            background: {COLORS['dark_blue']};
+            color: {COLORS['text_primary']};
+            border: 1px solid {COLORS['accent_gold']};
+            border-radius: {SPACING['border_radius_small']};
+            font-family: {FONTS['body']};
+            transition: all 0.3s ease;
+        }}
+        
+        .stButton > button:hover {{
+            background: {COLORS['medium_blue']};
+            border-color: {COLORS['accent_gold']};
+            transform: translateY(-2px);
+        }}
+
+        /* ============================================================
+           DIVIDERS
+           ============================================================ */
+        hr {{
+            border: none;
+            border-top: 1px solid rgba(255,215,0,0.3);
+            margin: {SPACING['section_margin']} 0;
+        }}
+
+        /* ============================================================
+           FOOTER
+           ============================================================ */
+        footer {{
+            visibility: hidden;
+        }}
+
+        /* ============================================================
+           EXPANDER
+           ============================================================ */
+        .streamlit-expanderHeader {{
+            background: {COLORS['card_bg']};
+            border: 1px solid rgba(255,215,0,0.3);
+            border-radius: {SPACING['border_radius_small']};
+            color: {COLORS['text_primary']};
+        }}
+
+        /* ============================================================
+           DOWNLOAD BUTTON
+           ============================================================ */
+        .stDownloadButton > button {{
+            background: {COLORS['dark_blue']};
+            color: {COLORS['text_primary']};
+            border: 1px solid {COLORS['accent_gold']};
+        }}
+        
+        .stDownloadButton > button:hover {{
+            background: {COLORS['medium_blue']};
+        }}
+
+        /* ============================================================
+           FILE UPLOADER
+           ============================================================ */
+        [data-testid="stFileUploader"] {{
+            background: {COLORS['card_bg']};
+            border: 1px solid rgba(255,215,0,0.3);
+            border-radius: {SPACING['border_radius_small']};
+            padding: 1rem;
+        }}
+
+        /* ============================================================
+           METRICS (Streamlit Native)
+           ============================================================ */
+        [data-testid="stMetricValue"] {{
+            color: {COLORS['accent_gold']} !important;
+            font-family: {FONTS['display']};
+        }}
+        
+        [data-testid="stMetricLabel"] {{
+            color: {COLORS['text_secondary']} !important;
+        }}
+    </style>
+    """
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    # Page chrome
+    'render_header',
+    'render_sidebar_header',
+    'render_footer',
+    'render_stylesheet',
+    
+    # Headers
+    'render_section_title',
+    'render_sidebar_section',
+    
+    # Metrics
+    'render_metric_card',
+    'render_metric_card_advanced',
+    'render_metric_row',
+    
+    # Info boxes
+    'render_info_box',
+    'render_formula_box',
+    'render_success_box',
+    'render_warning_box',
+    'render_error_box',
+]
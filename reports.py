@@ -0,0 +1,327 @@
+"""
+The Mountain Path - Streamlit Design Template
+Reports Module: Parallel Batch Report Generation
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+Renders branded per-client reports to static HTML without driving the
+Streamlit app: each report spec is turned into the same HTML the
+components would send (render.py) and assembled with export.to_html().
+Reports are spread over a process pool; the stylesheet and footer are
+compiled once in the parent and handed to every worker, so a worker only
+renders what differs between clients.
+
+A report spec is a plain (picklable / JSON) dict:
+
+    {
+        'filename': 'acme.html',                     # optional, no directories
+        'title': "Acme Capital - Daily Risk",
+        'subtitle': "As of 2024-06-28",              # optional
+        'description': "Equity | Credit | FX",       # optional
+        'metrics': [                                  # rows of up to 3 metrics
+            [["VaR (95%)", "2.34%", "1-day"], ["ES", "3.12%"], ["Vol", "18.5%"]],
+        ],
+        'tables': [{'title': "📊 Positions", 'data': {...}, 'caption': "..."}],
+        'charts': [{'title': "📈 NAV", 'kind': 'line', 'x': [...],
+                    'series': {'Portfolio': [...], 'Benchmark': [...]}}],
+    }
+
+Table data is anything pd.DataFrame() accepts (dict of columns, list of
+records). Chart kinds: 'line' and 'bar'.
+
+Usage:
+------
+python reports.py specs.json reports/ --workers 8 --print
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+from config import COLORS
+from render import (
+    render_stylesheet, render_header, render_footer,
+    render_section_title, render_metric_row, render_info_box,
+)
+from export import to_html, write_atomic
+
+# Extra rules for PDF-ready output (browser "Print to PDF", WeasyPrint, ...)
+PRINT_CSS = """
+    @page { size: A4; margin: 12mm; }
+    body { -webkit-print-color-adjust: exact; print-color-adjust: exact; }
+    main.main { max-width: none; padding: 0; }
+    .mp-row, .metric-card, .mp-table-wrap, .mp-figure, .info-box { break-inside: avoid; }
+    .section-title { break-after: avoid; }
+    .mp-table-wrap { overflow: visible; }
+"""
+
+SERIES_COLORS = [COLORS['accent_gold'], COLORS['light_blue'], COLORS['success'],
+                 COLORS['danger'], COLORS['info'], COLORS['text_secondary']]
+
+# Per-process templates, set by _init_worker (or lazily in this process)
+_TEMPLATES = {}
+
+
+class BatchResult(NamedTuple):
+    """Outcome of generate_reports()."""
+    paths: list
+    failures: dict          # filename -> error message
+    seconds: float
+    workers: int
+
+    @property
+    def reports(self) -> int:
+        return len(self.paths)
+
+    @property
+    def reports_per_second(self) -> float:
+        return self.reports / self.seconds if self.seconds else 0.0
+
+
+# ============================================================================
+# TEMPLATES
+# ============================================================================
+
+def compile_templates(pdf_ready: bool = False) -> dict:
+    """
+    Build the parts every report shares, once.
+
+    Returns:
+    --------
+    dict : stylesheet, footer HTML and extra CSS
+    """
+    return {
+        'stylesheet': render_stylesheet(),
+        'footer': render_footer(include_social=False),
+        'extra_css': PRINT_CSS if pdf_ready else "",
+    }
+
+
+def _init_worker(templates: dict):
+    """Process-pool initializer: install the shared templates."""
+    _TEMPLATES.update(templates)
+
+
+# ============================================================================
+# RENDERING ONE REPORT
+# ============================================================================
+
+def _chart_png(chart: dict) -> bytes:
+    import io
+    import matplotlib
+    matplotlib.use('Agg')  # workers are headless
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=chart.get('figsize', (10, 4)))
+    series = chart['series']
+    x = chart.get('x')
+    kind = chart.get('kind', 'line')
+    try:
+        for i, (label, values) in enumerate(series.items()):
+            color = SERIES_COLORS[i % len(SERIES_COLORS)]
+            xs = x if x is not None else range(len(values))
+            if kind == 'line':
+                ax.plot(xs, values, label=label, color=color, linewidth=2)
+            elif kind == 'bar':
+                width = 0.8 / len(series)
+                positions = [j + (i - (len(series) - 1) / 2) * width for j in range(len(values))]
+                ax.bar(positions, values, width=width, label=label, color=color)
+                ax.set_xticks(range(len(values)))
+                if x is not None:
+                    ax.set_xticklabels(x)
+            else:
+                raise ValueError(f"Unknown chart kind: {kind!r}")
+        if chart.get('xlabel'):
+            ax.set_xlabel(chart['xlabel'])
+        if chart.get('ylabel'):
+            ax.set_ylabel(chart['ylabel'])
+        if len(series) > 1:
+            ax.legend()
+        ax.grid(True, alpha=0.3)
+        fig.tight_layout()
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', dpi=chart.get('dpi', 110))
+        return buffer.getvalue()
+    finally:
+        plt.close(fig)
+
+
+def build_items(spec: dict, templates: dict = None) -> list:
+    """
+    Turn a report spec into captured-page items (see components.capture).
+
+    Parameters:
+    -----------
+    spec : dict
+        Report spec (see module docstring)
+    templates : dict, optional
+        Output of compile_templates() (default: this process's templates)
+    """
+    templates = templates or _templates()
+    items = [('html', render_header(spec['title'], spec.get('subtitle'),
+                                    spec.get('description')), False)]
+    for row in spec.get('metrics', []):
+        items.append(('row', render_metric_row([tuple(m) for m in row]), False))
+    if spec.get('notes'):
+        items.append(('html', render_info_box(spec['notes'], spec.get('notes_title')), False))
+    for table in spec.get('tables', []):
+        if table.get('title'):
+            items.append(('html', render_section_title(table['title']), False))
+        items.append(('dataframe', table['data'], False))
+        if table.get('caption'):
+            items.append(('caption', table['caption'], False))
+    for chart in spec.get('charts', []):
+        if chart.get('title'):
+            items.append(('html', render_section_title(chart['title']), False))
+        items.append(('figure', _chart_png(chart), False))
+        if chart.get('caption'):
+            items.append(('caption', chart['caption'], False))
+    items.append(('divider', None, False))
+    items.append(('html', templates['footer'], False))
+    return items
+
+
+def _templates() -> dict:
+    if not _TEMPLATES:
+        _init_worker(compile_templates())
+    return _TEMPLATES
+
+
+def render_report(spec: dict, templates: dict = None) -> str:
+    """
+    Render one report spec to a self-contained HTML document.
+
+    Example:
+    --------
+    html = render_report({'title': "Acme Capital", 'metrics': [rows[0]]})
+    """
+    templates = templates or _templates()
+    items = build_items(spec, templates)
+    return to_html(items, spec['title'], extra_css=templates['extra_css'],
+                   stylesheet=templates['stylesheet'])
+
+
+def report_filename(spec: dict) -> str:
+    """
+    Output file name: spec['filename'] or a slug of the title.
+
+    Specs may come from an untrusted JSON file, so a filename with a
+    directory part (or '..') is rejected rather than written outside
+    the output directory.
+    """
+    name = spec.get('filename')
+    if name:
+        name = str(name)
+        if name != Path(name).name or name in ('.', '..') or '\\' in name:
+            raise ValueError(f"Report filename must be a plain file name: {name!r}")
+        return name
+    slug = re.sub(r'[^a-z0-9]+', '-', spec['title'].lower()).strip('-')
+    return f"{slug or 'report'}.html"
+
+
+def _write_report(task: tuple) -> tuple:
+    """Render and write one report (runs in a worker)."""
+    spec, path = task
+    try:
+        write_atomic(path, render_report(spec))
+        return path, None
+    except Exception as exc:
+        return path, f"{type(exc).__name__}: {exc}"
+
+
+# ============================================================================
+# BATCH
+# ============================================================================
+
+def generate_reports(specs: list, out_dir, workers: int = None, pdf_ready: bool = False,
+                     chunksize: int = 4) -> BatchResult:
+    """
+    Render many report specs to HTML files in parallel.
+
+    Parameters:
+    -----------
+    specs : list of dict
+        Report specs (see module docstring)
+    out_dir : str or Path
+        Directory for the HTML files
+    workers : int, optional
+        Worker processes (default: CPU count; 0 = run in this process)
+    pdf_ready : bool, optional
+        Add print rules (A4 pages, no breaks inside cards, tables, charts)
+    chunksize : int, optional
+        Specs handed to a worker at a time (default: 4)
+
+    Returns:
+    --------
+    BatchResult : written paths, failures, elapsed seconds, reports_per_second
+
+    Example:
+    --------
+    result = generate_reports(client_specs, "reports/", pdf_ready=True)
+    print(f"{result.reports_per_second:.1f} reports/s")
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tasks = [(spec, out_dir / report_filename(spec)) for spec in specs]
+    if len({path for _, path in tasks}) != len(tasks):
+        raise ValueError("Report specs map to duplicate file names")
+    templates = compile_templates(pdf_ready)
+
+    workers = os.cpu_count() if workers is None else workers
+    start = time.perf_counter()
+    if workers == 0:
+        _init_worker(templates)
+        results = [_write_report(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(templates,)) as pool:
+            results = list(pool.map(_write_report, tasks, chunksize=chunksize))
+    seconds = time.perf_counter() - start
+
+    paths = [path for path, error in results if error is None]
+    failures = {path.name: error for path, error in results if error is not None}
+    return BatchResult(paths, failures, seconds, workers)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Render report specs to branded HTML")
+    parser.add_argument('specs', type=Path, help="JSON file with a list of report specs")
+    parser.add_argument('out_dir', type=Path)
+    parser.add_argument('--workers', type=int, help="Worker processes (0 = in-process)")
+    parser.add_argument('--print', dest='pdf_ready', action='store_true',
+                        help="Add print rules for PDF conversion")
+    parser.add_argument('--chunksize', type=int, default=4)
+    args = parser.parse_args(argv)
+
+    specs = json.loads(args.specs.read_text())
+    result = generate_reports(specs, args.out_dir, args.workers, args.pdf_ready, args.chunksize)
+    print(f"{result.reports} reports in {result.seconds:.2f}s "
+          f"({result.reports_per_second:.1f} reports/s, {result.workers} workers)")
+    for name, error in result.failures.items():
+        print(f"FAILED {name}: {error}", file=sys.stderr)
+    return 1 if result.failures else 0
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    'BatchResult',
+    'PRINT_CSS',
+    'compile_templates',
+    'build_items',
+    'render_report',
+    'report_filename',
+    'generate_reports',
+]
+
+
+if __name__ == '__main__':
+    sys.exit(main())
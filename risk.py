@@ -0,0 +1,302 @@
+"""
+The Mountain Path - Streamlit Design Template
+Risk Module: Vectorized Risk Metrics
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+Computes VaR, Expected Shortfall, volatility, Sharpe, beta, alpha and R²
+for many portfolios at once. Every function takes a returns array of shape
+(portfolios, periods) - or a single series of shape (periods,) - and
+returns one value per portfolio, computed with NumPy along the time axis
+instead of a Python loop per portfolio.
+
+Conventions:
+- returns are simple periodic (e.g. daily) returns
+- VaR and ES are positive loss fractions of portfolio value
+- volatility, Sharpe and alpha are annualized with `periods` per year
+"""
+
+from statistics import NormalDist
+
+import numpy as np
+
+_NORMAL = NormalDist()
+
+# Tail grid used to integrate the Cornish-Fisher quantile for ES
+_CF_ES_POINTS = 256
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def _as_2d(returns) -> np.ndarray:
+    r = np.asarray(returns, dtype=float)
+    return r[np.newaxis, :] if r.ndim == 1 else r
+
+
+def _moments(r: np.ndarray) -> tuple:
+    """Mean, sample std, skewness and excess kurtosis per row."""
+    mean = r.mean(axis=1)
+    dev = r - mean[:, np.newaxis]
+    m2 = np.mean(dev ** 2, axis=1)
+    m3 = np.mean(dev ** 3, axis=1)
+    m4 = np.mean(dev ** 4, axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        skew = np.where(m2 > 0, m3 / m2 ** 1.5, 0.0)
+        kurt = np.where(m2 > 0, m4 / m2 ** 2 - 3.0, 0.0)
+    std = r.std(axis=1, ddof=1)
+    return mean, std, skew, kurt
+
+
+def _cornish_fisher(z, skew, kurt):
+    """Cornish-Fisher adjusted quantile; z broadcasts against skew/kurt."""
+    return (z
+            + (z ** 2 - 1) * skew / 6
+            + (z ** 3 - 3 * z) * kurt / 24
+            - (2 * z ** 3 - 5 * z) * skew ** 2 / 36)
+
+
+# ============================================================================
+# VALUE AT RISK / EXPECTED SHORTFALL
+# ============================================================================
+
+def historical_var(returns, confidence: float = 0.95) -> np.ndarray:
+    """
+    Historical-simulation VaR per portfolio.
+
+    Parameters:
+    -----------
+    returns : array-like
+        Returns of shape (portfolios, periods) or (periods,)
+    confidence : float, optional
+        Confidence level (default: 0.95)
+
+    Returns:
+    --------
+    np.ndarray : VaR per portfolio (positive = loss)
+    """
+    return -np.quantile(_as_2d(returns), 1 - confidence, axis=1)
+
+
+def historical_es(returns, confidence: float = 0.95) -> np.ndarray:
+    """Historical Expected Shortfall: mean of the worst (1 - confidence) returns."""
+    r = _as_2d(returns)
+    k = max(1, int(np.ceil((1 - confidence) * r.shape[1])))
+    worst = np.partition(r, k - 1, axis=1)[:, :k]  # O(T) selection, no full sort
+    return -worst.mean(axis=1)
+
+
+def parametric_var(returns, confidence: float = 0.95) -> np.ndarray:
+    """Normal (variance-covariance) VaR: -(μ + σ·z)."""
+    mean, std, _, _ = _moments(_as_2d(returns))
+    z = _NORMAL.inv_cdf(1 - confidence)
+    return -(mean + z * std)
+
+
+def parametric_es(returns, confidence: float = 0.95) -> np.ndarray:
+    """Normal Expected Shortfall: -(μ - σ·φ(z) / (1 - confidence))."""
+    mean, std, _, _ = _moments(_as_2d(returns))
+    z = _NORMAL.inv_cdf(1 - confidence)
+    return -(mean - std * _NORMAL.pdf(z) / (1 - confidence))
+
+
+def cornish_fisher_var(returns, confidence: float = 0.95) -> np.ndarray:
+    """Modified VaR with the Cornish-Fisher skewness/kurtosis adjustment."""
+    mean, std, skew, kurt = _moments(_as_2d(returns))
+    z = _NORMAL.inv_cdf(1 - confidence)
+    return -(mean + _cornish_fisher(z, skew, kurt) * std)
+
+
+def cornish_fisher_es(returns, confidence: float = 0.95) -> np.ndarray:
+    """
+    Modified Expected Shortfall: the Cornish-Fisher quantile averaged over
+    the tail (midpoint rule on a fixed grid of tail probabilities).
+    """
+    mean, std, skew, kurt = _moments(_as_2d(returns))
+    tail = 1 - confidence
+    probs = tail * (np.arange(_CF_ES_POINTS) + 0.5) / _CF_ES_POINTS
+    z = np.array([_NORMAL.inv_cdf(p) for p in probs])
+    zcf = _cornish_fisher(z[np.newaxis, :], skew[:, np.newaxis], kurt[:, np.newaxis])
+    return -(mean + std * zcf.mean(axis=1))
+
+
+VAR_METHODS = {
+    'historical': (historical_var, historical_es),
+    'parametric': (parametric_var, parametric_es),
+    'cornish_fisher': (cornish_fisher_var, cornish_fisher_es),
+}
+
+
+# ============================================================================
+# RETURN / RISK RATIOS
+# ============================================================================
+
+def volatility(returns, periods: int = 252) -> np.ndarray:
+    """Annualized volatility per portfolio."""
+    return _as_2d(returns).std(axis=1, ddof=1) * np.sqrt(periods)
+
+
+def sharpe_ratio(returns, risk_free: float = 0.0, periods: int = 252) -> np.ndarray:
+    """Annualized Sharpe ratio; risk_free is an annual rate."""
+    r = _as_2d(returns)
+    excess = r.mean(axis=1) * periods - risk_free
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return excess / volatility(r, periods)
+
+
+def beta_alpha_r2(returns, benchmark, risk_free: float = 0.0,
+                  periods: int = 252) -> tuple:
+    """
+    Regression statistics of each portfolio against one benchmark.
+
+    Parameters:
+    -----------
+    returns : array-like
+        Returns of shape (portfolios, periods) or (periods,)
+    benchmark : array-like
+        Benchmark returns of shape (periods,)
+    risk_free : float, optional
+        Annual risk-free rate (default: 0)
+    periods : int, optional
+        Periods per year (default: 252)
+
+    Returns:
+    --------
+    tuple : (beta, alpha, r_squared) arrays; alpha is annualized (Jensen's)
+    """
+    r = _as_2d(returns)
+    b = np.asarray(benchmark, dtype=float)
+    n = r.shape[1]
+    r_dev = r - r.mean(axis=1, keepdims=True)
+    b_dev = b - b.mean()
+    cov = r_dev @ b_dev / (n - 1)                 # one matrix-vector product
+    var_b = b_dev @ b_dev / (n - 1)
+    var_r = np.einsum('ij,ij->i', r_dev, r_dev) / (n - 1)
+    rf = risk_free / periods
+    with np.errstate(divide='ignore', invalid='ignore'):
+        beta = cov / var_b
+        alpha = (r.mean(axis=1) - rf - beta * (b.mean() - rf)) * periods
+        r_squared = cov ** 2 / (var_r * var_b)
+    return beta, alpha, r_squared
+
+
+# ============================================================================
+# SUMMARY FOR METRIC CARDS
+# ============================================================================
+
+def risk_summary(returns, benchmark=None, confidence: float = 0.95,
+                 method: str = 'historical', risk_free: float = 0.0,
+                 periods: int = 252) -> dict:
+    """
+    Compute every metric for every portfolio in one pass.
+
+    Parameters:
+    -----------
+    returns : array-like or pd.DataFrame
+        Returns of shape (portfolios, periods) or (periods,). A DataFrame
+        is read as periods × portfolios (one column per portfolio).
+    benchmark : array-like, optional
+        Benchmark returns for beta / alpha / R²
+    confidence : float, optional
+        VaR / ES confidence level (default: 0.95)
+    method : str, optional
+        'historical', 'parametric' or 'cornish_fisher'
+    risk_free : float, optional
+        Annual risk-free rate (default: 0)
+    periods : int, optional
+        Periods per year (default: 252)
+
+    Returns:
+    --------
+    dict : metric name -> np.ndarray with one value per portfolio
+
+    Example:
+    --------
+    summary = risk_summary(returns_df, benchmark=market, method='cornish_fisher')
+    three_metric_row(metric_rows(summary, 0)[0])
+    """
+    if hasattr(returns, 'to_numpy'):
+        returns = returns.to_numpy().T
+    r = _as_2d(returns)
+    var_fn, es_fn = VAR_METHODS[method]
+    summary = {
+        'var': var_fn(r, confidence),
+        'es': es_fn(r, confidence),
+        'volatility': volatility(r, periods),
+        'sharpe': sharpe_ratio(r, risk_free, periods),
+        'confidence': confidence,
+        'method': method,
+    }
+    if benchmark is not None:
+        summary['beta'], summary['alpha'], summary['r_squared'] = beta_alpha_r2(
+            r, benchmark, risk_free, periods
+        )
+    return summary
+
+
+def metric_rows(summary: dict, index: int = 0) -> list:
+    """
+    Format one portfolio's metrics as rows for three_metric_row().
+
+    Parameters:
+    -----------
+    summary : dict
+        Output of risk_summary()
+    index : int, optional
+        Portfolio index (default: 0)
+
+    Returns:
+    --------
+    list : Rows of (label, value, help_text) tuples, up to three per row,
+           balanced (no row left with a single card)
+
+    Example:
+    --------
+    for row in metric_rows(summary, index=selected):
+        three_metric_row(row)
+    """
+    level = f"{summary['confidence']:.0%}"
+    method = summary['method'].replace('_', '-').title()
+    cards = [
+        (f"VaR ({level})", f"{summary['var'][index]:.2%}", f"{method}, 1-period"),
+        (f"ES ({level})", f"{summary['es'][index]:.2%}", "Expected Shortfall"),
+        ("Volatility", f"{summary['volatility'][index]:.1%}", "Annualized"),
+        ("Sharpe Ratio", f"{summary['sharpe'][index]:.2f}", "Annualized, excess of risk-free"),
+    ]
+    if 'beta' in summary:
+        # R² qualifies beta, so it rides on the beta card: two full rows
+        cards += [
+            ("Alpha", f"{summary['alpha'][index]:.2%}", "Annualized excess return"),
+            ("Beta", f"{summary['beta'][index]:.2f}",
+             f"Market sensitivity, R² {summary['r_squared'][index]:.2f}"),
+        ]
+    # Spread cards evenly over as few rows as possible (4 -> 2+2, not 3+1)
+    n_rows = -(-len(cards) // 3)
+    size, extra = divmod(len(cards), n_rows)
+    rows, start = [], 0
+    for r in range(n_rows):
+        stop = start + size + (r < extra)
+        rows.append(cards[start:stop])
+        start = stop
+    return rows
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    'historical_var',
+    'historical_es',
+    'parametric_var',
+    'parametric_es',
+    'cornish_fisher_var',
+    'cornish_fisher_es',
+    'VAR_METHODS',
+    'volatility',
+    'sharpe_ratio',
+    'beta_alpha_r2',
+    'risk_summary',
+    'metric_rows',
+]
@@ -0,0 +1,55 @@
+"""
+The Mountain Path - Streamlit Design Template
+Risk Data Module: Cached Inputs and Results for the Risk Dashboard
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+The risk dashboard's data lives here rather than in app_pages/, so the
+startup warm-up (prewarm_tasks.py) and the deploy-time CLI can fill its
+caches without importing the page module - pages stay lazily imported.
+"""
+
+from data import sample_returns
+from persistent_cache import persistent
+from risk import risk_summary
+
+ASSETS = ('Equity', 'Bonds', 'Commodities')
+
+
+def asset_returns():
+    """Simulated daily returns of ASSETS (cached in data.DATA_CACHE)."""
+    return sample_returns(rows=750, assets=ASSETS, seed=42)
+
+
+# Shared by all sessions and kept on disk across restarts; bump the version
+# when risk.py's calculations change
+@persistent(version="risk-1")
+def asset_risk_summary(confidence: float, method: str) -> dict:
+    """
+    Risk summary of every asset against an equal-weight market.
+
+    Parameters:
+    -----------
+    confidence : float
+        VaR / ES confidence level, e.g. 0.95
+    method : str
+        'historical', 'parametric' or 'cornish_fisher'
+
+    Returns:
+    --------
+    dict : risk.risk_summary() result
+    """
+    returns = asset_returns()
+    market = returns.mean(axis=1).to_numpy()
+    return risk_summary(returns, benchmark=market, confidence=confidence, method=method)
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    'ASSETS',
+    'asset_returns',
+    'asset_risk_summary',
+]
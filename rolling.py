@@ -0,0 +1,268 @@
+"""
+The Mountain Path - Streamlit Design Template
+Rolling Module: Incremental Statistics for Streaming Returns
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+Each new return updates the statistics in constant time instead of
+recomputing them over the whole window:
+- mean / variance: sliding-window Welford update
+- rolling max / min: monotonic deques
+- drawdown: running log-wealth against its rolling peak, including the
+  wealth at the start of the window
+- exponentially weighted mean / variance: EWM recursion
+
+Window values live in a compact array('d') ring buffer (8 bytes per value),
+so a live dashboard can keep one tracker per metric card and refresh dozens
+of them per second.
+"""
+
+import math
+from array import array
+from collections import deque
+
+# Rebuild the sliding sums from the buffer every this many full windows to
+# stop floating-point drift from accumulating over very long streams
+_RESYNC_WINDOWS = 64
+
+
+class RollingStats:
+    """
+    Fixed-window rolling statistics with O(1) updates.
+
+    Parameters:
+    -----------
+    window : int
+        Number of most recent observations to keep
+    periods : int, optional
+        Periods per year, for annualized volatility (default: 252)
+
+    Example:
+    --------
+    stats = RollingStats(window=60)
+    for r in new_returns:
+        stats.update(r)
+    metric_card("60d Volatility", f"{stats.volatility:.1%}")
+    """
+
+    def __init__(self, window: int, periods: int = 252):
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        self.window = window
+        self.periods = periods
+        self._buffer = array('d', [0.0]) * window
+        self._ticks = 0          # total observations seen
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._max = deque()      # (tick, value), values decreasing
+        self._min = deque()      # (tick, value), values increasing
+        # (k, log wealth after k observations), decreasing; starts at entry level 0
+        self._peak = deque([(0, 0.0)])
+        self._cum_log = 0.0
+        self.last = math.nan
+
+    # ------------------------------------------------------------------
+    # Update
+    # ------------------------------------------------------------------
+    def update(self, x: float) -> 'RollingStats':
+        """Add one observation (e.g. a daily return) in O(1) amortized time."""
+        x = float(x)
+        tick = self._ticks
+        slot = tick % self.window
+
+        if tick < self.window:
+            # Growing phase: standard Welford
+            n = tick + 1
+            delta = x - self._mean
+            self._mean += delta / n
+            self._m2 += delta * (x - self._mean)
+        else:
+            # Sliding phase: replace the oldest value
+            old = self._buffer[slot]
+            old_mean = self._mean
+            self._mean += (x - old) / self.window
+            self._m2 += (x - old) * (x - self._mean + old - old_mean)
+            if self._m2 < 0.0:
+                self._m2 = 0.0
+
+        self._buffer[slot] = x
+        self._cum_log += math.log1p(x) if x > -1.0 else -math.inf
+        self._ticks = tick + 1
+        self.last = x
+
+        expired = self._ticks - self.window  # ticks below this have left
+        _push(self._max, tick, x, expired, keep_larger=True)
+        _push(self._min, tick, x, expired, keep_larger=False)
+        # Levels k >= expired: the window's entry level and every level after it
+        _push(self._peak, self._ticks, self._cum_log, expired, keep_larger=True)
+
+        if self._ticks % (self.window * _RESYNC_WINDOWS) == 0:
+            self._resync()
+        return self
+
+    def update_many(self, values) -> 'RollingStats':
+        """Add several observations in order."""
+        for x in values:
+            self.update(x)
+        return self
+
+    def _resync(self):
+        values = self.values()
+        n = len(values)
+        self._mean = sum(values) / n
+        self._m2 = sum((v - self._mean) ** 2 for v in values)
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+    @property
+    def count(self) -> int:
+        """Observations currently in the window."""
+        return min(self._ticks, self.window)
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self._ticks else math.nan
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (ddof=1) of the window."""
+        n = self.count
+        return self._m2 / (n - 1) if n > 1 else math.nan
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance) if self.count > 1 else math.nan
+
+    @property
+    def volatility(self) -> float:
+        """Annualized standard deviation."""
+        return self.std * math.sqrt(self.periods)
+
+    @property
+    def max(self) -> float:
+        return self._max[0][1] if self._max else math.nan
+
+    @property
+    def min(self) -> float:
+        return self._min[0][1] if self._min else math.nan
+
+    @property
+    def drawdown(self) -> float:
+        """
+        Current drawdown from the highest wealth since the start of the
+        window, counting the wealth at entry (0.0 at a new high, -0.1 = 10%
+        below the peak).
+        """
+        if not self._ticks:
+            return math.nan
+        return math.expm1(self._cum_log - self._peak[0][1])
+
+    def values(self) -> list:
+        """Window contents, oldest first (O(window); for display, not updates)."""
+        n = self.count
+        start = self._ticks - n
+        return [self._buffer[(start + i) % self.window] for i in range(n)]
+
+    def snapshot(self) -> dict:
+        """All statistics as a dict, e.g. to feed several metric cards."""
+        return {
+            'count': self.count,
+            'last': self.last,
+            'mean': self.mean,
+            'std': self.std,
+            'volatility': self.volatility,
+            'max': self.max,
+            'min': self.min,
+            'drawdown': self.drawdown,
+        }
+
+
+def _push(dq: deque, tick: int, value: float, expired: int, keep_larger: bool):
+    """Monotonic-deque update: O(1) amortized rolling max (or min)."""
+    if keep_larger:
+        while dq and dq[-1][1] <= value:
+            dq.pop()
+    else:
+        while dq and dq[-1][1] >= value:
+            dq.pop()
+    dq.append((tick, value))
+    while dq[0][0] < expired:
+        dq.popleft()
+
+
+class EWMStats:
+    """
+    Exponentially weighted mean and variance with O(1) updates.
+
+    Parameters:
+    -----------
+    halflife : float, optional
+        Observations for a weight to halve (e.g. 30)
+    alpha : float, optional
+        Smoothing factor in (0, 1]; use instead of halflife
+        (RiskMetrics daily volatility: alpha=0.06, i.e. lambda=0.94)
+    periods : int, optional
+        Periods per year, for annualized volatility (default: 252)
+
+    Example:
+    --------
+    ewm = EWMStats(alpha=0.06)
+    ewm.update(r)
+    metric_card("EWMA Vol", f"{ewm.volatility:.1%}")
+    """
+
+    def __init__(self, halflife: float = None, alpha: float = None, periods: int = 252):
+        if (halflife is None) == (alpha is None):
+            raise ValueError("pass exactly one of halflife or alpha")
+        self.alpha = alpha if alpha is not None else 1 - math.exp(math.log(0.5) / halflife)
+        if not 0 < self.alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.periods = periods
+        self.count = 0
+        self._mean = 0.0
+        self._var = 0.0
+
+    def update(self, x: float) -> 'EWMStats':
+        x = float(x)
+        if self.count == 0:
+            self._mean = x
+        else:
+            diff = x - self._mean
+            incr = self.alpha * diff
+            self._mean += incr
+            self._var = (1 - self.alpha) * (self._var + diff * incr)
+        self.count += 1
+        return self
+
+    def update_many(self, values) -> 'EWMStats':
+        for x in values:
+            self.update(x)
+        return self
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self.count else math.nan
+
+    @property
+    def variance(self) -> float:
+        return self._var if self.count > 1 else math.nan
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance) if self.count > 1 else math.nan
+
+    @property
+    def volatility(self) -> float:
+        """Annualized EWMA volatility."""
+        return self.std * math.sqrt(self.periods)
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    'RollingStats',
+    'EWMStats',
+]
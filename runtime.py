@@ -0,0 +1,127 @@
+"""
+The Mountain Path - Streamlit Design Template
+Runtime Module: Session and Process Information
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+Small helpers shared by the instrumentation modules (metrics.py,
+tracing.py): which session and page the current thread is running, when
+its script run ends, and how much memory the process holds. All of them
+work, with fallbacks, outside a Streamlit script run.
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# ScriptRunnerEvent names that end a script run (st.stop and uncaught
+# exceptions end "with success"; a newer rerun ends it "for rerun")
+_RUN_ENDED = frozenset({
+    'SCRIPT_STOPPED_WITH_SUCCESS',
+    'SCRIPT_STOPPED_WITH_COMPILE_ERROR',
+    'SCRIPT_STOPPED_FOR_RERUN',
+})
+
+
+def _script_ctx():
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return None
+    return get_script_run_ctx(suppress_warning=True)
+
+
+def session_id() -> str:
+    """ID of the session whose script run is on this thread ('-' if none)."""
+    ctx = _script_ctx()
+    return ctx.session_id if ctx is not None else '-'
+
+
+def page_name() -> str:
+    """
+    Name of the page being rendered: the multipage key if multipage.run()
+    is used, else the main script's file name without extension.
+    """
+    ctx = _script_ctx()
+    if ctx is None:
+        return '-'
+    import streamlit as st
+
+    page = st.session_state.get('_mp_page')
+    if page:
+        return str(page)
+    script = getattr(ctx, 'main_script_path', None)
+    return Path(script).stem if script else 'app'
+
+
+def _script_runner():
+    """The ScriptRunner driving this thread, or None."""
+    # The script thread's target is the runner's bound _run_script_thread
+    target = getattr(threading.current_thread(), '_target', None)
+    runner = getattr(target, '__self__', None)
+    return runner if hasattr(getattr(runner, 'on_event', None), 'connect') else None
+
+
+def on_script_finished(callback) -> bool:
+    """
+    Call callback() once when the current script run ends, however it ends
+    (end of script, st.stop, an exception, interrupted by a newer rerun).
+
+    Hooks the Streamlit ScriptRunner's own run events, so it does not rely
+    on the script reaching any particular line. The callback runs on the
+    script thread; exceptions it raises are logged, not propagated.
+
+    Returns:
+    --------
+    bool : False if this thread is not running a script (nothing hooked)
+
+    Example:
+    --------
+    start = time.perf_counter()
+    on_script_finished(lambda: log_latency(time.perf_counter() - start))
+    """
+    runner = _script_runner()
+    if runner is None:
+        return False
+
+    def handler(sender, event=None, **kwargs):
+        if getattr(event, 'name', None) not in _RUN_ENDED:
+            return
+        runner.on_event.disconnect(handler)
+        try:
+            callback()
+        except Exception:
+            logger.exception("Script-finished callback failed")
+
+    runner.on_event.connect(handler, weak=False)
+    return True
+
+
+def rss_bytes(pid: int = None) -> int:
+    """Resident memory of a process (default: this one), psutil or /proc."""
+    pid = pid or os.getpid()
+    try:
+        import psutil
+        return psutil.Process(pid).memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open(f'/proc/{pid}/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        return 0
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    'session_id',
+    'page_name',
+    'on_script_finished',
+    'rss_bytes',
+]
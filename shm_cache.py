@@ -0,0 +1,363 @@
+"""
+The Mountain Path - Streamlit Design Template
+Shared Memory Cache Module: One Copy of Large Results per Host
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+Several Streamlit processes on one host each keep their own copy of every
+cached dataset. SharedStore writes large immutable results once, as files
+in a RAM-backed directory (/dev/shm where available), and every process
+memory-maps them instead of holding a private copy:
+- ndarrays are mapped directly (read-only, zero-copy)
+- DataFrames and Arrow tables are stored as Arrow IPC and mapped
+  zero-copy; DataFrames are rebuilt with to_pandas(split_blocks=True),
+  which shares numeric columns without nulls with the mapping
+- bytes (e.g. PNG charts) are returned as read-only memoryviews
+Other types raise TypeError: nothing is ever unpickled from the store, so
+a file planted in it can at worst be rejected, not executed.
+
+Files are written to a temporary name and renamed into place, so readers
+never see partial data and concurrent writers of the same key are safe.
+The directory is kept under a byte budget by removing least-recently-used
+files; processes that already mapped a removed file keep a valid mapping.
+The store is just a local directory, so tests can point it at a temp dir.
+The default directory is per user (mode 0700); SharedStore refuses a
+directory that is a symlink, owned by someone else, or group/world
+writable.
+
+Usage:
+------
+from shm_cache import shared
+
+@shared()
+def price_history(universe: str, start: str) -> pd.DataFrame:
+    ...
+"""
+
+import functools
+import inspect
+import json
+import mmap
+import os
+import stat
+import struct
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+from cache import MemoryCache, make_key
+from config import CACHE
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+except ImportError:  # pragma: no cover - pyarrow ships with Streamlit
+    pa = None
+
+_MISSING = object()
+_MAGIC = b'MPSHM1'
+_PREFIX = struct.Struct('<6sxcI')      # magic, kind, header length
+_ALIGN = 64
+_TOUCH_INTERVAL = 60.0
+
+
+def _uid():
+    return os.getuid() if hasattr(os, 'getuid') else None
+
+
+def default_dir() -> Path:
+    """
+    config.CACHE['shm_dir'], else /dev/shm/mountain_path-<uid>, else a
+    per-user temp dir.
+    """
+    if CACHE['shm_dir']:
+        return Path(CACHE['shm_dir'])
+    suffix = f"-{_uid()}" if _uid() is not None else ''
+    if os.path.isdir('/dev/shm'):
+        return Path(f'/dev/shm/mountain_path{suffix}')
+    return Path(tempfile.gettempdir()) / f'mountain_path_shm{suffix}'
+
+
+def _private_dir(root: Path) -> Path:
+    """Create root (mode 0700) and check no other user can plant files in it."""
+    root.mkdir(mode=0o700, parents=True, exist_ok=True)
+    info = os.lstat(root)
+    if stat.S_ISLNK(info.st_mode) or not stat.S_ISDIR(info.st_mode):
+        raise PermissionError(f"shared cache directory {root} is not a plain directory")
+    if _uid() is not None and info.st_uid != _uid():
+        raise PermissionError(f"shared cache directory {root} is owned by uid "
+                              f"{info.st_uid}, not {_uid()}")
+    if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(f"shared cache directory {root} is group or world "
+                              f"writable (mode {stat.S_IMODE(info.st_mode):o})")
+    return root
+
+
+# ============================================================================
+# ENCODING
+# ============================================================================
+
+def _encode(value) -> tuple:
+    """(kind, header dict, payload buffer) for a value."""
+    if isinstance(value, np.ndarray) and not value.dtype.hasobject:
+        array = np.ascontiguousarray(value)
+        return b'n', {'dtype': array.dtype.str, 'shape': array.shape}, array.data
+    if pa is not None and isinstance(value, pa.Table):
+        return b'a', {'pandas': False}, _arrow_bytes(value)
+    if pa is not None and hasattr(value, 'columns') and hasattr(value, 'to_numpy'):
+        try:
+            table = pa.Table.from_pandas(value, preserve_index=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError) as exc:
+            raise TypeError(f"DataFrame has columns Arrow can't store: {exc}") from exc
+        return b'a', {'pandas': True}, _arrow_bytes(table)
+    if isinstance(value, (bytes, bytearray)):
+        return b'b', {}, value
+    raise TypeError("SharedStore stores ndarrays, DataFrames, Arrow tables and "
+                    f"bytes, not {type(value).__name__}")
+
+
+def _arrow_bytes(table):
+    sink = pa.BufferOutputStream()
+    with pa_ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def _decode(mapped: mmap.mmap):
+    """Attach to a mapped file without copying where the type allows."""
+    magic, kind, header_len = _PREFIX.unpack_from(mapped, 0)
+    if magic != _MAGIC:
+        raise ValueError("not a shared cache file")
+    header = json.loads(mapped[_PREFIX.size:_PREFIX.size + header_len])
+    offset = header['offset']
+    if kind == b'n':
+        dtype = np.dtype(header['dtype'])
+        count = int(np.prod(header['shape'], dtype=np.int64))
+        return np.frombuffer(mapped, dtype=dtype, count=count,
+                             offset=offset).reshape(header['shape'])
+    if kind == b'a':
+        buffer = pa.py_buffer(mapped).slice(offset, header['size'])
+        table = pa_ipc.open_file(buffer).read_all()
+        return table.to_pandas(split_blocks=True) if header['pandas'] else table
+    if kind == b'b':
+        return memoryview(mapped)[offset:offset + header['size']].toreadonly()
+    raise ValueError(f"unknown shared cache entry kind {kind!r}")
+
+
+# ============================================================================
+# STORE
+# ============================================================================
+
+class SharedStore:
+    """
+    Host-wide store of immutable results in memory-mapped files.
+
+    Parameters:
+    -----------
+    root : str or Path, optional
+        Directory for the files (default: default_dir()); must be owned
+        by this user and not group/world writable
+    max_bytes : int, optional
+        Remove least-recently-used files beyond this many bytes
+        (default: config.CACHE['shm_max_bytes'])
+    attached : int, optional
+        Mappings this process keeps open for fast repeat reads (default: 256)
+
+    Example:
+    --------
+    store = SharedStore()
+    store.put(key, returns_df)
+    df = store.get(key)        # mapped, not copied, in every process
+    """
+
+    def __init__(self, root=None, max_bytes: int = None, attached: int = 256):
+        self.root = _private_dir(Path(root) if root is not None else default_dir())
+        self.max_bytes = CACHE['shm_max_bytes'] if max_bytes is None else max_bytes
+        self.stats = {'hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0}
+        self._attached = MemoryCache(f"shm:{self.root}", max_entries=attached,
+                                     register=False)
+        self._touched = {}
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.mpshm"
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._attached or self._path(key).exists()
+
+    def get(self, key: str, default=None):
+        """Return the (mapped) value for key, or default."""
+        value = self._attached.get(key, _MISSING)
+        if value is _MISSING:
+            try:
+                with open(self._path(key), 'rb') as f:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                value = _decode(mapped)
+            except (FileNotFoundError, ValueError, struct.error):
+                self.stats['misses'] += 1
+                return default
+            self._attached.set(key, value, nbytes=0)
+        self._touch(key)
+        self.stats['hits'] += 1
+        return value
+
+    def put(self, key: str, value) -> bool:
+        """
+        Store value under key unless it already exists (values are immutable).
+
+        Raises TypeError for types the store can't map (see module docstring).
+
+        Returns:
+        --------
+        bool : True if this call wrote the file
+        """
+        path = self._path(key)
+        if path.exists():
+            return False
+        kind, header, payload = _encode(value)
+        size = memoryview(payload).nbytes
+        header['size'] = size
+        # Offset depends on the header length, which includes the offset
+        header['offset'] = 0
+        while True:
+            encoded = json.dumps(header).encode()
+            offset = -(-(_PREFIX.size + len(encoded)) // _ALIGN) * _ALIGN
+            if header['offset'] == offset:
+                break
+            header['offset'] = offset
+        if size > self.max_bytes:
+            return False
+
+        fd, tmp = tempfile.mkstemp(dir=self.root, prefix='.tmp-', suffix='.mpshm')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_PREFIX.pack(_MAGIC, kind, len(encoded)))
+                f.write(encoded)
+                f.write(b'\0' * (offset - _PREFIX.size - len(encoded)))
+                f.write(payload)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        self.stats['writes'] += 1
+        self._evict()
+        return True
+
+    def _touch(self, key: str):
+        """Mark key as recently used (at most once a minute per process)."""
+        now = time.time()
+        if now - self._touched.get(key, 0.0) < _TOUCH_INTERVAL:
+            return
+        self._touched[key] = now
+        try:
+            os.utime(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        with self._lock:
+            files = []
+            for entry in os.scandir(self.root):
+                if entry.name.endswith('.mpshm') and not entry.name.startswith('.tmp-'):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+            total = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.unlink(path)  # existing mappings stay valid
+                except FileNotFoundError:
+                    pass
+                total -= size
+                self.stats['evictions'] += 1
+
+    def clear(self):
+        """Remove every file (mappings held by processes stay valid)."""
+        self._attached.clear()
+        for path in self.root.glob('*.mpshm'):
+            path.unlink(missing_ok=True)
+
+    def info(self) -> dict:
+        files = list(self.root.glob('*.mpshm'))
+        return {'entries': len(files), 'bytes': sum(p.stat().st_size for p in files),
+                'attached': len(self._attached), **self.stats}
+
+
+# ============================================================================
+# DECORATOR
+# ============================================================================
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_store() -> SharedStore:
+    """The process's SharedStore on default_dir() (created on first use)."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = SharedStore()
+        return _default
+
+
+def shared(store: SharedStore = None):
+    """
+    Cache a function's (large, immutable) results once per host.
+
+    The first process to compute a result writes it; every process,
+    including that one, then uses the memory-mapped copy. Results are
+    read-only - copy before modifying. Results must be ndarrays,
+    DataFrames, Arrow tables or bytes.
+
+    Parameters:
+    -----------
+    store : SharedStore, optional
+        Store to use (default: default_store())
+
+    Example:
+    --------
+    @shared()
+    def factor_returns(model: str, start: str) -> pd.DataFrame:
+        ...
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = make_key(fn.__module__, fn.__qualname__, bound.arguments)
+            target = store or default_store()
+            value = target.get(key, _MISSING)
+            if value is _MISSING:
+                value = fn(*args, **kwargs)
+                target.put(key, value)
+                # Serve the mapped copy so this process's private one can be freed
+                value = target.get(key, value)
+            return value
+
+        wrapper.store = lambda: store or default_store()
+        wrapper.durable = True  # results outlive the process (see prewarm.py)
+        return wrapper
+    return decorator
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    'SharedStore',
+    'default_dir',
+    'default_store',
+    'shared',
+]
@@ -0,0 +1,69 @@
+"""
+The Mountain Path - Streamlit Design Template
+Snapshots Module: Example Pages for Static Export
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+Page functions built from components only, so export.py can render them
+to static HTML without a Streamlit session:
+
+    python export.py snapshots:daily_report static/daily.html --every 86400
+
+Copy daily_report() as the starting point for your own snapshot pages.
+"""
+
+import matplotlib.pyplot as plt
+
+from components import (
+    header_container, section_title, three_metric_row,
+    display_dataframe, display_figure, footer,
+)
+from config import COLORS
+from risk import metric_rows
+from risk_data import ASSETS, asset_returns, asset_risk_summary
+
+
+def daily_report(confidence: float = 0.95, method: str = 'historical'):
+    """
+    Daily risk report of the sample assets: metric cards per asset, a
+    cumulative-returns chart and the latest returns.
+
+    Parameters:
+    -----------
+    confidence : float, optional
+        VaR / ES confidence level (default: 0.95)
+    method : str, optional
+        VaR method (default: 'historical')
+
+    Example:
+    --------
+    export_page(daily_report, "static/daily.html", title="Daily Risk Report")
+    """
+    returns = asset_returns()
+    summary = asset_risk_summary(confidence, method)
+
+    header_container("Daily Risk Report", subtitle="Sample Assets",
+                     description=" | ".join(ASSETS))
+    for i, asset in enumerate(ASSETS):
+        section_title(f"⚠️ {asset}")
+        for row in metric_rows(summary, i):
+            three_metric_row(row)
+
+    fig, ax = plt.subplots(figsize=(10, 4))
+    palette = [COLORS['accent_gold'], COLORS['light_blue'], COLORS['success']]
+    for asset, color in zip(ASSETS, palette):
+        ax.plot((1 + returns[asset]).cumprod().to_numpy(), color=color, linewidth=1.5,
+                label=asset)
+    ax.legend()
+    display_figure(fig, title="📈 Cumulative Returns")
+    display_dataframe(returns.tail(10), title="📋 Latest Returns")
+    footer()
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    'daily_report',
+]
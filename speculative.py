@@ -0,0 +1,245 @@
+"""
+The Mountain Path - Streamlit Design Template
+Speculative Module: Precompute Neighbouring Slider Values
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+Users sweep sensitivity sliders one step at a time. @speculative memoizes
+a sidebar-driven computation per session and, once the session has been
+idle for a moment after the current request, computes the results for the
+next slider positions in a small background thread pool - first in the
+direction the user is moving - so the next step is usually a cache hit.
+
+- Only the slider that changed since the last call is explored; the other
+  arguments stay fixed.
+- Speculation starts config.CACHE['speculative_delay'] seconds after the
+  last call; a call before then (the next rerun) cancels it, so it never
+  competes with a rerun that follows straight away.
+- Results of every @speculative function in a session share one LRU,
+  capped at config.CACHE['session_max_bytes'] per session; the pool size
+  is config.CACHE['speculative_workers'].
+- Speculative work not yet started is cancelled when the user moves on.
+
+The function must be thread-safe and must not call st.* (it may run in a
+pool thread).
+
+Usage:
+------
+@speculative(sliders={'confidence': (0.90, 0.99, 0.01), 'horizon': (1, 30, 1)})
+def scenario_var(confidence: float, horizon: int, method: str = 'historical'):
+    ...
+"""
+
+import functools
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from cache import MemoryCache, make_key, _copy
+from config import CACHE
+
+_MISSING = object()
+
+_pool = None
+_pool_lock = threading.Lock()
+
+# Used when called outside a Streamlit session (scripts, tests)
+_fallback_state = {}
+
+_RESULTS_STATE = '_mp_speculative_results'
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=CACHE['speculative_workers'],
+                                       thread_name_prefix='speculative')
+        return _pool
+
+
+def _session_state() -> dict:
+    """st.session_state in a script run, else a module-level dict."""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        import streamlit as st
+    except ImportError:
+        return _fallback_state
+    return (st.session_state if get_script_run_ctx(suppress_warning=True) is not None
+            else _fallback_state)
+
+
+def _snap(value, lo, hi, step):
+    """Nearest slider position to value (None if outside [lo, hi])."""
+    position = lo + round((value - lo) / step) * step
+    if position < lo - step / 2 or position > hi + step / 2:
+        return None
+    if all(isinstance(v, int) for v in (lo, hi, step)):
+        return int(position)
+    return round(position, 10)
+
+
+def neighbours(value, lo, hi, step, count: int = 2, direction: int = 0) -> list:
+    """
+    Slider positions around value, nearest first, the direction of travel
+    (+1 / -1) before the other side.
+    """
+    order = []
+    for k in range(1, count + 1):
+        sides = (direction or 1, -(direction or 1))
+        for side in sides:
+            position = _snap(value + side * k * step, lo, hi, step)
+            if position is not None and position != value and position not in order:
+                order.append(position)
+    return order
+
+
+def _session_results(state) -> MemoryCache:
+    """The session's results cache, shared by all @speculative functions."""
+    results = state.get(_RESULTS_STATE)
+    if results is None:
+        results = state[_RESULTS_STATE] = MemoryCache(
+            _RESULTS_STATE, max_bytes=CACHE['session_max_bytes'], register=False)
+    return results
+
+
+class _SessionCache:
+    """Per-session, per-function pending work and counters."""
+
+    def __init__(self, results: MemoryCache):
+        self.results = results     # shared by the session's functions
+        self.timer = None          # idle timer that starts speculation
+        self.pending = {}          # key -> Future
+        self.speculated = set()    # keys filled in the background
+        self.last = None           # previous call's slider values
+        self.stats = {'calls': 0, 'hits': 0, 'speculative_hits': 0, 'speculated': 0}
+        self.lock = threading.Lock()
+
+
+def speculative(sliders: dict, neighbours_per_side: int = 2, copy: bool = True):
+    """
+    Memoize a computation per session and precompute neighbouring slider values.
+
+    Parameters:
+    -----------
+    sliders : dict
+        Argument name -> (min, max, step) of the slider feeding it
+    neighbours_per_side : int, optional
+        Positions to precompute on each side of the current one (default: 2)
+    copy : bool, optional
+        Return copies of DataFrame/ndarray results (default: True)
+
+    Example:
+    --------
+    @speculative(sliders={'confidence': (0.90, 0.99, 0.01)})
+    def risk_at(confidence: float, method: str):
+        return risk_summary(returns, confidence=confidence, method=method)
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+        state_key = f"_mp_speculative_{fn.__module__}.{fn.__qualname__}"
+
+        def key_of(arguments: dict) -> str:
+            return make_key(fn.__module__, fn.__qualname__, arguments)
+
+        def compute(session: _SessionCache, key: str, arguments: dict):
+            value = fn(**arguments)
+            session.results.set(key, value)
+            return value
+
+        def speculate(session: _SessionCache, arguments: dict, changed: str, direction: int):
+            lo, hi, step = sliders[changed]
+            for position in neighbours(arguments[changed], lo, hi, step,
+                                       neighbours_per_side, direction):
+                candidate = {**arguments, changed: position}
+                key = key_of(candidate)
+                with session.lock:
+                    if key in session.pending or key in session.results:
+                        continue
+                    future = _executor().submit(compute, session, key, candidate)
+                    session.pending[key] = future
+                    session.speculated.add(key)
+                    session.stats['speculated'] += 1
+                future.add_done_callback(lambda _, key=key: session.pending.pop(key, None))
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            for name, (lo, hi, step) in sliders.items():
+                # Float slider values must match the precomputed positions exactly
+                position = _snap(arguments[name], lo, hi, step)
+                if position is not None:
+                    arguments[name] = position
+            key = key_of(arguments)
+
+            state = _session_state()
+            session = state.get(state_key)
+            if session is None:
+                session = state[state_key] = _SessionCache(_session_results(state))
+            session.stats['calls'] += 1
+
+            # The user moved on: drop speculation that hasn't started
+            with session.lock:
+                if session.timer is not None:
+                    session.timer.cancel()
+                    session.timer = None
+                for pending_key, future in list(session.pending.items()):
+                    if pending_key != key and future.cancel():
+                        session.pending.pop(pending_key, None)
+                        session.speculated.discard(pending_key)
+                running = session.pending.get(key)
+
+            value = session.results.get(key, _MISSING)
+            if value is _MISSING and running is not None and not running.cancelled():
+                value = running.result()
+            if value is _MISSING:
+                value = compute(session, key, arguments)
+            else:
+                session.stats['hits'] += 1
+                if key in session.speculated:
+                    session.stats['speculative_hits'] += 1
+
+            # Explore along the slider that changed since the last call, once idle
+            previous, session.last = session.last, arguments
+            changed = [name for name in sliders
+                       if previous is not None and previous.get(name) != arguments[name]]
+            plan = []
+            for name in changed or ([] if previous is not None else list(sliders)):
+                direction = 0
+                if previous is not None:
+                    direction = 1 if arguments[name] > previous[name] else -1
+                plan.append((name, direction))
+            if plan:
+                def start():
+                    for name, direction in plan:
+                        speculate(session, arguments, name, direction)
+
+                timer = threading.Timer(CACHE['speculative_delay'], start)
+                timer.daemon = True
+                with session.lock:
+                    session.timer = timer
+                timer.start()
+            return _copy(value) if copy else value
+
+        def info() -> dict:
+            """This session's counters, and the size of its shared results cache."""
+            session = _session_state().get(state_key)
+            if session is None:
+                return {}
+            return {**session.stats, **session.results.info(), 'pending': len(session.pending)}
+
+        wrapper.info = info
+        return wrapper
+    return decorator
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    'speculative',
+    'neighbours',
+]
@@ -9,12 +9,14 @@ with Mountain Path branding.
 """
 
 import streamlit as st
-import pandas as pd
-import numpy as np
 
-from config import COLORS, BRANDING, get_page_config
+from config import BRANDING, get_page_config
 from styles import apply_styles
-from components import header_container, sidebar_header, section_title, metric_card, footer
+from components import (
+    header_container, sidebar_header, section_title, metric_card, footer,
+    display_dataframe, lazy_expander, sidebar_parameter_panel
+)
+from data import sample_frame
 
 # ============================================================================
 # PAGE CONFIGURATION
@@ -39,12 +41,15 @@ header_container(
 # ============================================================================
 sidebar_header("CONTROLS", "Configure your analysis")
 
-st.sidebar.markdown(f"<p style='color:{COLORS['accent_gold']}; font-weight:700;'>⚙️ Parameters</p>",
-                    unsafe_allow_html=True)
-
-# Add your sidebar controls here
-param1 = st.sidebar.slider("Parameter 1", 0.0, 10.0, 5.0, 0.1)
-param2 = st.sidebar.selectbox("Parameter 2", ["Option A", "Option B", "Option C"])
+# Declare your sidebar controls here; edits are applied together on "Apply"
+# instead of rerunning the script for every slider movement
+params = sidebar_parameter_panel({
+    'param1': {'type': 'slider', 'label': "Parameter 1",
+               'min': 0.0, 'max': 10.0, 'default': 5.0, 'step': 0.1},
+    'param2': {'type': 'select', 'label': "Parameter 2",
+               'options': ["Option A", "Option B", "Option C"]},
+}, key="controls")
+param1, param2 = params.values['param1'], params.values['param2']
 
 # ============================================================================
 # MAIN CONTENT
@@ -66,13 +71,13 @@ with col3:
 st.write("Your main application content goes here...")
 
 # Example data display
-with st.expander("📈 Show Sample Data"):
-    sample_data = pd.DataFrame({
-        'Column 1': np.random.randn(10),
-        'Column 2': np.random.randn(10),
-        'Column 3': np.random.randn(10),
-    })
-    st.dataframe(sample_data, use_container_width=True)
+# Data comes from cached providers (data.py) - generated once, not per rerun;
+# the section body only runs while it is open
+lazy_expander(
+    "📈 Show Sample Data",
+    lambda: display_dataframe(sample_frame(rows=10, seed=42)),
+    cache=True
+)
 
 # ============================================================================
 # FOOTER
@@ -0,0 +1,78 @@
+"""Tests for budget.py: what components charge, in AppTest runs."""
+
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PREAMBLE = f"""
+import sys
+sys.path.insert(0, {str(ROOT)!r})
+import streamlit as st
+from budget import begin_rerun, current_usage
+begin_rerun()
+"""
+
+
+def _usage(body: str) -> dict:
+    at = AppTest.from_string(PREAMBLE + body + "\nst.session_state['usage'] = current_usage()\n")
+    at.run()
+    assert not at.exception, at.exception
+    return at.session_state['usage']
+
+
+def test_figure_charges_its_png():
+    usage = _usage("""
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from components import display_figure
+fig, ax = plt.subplots()
+ax.plot(range(100))
+display_figure(fig, caption="A line")
+""")
+    figure = usage['components']['display_figure']
+    assert figure['calls'] == 1 and figure['elements'] == 2
+    assert figure['bytes'] > 10_000           # the PNG, not just the caption
+    assert usage['violations'] == []          # within the figure override
+
+
+def _violations(body: str):
+    usage = _usage(body)
+    return [(v['level'], v['scope'], v['metric']) for v in usage['violations']]
+
+
+def test_component_limits():
+    assert _violations("""
+from components import info_box
+info_box("x" * 30_000)
+info_box("x" * 150_000)
+""") == [('soft', 'info_box', 'bytes'), ('hard', 'info_box', 'bytes')]
+
+
+def test_page_element_limit_reported_once():
+    assert _violations("""
+from budget import track
+for _ in range(400):
+    track('probe', elements=1)
+""") == [('soft', 'page', 'elements')]
+
+
+def test_development_shows_a_warning_production_logs():
+    body = """
+from config import PAYLOAD_BUDGET
+from components import info_box
+PAYLOAD_BUDGET['mode'] = {mode!r}
+try:
+    info_box("x" * 30_000)
+finally:
+    PAYLOAD_BUDGET['mode'] = 'development'
+"""
+    shown = []
+    for mode in ('development', 'production'):
+        at = AppTest.from_string(PREAMBLE + body.format(mode=mode))
+        at.run()
+        assert not at.exception, at.exception
+        shown.append(any("Payload budget (soft)" in m.value for m in at.markdown))
+    assert shown == [True, False]
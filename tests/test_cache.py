@@ -0,0 +1,61 @@
+"""Tests for cache.py: content-based keys, LRU limits and memoize."""
+
+import numpy as np
+import pandas as pd
+
+from cache import MemoryCache, make_key, memoize
+
+
+def test_equal_str_frames_share_a_key():
+    left = pd.DataFrame({'ticker': ['AAPL', 'MSFT'], 'weight': [0.6, 0.4]})
+    right = pd.DataFrame({'ticker': ['AAPL', 'MSFT'], 'weight': [0.6, 0.4]})
+    assert make_key(left) == make_key(right)
+    assert make_key(left) != make_key(left.assign(ticker=['AAPL', 'GOOG']))
+
+
+def test_object_arrays_hash_by_value():
+    left = np.array(['a', 'b', None], dtype=object)
+    right = np.array(['a', 'b', None], dtype=object)
+    assert make_key(left) == make_key(right)
+    nested = np.array([[1, 2], [3]], dtype=object)
+    assert make_key(nested) == make_key(np.array([[1, 2], [3]], dtype=object))
+
+
+def test_keys_distinguish_types_and_order():
+    assert make_key(1) != make_key('1')
+    assert make_key((1, 2)) != make_key((2, 1))
+    assert make_key({'a': 1, 'b': 2}) == make_key({'b': 2, 'a': 1})
+    assert make_key(np.arange(3)) != make_key(np.arange(3).astype('float64'))
+
+
+def test_lru_byte_budget():
+    cache = MemoryCache('test-lru', max_bytes=250, register=False)
+    for key in 'abc':
+        cache.set(key, b'x' * 100, nbytes=100)
+    assert 'a' not in cache
+    assert cache.get('b') is not None and cache.get('c') is not None
+    assert cache.info()['evictions'] == 1
+
+
+def test_memoize_returns_copies():
+    calls = []
+
+    @memoize(cache=MemoryCache('test-memoize', register=False))
+    def frame(labels: tuple) -> pd.DataFrame:
+        calls.append(labels)
+        return pd.DataFrame({'label': list(labels)})
+
+    first = frame(('x', 'y'))
+    first.loc[0, 'label'] = 'changed'
+    assert frame(labels=('x', 'y'))['label'].tolist() == ['x', 'y']
+    assert calls == [('x', 'y')]
+
+
+def test_memoize_uses_the_given_empty_cache():
+    store = MemoryCache('test-memoize-empty', register=False)   # len() 0: falsy
+
+    @memoize(cache=store)
+    def square(x: int) -> int:
+        return x * x
+
+    assert square(3) == 9 and square.cache is store and len(store) == 1
@@ -0,0 +1,27 @@
+"""Tests for export.py: atomic writes and static snapshots."""
+
+import os
+import stat
+
+from export import export_page, write_atomic
+
+
+def test_write_atomic_uses_umask_permissions(tmp_path):
+    old = os.umask(0o022)
+    try:
+        write_atomic(tmp_path / 'out' / 'page.html', "<p>hi</p>")
+    finally:
+        os.umask(old)
+    path = tmp_path / 'out' / 'page.html'
+    assert path.read_text(encoding='utf-8') == "<p>hi</p>"
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
+    assert [p.name for p in path.parent.iterdir()] == ['page.html']   # no temp files
+
+
+def test_exports_snapshot_page(tmp_path):
+    from snapshots import daily_report
+
+    path = export_page(daily_report, tmp_path / 'daily.html', title="Daily Risk Report")
+    html = path.read_text(encoding='utf-8')
+    assert '<title>Daily Risk Report' in html
+    assert 'data:image/png;base64,' in html and 'mp-table' in html
@@ -0,0 +1,57 @@
+"""Tests for loader.py: row/column projection agrees across file formats."""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+import pytest
+
+import loader
+from loader import column_array, load_table
+
+ROWS = 1_000
+
+
+@pytest.fixture(scope='module')
+def files(tmp_path_factory):
+    root = tmp_path_factory.mktemp('tables')
+    df = pd.DataFrame({'day': np.arange(ROWS), 'close': np.linspace(100, 200, ROWS),
+                       'ticker': [f"T{i % 7}" for i in range(ROWS)]})
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    paths = {'csv': root / 'prices.csv', 'parquet': root / 'prices.parquet',
+             'arrow': root / 'prices.arrow'}
+    df.to_csv(paths['csv'], index=False)
+    pq.write_table(table, paths['parquet'], row_group_size=128)   # several groups
+    feather.write_feather(table, paths['arrow'])
+    return df, paths
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'parquet', 'arrow'])
+@pytest.mark.parametrize('rows', [None, (0, 10), (130, 300), (-50, None), (-300, -100),
+                                  (900, 2_000), (500, 400), (None, 5)])
+def test_row_slices_match_pandas(files, fmt, rows):
+    df, paths = files
+    expected = df if rows is None else df.iloc[slice(*rows)]
+    result = load_table(paths[fmt], columns=['day', 'close'], rows=rows, as_pandas=True)
+    pd.testing.assert_frame_equal(result.reset_index(drop=True),
+                                  expected[['day', 'close']].reset_index(drop=True),
+                                  check_dtype=False)
+
+
+def test_cached_until_file_changes(files, tmp_path):
+    df, _ = files
+    path = tmp_path / 'small.parquet'
+    pq.write_table(pa.Table.from_pandas(df.head(5), preserve_index=False), path)
+    loader.clear_cache()
+    first = load_table(path)
+    assert load_table(path) is first                 # Arrow tables served from cache
+    pq.write_table(pa.Table.from_pandas(df.head(8), preserve_index=False), path)
+    assert load_table(path).num_rows == 8
+
+
+def test_column_array_zero_copy(files):
+    _, paths = files
+    table = load_table(paths['arrow'], columns=['close'])
+    values = column_array(table, 'close')
+    assert values[0] == 100.0 and len(values) == ROWS
@@ -0,0 +1,50 @@
+"""Tests for montecarlo.py: reproducibility, accuracy and range checks."""
+
+import numpy as np
+import pytest
+
+import montecarlo
+from montecarlo import parametric_check, run_var, simulate_var
+
+WEIGHTS = np.array([0.5, 0.3, 0.2])
+MEAN = np.array([0.0005, 0.0003, 0.0001])
+COV = np.array([[1.0e-4, 2.0e-5, 1.0e-5],
+                [2.0e-5, 4.0e-5, 5.0e-6],
+                [1.0e-5, 5.0e-6, 2.5e-5]])
+SMALL = dict(paths=40_000, chunk_size=5_000, seed=7)
+
+
+def test_same_result_for_any_worker_count():
+    results = {workers: run_var(WEIGHTS, MEAN, COV, workers=workers, **SMALL)
+               for workers in (0, 1, 3)}
+    assert len({(r.var, r.es) for r in results.values()}) == 1
+    assert results[0].paths_done == SMALL['paths']
+
+
+def test_close_to_closed_form():
+    est = run_var(WEIGHTS, MEAN, COV, value=1e6, paths=200_000, chunk_size=50_000,
+                  workers=0)
+    var, es = parametric_check(WEIGHTS, MEAN, COV, value=1e6)
+    assert est.var == pytest.approx(var, rel=0.03)
+    assert est.es == pytest.approx(es, rel=0.03)
+
+
+def test_streams_provisional_estimates():
+    estimates = list(simulate_var(WEIGHTS, MEAN, COV, workers=0, **SMALL))
+    assert [e.paths_done for e in estimates] == list(range(5_000, 40_001, 5_000))
+    assert estimates[-1].fraction == 1
+
+
+def test_quantile_outside_range_raises():
+    # A range that stops well short of the 99% loss
+    with pytest.raises(ValueError, match="loss_range"):
+        run_var(WEIGHTS, MEAN, COV, workers=0, loss_range=(-0.05, 0.001), **SMALL)
+    with pytest.raises(ValueError, match="below"):
+        run_var(WEIGHTS, MEAN, COV, workers=0, loss_range=(0.05, 0.1), **SMALL)
+
+
+def test_pool_is_reused():
+    run_var(WEIGHTS, MEAN, COV, workers=2, **SMALL)
+    pool = montecarlo._pools[2]
+    run_var(WEIGHTS, MEAN, COV, workers=2, **SMALL)
+    assert montecarlo._pools[2] is pool
@@ -0,0 +1,77 @@
+"""Tests for persistent_cache.py: disk round trips, limits and @persistent."""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from cache import MemoryCache
+from persistent_cache import DiskCache, persistent
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _disk(tmp_path, **kwargs) -> DiskCache:
+    return DiskCache(tmp_path / 'cache.sqlite', name=f"test:{tmp_path.name}", **kwargs)
+
+
+def test_round_trip_survives_restart(tmp_path):
+    frame = pd.DataFrame({'ticker': ['AAPL', 'MSFT'], 'weight': [0.6, 0.4]})
+    _disk(tmp_path).set('frame', frame)
+    _disk(tmp_path).set('array', np.arange(5))
+
+    reopened = _disk(tmp_path)                        # e.g. after a deploy
+    pd.testing.assert_frame_equal(reopened.get('frame'), frame)
+    np.testing.assert_array_equal(reopened.get('array'), np.arange(5))
+    assert reopened.get('missing', 'default') == 'default'
+
+
+def test_shared_with_another_process(tmp_path):
+    _disk(tmp_path).set('answer', {'var': 0.0234})
+    code = (f"import sys; sys.path.insert(0, {str(ROOT)!r})\n"
+            "from persistent_cache import DiskCache\n"
+            f"print(DiskCache({str(tmp_path / 'cache.sqlite')!r}).get('answer')['var'])")
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                         check=True).stdout
+    assert out.strip() == '0.0234'
+
+
+def test_evicts_least_recently_used(tmp_path):
+    disk = _disk(tmp_path, max_bytes=2_500)
+    disk.set('a', b'x' * 1_000)
+    time.sleep(0.01)
+    disk.set('b', b'x' * 1_000)
+    time.sleep(0.01)
+    disk.set('c', b'x' * 1_000)
+    assert disk.get('a') is None and disk.get('c') is not None
+    assert disk.info()['bytes'] <= 2_500
+
+
+def test_ttl_expires(tmp_path):
+    disk = _disk(tmp_path)
+    disk.set('short', 1, ttl=-1)
+    assert disk.get('short') is None
+    assert disk.stats['expirations'] == 1
+
+
+def test_decorator_tiers_and_versions(tmp_path):
+    calls = []
+
+    def make(version):
+        @persistent(disk=_disk(tmp_path), memory=MemoryCache('test-tiers', register=False),
+                    version=version)
+        def summary(confidence: float) -> pd.DataFrame:
+            calls.append(confidence)
+            return pd.DataFrame({'var': [confidence / 10]})
+        return summary
+
+    first = make("v1")
+    assert first(0.95)['var'].iloc[0] == 0.095
+    assert first(confidence=0.95)['var'].iloc[0] == 0.095       # memory hit
+    assert make("v1")(0.95)['var'].iloc[0] == 0.095             # fresh memory: disk hit
+    assert calls == [0.95]
+    make("v2")(0.95)                                           # new version recomputes
+    assert calls == [0.95, 0.95]
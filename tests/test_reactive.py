@@ -0,0 +1,61 @@
+"""Tests for reactive.py: dirty tracking and view replay, in AppTest runs."""
+
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+APP = f"""
+import sys
+sys.path.insert(0, {str(ROOT)!r})
+import streamlit as st
+from components import info_box
+from reactive import ReactiveGraph
+
+graph = ReactiveGraph("test")
+graph.input('a', st.session_state.get('a', 1))
+graph.input('b', st.session_state.get('b', 1))
+
+@graph.node(inputs=['a'])
+def double(a):
+    return 2 * a
+
+@graph.view(inputs=['double'])
+def card(double):
+    info_box(f"double={{double}}")
+
+@graph.view(inputs=['b'])
+def raw(b):
+    st.write(f"b={{b}}")
+
+st.session_state['runs'] = {{r['node']: r['reason'] for r in graph.report()}}
+"""
+
+
+def _texts(at) -> str:
+    return ' '.join(m.value for m in at.markdown)
+
+
+def test_only_dependents_of_changed_inputs_run():
+    at = AppTest.from_string(APP).run()
+    assert at.session_state['runs'] == {'double': 'first run', 'card': 'first run',
+                                        'raw': 'first run'}
+    at.session_state['b'] = 2
+    at.run()
+    runs = at.session_state['runs']
+    assert runs['double'] == 'clean' and runs['card'] == 'clean'
+    assert 'double=2' in _texts(at)          # replayed, not lost
+
+    at.session_state['a'] = 5
+    at.run()
+    assert at.session_state['runs']['double'] == 'changed: a'
+    assert at.session_state['runs']['card'] == 'changed: double'
+    assert 'double=10' in _texts(at)
+
+
+def test_view_with_raw_st_output_always_runs():
+    at = AppTest.from_string(APP).run()
+    at.run()
+    assert at.session_state['runs']['raw'] == 'draws with st.*'
+    assert 'b=1' in _texts(at)
@@ -0,0 +1,34 @@
+"""Tests for render.py: Streamlit-free HTML that components send unchanged."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from render import render_metric_card, render_metric_row, render_stylesheet
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_imports_without_streamlit():
+    code = (f"import sys; sys.path.insert(0, {str(ROOT)!r})\n"
+            "import render\n"
+            "print('streamlit' in sys.modules)")
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                         check=True).stdout
+    assert out.strip() == 'False'
+
+
+def test_metric_row_renders_up_to_three_cards():
+    cards = render_metric_row([("VaR", "2.3%", "1-day"), ("ES", "3.1%"), ("Vol", "18%"),
+                               ("Extra", "ignored")])
+    assert cards[0] == render_metric_card("VaR", "2.3%", "1-day")
+    assert len(cards) == 3 and 'title="1-day"' in cards[0]
+
+
+def test_components_send_render_output():
+    from components import capture, metric_card
+
+    with capture() as items:
+        metric_card("VaR", "2.3%", "1-day")
+    assert items == [('html', render_metric_card("VaR", "2.3%", "1-day"), False)]
+    assert '.metric-card' in render_stylesheet()
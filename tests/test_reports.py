@@ -0,0 +1,28 @@
+"""Tests for reports.py: output file names and in-process generation."""
+
+import pytest
+
+from reports import generate_reports, report_filename
+
+
+@pytest.mark.parametrize('name', ['../escaped.html', 'sub/report.html', '/tmp/abs.html',
+                                  '..', 'dir\\report.html'])
+def test_rejects_filenames_outside_out_dir(tmp_path, name):
+    with pytest.raises(ValueError):
+        report_filename({'title': "Acme", 'filename': name})
+    out_dir = tmp_path / 'out'
+    with pytest.raises(ValueError):
+        generate_reports([{'title': "Acme", 'filename': name}], out_dir, workers=0)
+    assert list(tmp_path.rglob('*.html')) == []
+
+
+def test_filename_from_title():
+    assert report_filename({'title': "Acme Capital - Daily Risk"}) == 'acme-capital-daily-risk.html'
+    assert report_filename({'title': "Acme", 'filename': 'acme.html'}) == 'acme.html'
+
+
+def test_generates_in_process(tmp_path):
+    spec = {'title': "Acme", 'metrics': [[["VaR (95%)", "2.34%"]]]}
+    result = generate_reports([spec], tmp_path, workers=0)
+    assert not result.failures
+    assert 'VaR (95%)' in (tmp_path / 'acme.html').read_text(encoding='utf-8')
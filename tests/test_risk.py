@@ -0,0 +1,23 @@
+"""Tests for risk.py: metric card layout."""
+
+from data import sample_returns
+from risk import metric_rows, risk_summary
+
+
+def _summary(benchmark: bool) -> dict:
+    returns = sample_returns(rows=500, seed=3)
+    market = returns.mean(axis=1).to_numpy() if benchmark else None
+    return risk_summary(returns, benchmark=market)
+
+
+def test_rows_with_benchmark_are_full():
+    rows = metric_rows(_summary(benchmark=True))
+    assert [len(row) for row in rows] == [3, 3]
+    labels = [card[0] for row in rows for card in row]
+    assert labels[3:] == ["Sharpe Ratio", "Alpha", "Beta"]
+    assert "R²" in rows[1][2][2]
+
+
+def test_rows_without_benchmark_are_balanced():
+    rows = metric_rows(_summary(benchmark=False))
+    assert [len(row) for row in rows] == [2, 2]
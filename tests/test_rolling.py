@@ -0,0 +1,46 @@
+"""Tests for rolling.py: incremental statistics against brute force."""
+
+import math
+import random
+
+import pandas as pd
+import pytest
+
+from rolling import RollingStats
+
+
+def brute_drawdown(returns: list, window: int) -> float:
+    """Current drawdown over the window, counting the wealth at entry."""
+    recent = returns[-window:]
+    wealth = (1 + pd.Series([0.0] + recent)).cumprod()
+    return (wealth / wealth.cummax() - 1).iloc[-1]
+
+
+def test_drawdown_counts_entry_wealth():
+    stats = RollingStats(window=5).update_many([-0.10, -0.10])
+    assert stats.drawdown == pytest.approx(-0.19)
+
+
+@pytest.mark.parametrize('window', [2, 5, 30])
+def test_drawdown_matches_brute_force(window):
+    rng = random.Random(window)
+    stats = RollingStats(window=window)
+    returns = []
+    for _ in range(400):
+        r = rng.gauss(0.0, 0.03)
+        returns.append(r)
+        stats.update(r)
+        assert stats.drawdown == pytest.approx(brute_drawdown(returns, window), abs=1e-12)
+
+
+def test_window_stats_match_brute_force():
+    rng = random.Random(7)
+    stats = RollingStats(window=20)
+    returns = [rng.gauss(0.001, 0.02) for _ in range(200)]
+    stats.update_many(returns)
+    recent = pd.Series(returns[-20:])
+    assert stats.values() == returns[-20:]
+    assert stats.mean == pytest.approx(recent.mean())
+    assert stats.std == pytest.approx(recent.std())
+    assert stats.max == max(recent) and stats.min == min(recent)
+    assert stats.volatility == pytest.approx(recent.std() * math.sqrt(252))
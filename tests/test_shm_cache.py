@@ -0,0 +1,77 @@
+"""Tests for shm_cache.py: round trips, eviction and directory checks."""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from shm_cache import SharedStore, shared
+
+
+def test_round_trip(tmp_path):
+    store = SharedStore(tmp_path / 'shm')
+    array = np.arange(12, dtype='float64').reshape(3, 4)
+    frame = pd.DataFrame({'a': [1.0, 2.0, 3.0], 'b': ['x', 'y', 'z']},
+                         index=pd.Index([10, 20, 30], name='id'))
+    store.put('array', array)
+    store.put('frame', frame)
+    store.put('bytes', b'\x89PNG...')
+
+    # A second store (e.g. another process) maps the same files
+    other = SharedStore(tmp_path / 'shm')
+    np.testing.assert_array_equal(other.get('array'), array)
+    assert not other.get('array').flags.writeable
+    pd.testing.assert_frame_equal(other.get('frame'), frame)
+    assert bytes(other.get('bytes')) == b'\x89PNG...'
+    assert other.get('missing', 'default') == 'default'
+
+
+def test_rejects_unmappable_values(tmp_path):
+    store = SharedStore(tmp_path / 'shm')
+    with pytest.raises(TypeError):
+        store.put('dict', {'a': 1})
+    assert 'dict' not in store
+
+
+def test_evicts_least_recently_used(tmp_path):
+    block = np.zeros(1000)                      # 8,000 bytes + header
+    store = SharedStore(tmp_path / 'shm', max_bytes=25_000)
+    for i, key in enumerate(['old', 'mid', 'new']):
+        store.put(key, block)
+        os.utime(store._path(key), (time.time() - 100 + i, time.time() - 100 + i))
+    store.put('newest', block)
+
+    assert 'old' not in SharedStore(tmp_path / 'shm')
+    assert {'mid', 'new', 'newest'} <= {p.stem for p in (tmp_path / 'shm').iterdir()}
+    assert store.info()['bytes'] <= 25_000
+    assert store.stats['evictions'] == 1
+
+
+def test_refuses_shared_directory(tmp_path):
+    root = tmp_path / 'shm'
+    root.mkdir()
+    root.chmod(0o777)
+    with pytest.raises(PermissionError):
+        SharedStore(root)
+
+
+def test_refuses_symlink(tmp_path):
+    (tmp_path / 'real').mkdir(mode=0o700)
+    (tmp_path / 'link').symlink_to(tmp_path / 'real')
+    with pytest.raises(PermissionError):
+        SharedStore(tmp_path / 'link')
+
+
+def test_shared_decorator(tmp_path):
+    calls = []
+
+    @shared(SharedStore(tmp_path / 'shm'))
+    def squares(n: int) -> np.ndarray:
+        calls.append(n)
+        return np.arange(n) ** 2
+
+    np.testing.assert_array_equal(squares(5), [0, 1, 4, 9, 16])
+    np.testing.assert_array_equal(squares(n=5), [0, 1, 4, 9, 16])
+    assert calls == [5]
@@ -0,0 +1,390 @@
+"""
+The Mountain Path - Streamlit Design Template
+Tracing Module: Span Traces of Reruns in Chrome Trace Format
+
+Prof. V. Ravichandran
+28+ Years Corporate Finance & Banking | 10+ Years Academic Excellence
+
+Shows where a slow rerun spent its time. Each sampled rerun gets a root
+span, from apply_styles() to the end of the script run, with child spans for:
+- apply_styles (category 'styles')
+- every component call ('component'), tagged with the HTML bytes or
+  DataFrame rows it sent
+- every @memoize / @dataset / @persistent call ('cache'), tagged with
+  hit or miss (and the tier for @persistent) and the result size
+- every loader.load_table call ('load'), tagged with path, rows and size
+All spans carry the session ID and page.
+
+Finished reruns are appended to a local Chrome trace JSON file, one per
+process (config.TRACING['path'] with the pid added), rotated at
+'max_bytes' with 'backups' old files kept. Open a file in
+https://ui.perfetto.dev or chrome://tracing; each session is its own
+track. The root span is closed by a hook on Streamlit's script runner
+(runtime.on_script_finished), so reruns that end in st.stop, an exception
+or a newer rerun are written as soon as they end. Where no runner can be
+hooked, a rerun is written, marked incomplete, when its session reruns.
+
+Set MOUNTAIN_PATH_TRACE=1 to enable and MOUNTAIN_PATH_TRACE_SAMPLE to
+trace a fraction of reruns; adding ?trace=1 to a page's URL traces all of
+its reruns regardless. When disabled, @traced returns the function itself.
+
+Usage:
+------
+MOUNTAIN_PATH_TRACE=1 MOUNTAIN_PATH_TRACE_SAMPLE=0.05 streamlit run app.py
+python tracing.py .traces/reruns-12345.json     # slowest reruns
+"""
+
+import argparse
+import functools
+import json
+import os
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+from config import TRACING
+from runtime import on_script_finished, page_name, session_id
+
+ENABLED = TRACING['enabled']
+
+_local = threading.local()
+_open = {}                  # session id -> its rerun trace still in progress
+_open_lock = threading.Lock()
+
+# Microseconds since the epoch from the monotonic clock
+_EPOCH = time.time() - time.perf_counter()
+
+
+def _now_us() -> float:
+    return (_EPOCH + time.perf_counter()) * 1e6
+
+
+# ============================================================================
+# SPANS
+# ============================================================================
+
+class _Trace:
+    """Spans of one rerun: finished events and the stack of open spans."""
+
+    def __init__(self, session: str, page: str):
+        self.session = session
+        self.page = page
+        self.events = []
+        self.stack = []
+        self.root = None
+
+
+class Span:
+    """
+    A timed operation inside a traced rerun; use via span().
+
+    Tags added with tag() (or annotate() from code further down the call
+    stack) become the event's args in the trace viewer.
+    """
+
+    __slots__ = ('trace', 'name', 'category', 'args', 'start')
+
+    def __init__(self, trace: _Trace, name: str, category: str, args: dict):
+        self.trace = trace
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = None
+
+    def tag(self, **tags):
+        self.args.update(tags)
+
+    def __enter__(self):
+        self.start = _now_us()
+        self.trace.stack.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.close(_now_us())
+        return False
+
+    def close(self, end: float):
+        stack = self.trace.stack
+        if self in stack:
+            stack.remove(self)
+        self.trace.events.append({
+            'name': self.name, 'cat': self.category, 'ph': 'X',
+            'ts': round(self.start, 1), 'dur': round(end - self.start, 1),
+            'args': {'session': self.trace.session, 'page': self.trace.page, **self.args},
+        })
+
+
+class _NullSpan:
+    """Returned by span() when the current rerun is not traced."""
+
+    __slots__ = ()
+
+    def tag(self, **tags):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL = _NullSpan()
+
+
+def active() -> bool:
+    """True if this thread is running a traced rerun."""
+    return getattr(_local, 'trace', None) is not None
+
+
+def span(name: str, category: str = 'app', **tags):
+    """
+    Context manager timing a block as a child of the current span.
+
+    A no-op when the current rerun is not traced.
+
+    Example:
+    --------
+    with span('optimize', 'model', assets=len(tickers)) as s:
+        weights = optimize(mu, cov)
+        s.tag(iterations=result.nit)
+    """
+    trace = getattr(_local, 'trace', None)
+    if trace is None:
+        return _NULL
+    return Span(trace, name, category, tags)
+
+
+def annotate(**tags):
+    """Add tags to the innermost open span (e.g. sizes, cache hit)."""
+    trace = getattr(_local, 'trace', None)
+    if trace is not None and trace.stack:
+        trace.stack[-1].args.update(tags)
+
+
+def traced(fn=None, *, category: str = 'app', name: str = None):
+    """
+    Record every call of a function as a span.
+
+    Returns the function unchanged when tracing is disabled.
+
+    Parameters:
+    -----------
+    category : str, optional
+        Span category, e.g. 'component' or 'cache' (default: 'app')
+    name : str, optional
+        Span name (default: the function's qualified name)
+
+    Example:
+    --------
+    @traced(category='model')
+    def fit_garch(returns, p=1, q=1):
+        ...
+    """
+    if fn is None:
+        return functools.partial(traced, category=category, name=name)
+    if not ENABLED:
+        return fn
+    label = name or fn.__qualname__
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        trace = getattr(_local, 'trace', None)
+        if trace is None:
+            return fn(*args, **kwargs)
+        with Span(trace, label, category, {}):
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+# ============================================================================
+# RERUNS
+# ============================================================================
+
+def _sampled() -> bool:
+    import streamlit as st
+
+    try:
+        if st.query_params.get('trace') == '1':
+            return True
+    except AttributeError:  # Streamlit without st.query_params
+        pass
+    rate = TRACING['sample_rate']
+    return rate >= 1.0 or random.random() < rate
+
+
+def rerun_started():
+    """
+    Open the rerun's root span if it is sampled (called by apply_styles;
+    further calls in the same run are ignored).
+    """
+    if getattr(_local, 'hooked', False):
+        return
+    sid = session_id()
+    with _open_lock:
+        previous = _open.pop(sid, None)
+    if previous is not None:
+        _finish(previous, complete=False)
+    _local.trace = None
+    trace = None
+    if _sampled():
+        trace = _Trace(sid, page_name())
+        trace.root = Span(trace, 'rerun', 'rerun', {}).__enter__()
+        _local.trace = trace
+        with _open_lock:
+            _open[sid] = trace
+    _local.hooked = on_script_finished(functools.partial(_rerun_finished, trace))
+
+
+def _rerun_finished(trace):
+    """Close the rerun's spans and write them out (at the end of the run)."""
+    _local.hooked = False
+    _local.trace = None
+    if trace is None:
+        return
+    with _open_lock:
+        if _open.get(trace.session) is trace:
+            del _open[trace.session]
+    _finish(trace, complete=True)
+
+
+def _finish(trace: _Trace, complete: bool):
+    """Close any spans still open and hand the events to the writer."""
+    if complete:
+        end = _now_us()
+    else:
+        # Stop the clock at the last recorded activity, not at the next rerun
+        end = max((e['ts'] + e['dur'] for e in trace.events), default=trace.root.start)
+        trace.root.args['incomplete'] = True
+    for open_span in reversed(list(trace.stack)):
+        open_span.close(end)
+    writer().write(trace.events, trace.session)
+
+
+# ============================================================================
+# FILE OUTPUT
+# ============================================================================
+
+class TraceWriter:
+    """
+    Appends events to a Chrome trace JSON file, rotating it by size.
+
+    Uses the JSON array format without the closing bracket, which trace
+    viewers accept, so every rerun is a cheap append.
+
+    Parameters:
+    -----------
+    path : str or Path
+        Trace file
+    max_bytes : int, optional
+        Rotate when the file grows beyond this (default: config.TRACING)
+    backups : int, optional
+        Rotated files to keep as <stem>.1.json ... (default: config.TRACING)
+    """
+
+    def __init__(self, path, max_bytes: int = None, backups: int = None):
+        self.path = Path(path)
+        self.max_bytes = TRACING['max_bytes'] if max_bytes is None else max_bytes
+        self.backups = TRACING['backups'] if backups is None else backups
+        self._tracks = {}           # session id -> tid in the viewer
+        self._lock = threading.Lock()
+
+    def _rotated(self, n: int) -> Path:
+        return self.path.with_name(f"{self.path.stem}.{n}{self.path.suffix}")
+
+    def write(self, events: list, session: str = '-'):
+        """Append one rerun's events on the session's track."""
+        pid = os.getpid()
+        with self._lock:
+            tid = self._tracks.setdefault(session, len(self._tracks) + 1)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                if f.tell() == 0:
+                    f.write('[\n')
+                # Name the track in every file, as rotation drops earlier names
+                meta = {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                        'args': {'name': f"session {session[:8]}"}}
+                f.write(json.dumps(meta) + ',\n')
+                for event in events:
+                    f.write(json.dumps({**event, 'pid': pid, 'tid': tid}, default=str) + ',\n')
+                size = f.tell()
+            if size > self.max_bytes:
+                self._rotate()
+
+    def _rotate(self):
+        if self.backups <= 0:
+            self.path.unlink(missing_ok=True)
+            return
+        for n in range(self.backups - 1, 0, -1):
+            if self._rotated(n).exists():
+                os.replace(self._rotated(n), self._rotated(n + 1))
+        os.replace(self.path, self._rotated(1))
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def writer() -> TraceWriter:
+    """This process's TraceWriter on config.TRACING['path'] (pid added)."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            base = Path(TRACING['path'])
+            _writer = TraceWriter(base.with_name(f"{base.stem}-{os.getpid()}{base.suffix}"))
+        return _writer
+
+
+def read_trace(path) -> list:
+    """Events of a trace file, with or without the closing bracket."""
+    text = Path(path).read_text(encoding='utf-8').rstrip().rstrip(',')
+    if not text.endswith(']'):
+        text += ']'
+    return json.loads(text)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="List the slowest reruns in a trace file")
+    parser.add_argument('path', help="Trace file written by tracing.py")
+    parser.add_argument('-n', type=int, default=10, help="Reruns to show (default: 10)")
+    args = parser.parse_args(argv)
+
+    events = [e for e in read_trace(args.path) if e.get('ph') == 'X']
+    reruns = sorted((e for e in events if e['cat'] == 'rerun'),
+                    key=lambda e: e['dur'], reverse=True)[:args.n]
+    for rerun in reruns:
+        end = rerun['ts'] + rerun['dur']
+        children = [e for e in events if e['cat'] != 'rerun' and e['tid'] == rerun['tid']
+                    and e['pid'] == rerun['pid'] and rerun['ts'] <= e['ts'] <= end]
+        flag = ' (incomplete)' if rerun['args'].get('incomplete') else ''
+        print(f"{rerun['dur'] / 1e3:9.1f} ms  {rerun['args']['page']}  "
+              f"session {rerun['args']['session'][:8]}{flag}")
+        for child in sorted(children, key=lambda e: e['dur'], reverse=True)[:5]:
+            print(f"{child['dur'] / 1e3:18.1f} ms  {child['cat']}:{child['name']}")
+    return 0
+
+
+# ============================================================================
+# EXPORT ALL
+# ============================================================================
+__all__ = [
+    'ENABLED',
+    'Span',
+    'TraceWriter',
+    'active',
+    'span',
+    'annotate',
+    'traced',
+    'rerun_started',
+    'writer',
+    'read_trace',
+]
+
+
+if __name__ == '__main__':
+    sys.exit(main())